@@ -0,0 +1,160 @@
+"""Columnar universe of listed comparable companies"""
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+import csv
+import hashlib
+import json
+import numpy as np
+
+
+NUMERIC_FIELDS = ("market_cap", "enterprise_value", "revenue", "ebitda", "net_income", "revenue_growth")
+MULTIPLE_FIELDS = ("ev_revenue", "ev_ebitda", "pe_ratio")
+# Optional columns; NaN where the source data does not provide them
+OPTIONAL_FIELDS = ("shares_outstanding",)
+STAT_PERCENTILES = (0, 25, 50, 75, 100)
+
+
+class CompsUniverse:
+    """Comparable companies held as one NumPy array per field
+
+    Multiples given in the source data are kept; missing ones are derived
+    (0 where the denominator is not positive, matching
+    FinancialCalculator.calculate_multiples).
+    """
+
+    def __init__(self, tickers: Sequence[str], names: Sequence[str], columns: Dict[str, np.ndarray]):
+        self.tickers = np.asarray(tickers, dtype=object)
+        self.names = np.asarray(names, dtype=object)
+        self.columns = {f: np.asarray(columns[f], dtype=float) for f in NUMERIC_FIELDS}
+        for field in OPTIONAL_FIELDS:
+            self.columns[field] = np.asarray(
+                columns.get(field, np.full(len(self.tickers), np.nan)), dtype=float)
+
+        derived = {
+            "ev_revenue": (self.columns["enterprise_value"], self.columns["revenue"]),
+            "ev_ebitda": (self.columns["enterprise_value"], self.columns["ebitda"]),
+            "pe_ratio": (self.columns["market_cap"], self.columns["net_income"])
+        }
+        for field, (numerator, denominator) in derived.items():
+            given = np.asarray(columns.get(field, np.full(len(self.tickers), np.nan)), dtype=float)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                computed = np.where(denominator > 0, numerator / denominator, 0.0)
+            self.columns[field] = np.where(np.isnan(given), computed, given)
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update("\x1f".join(map(str, self.tickers)).encode())
+        digest.update("\x1f".join(map(str, self.names)).encode())
+        for field in NUMERIC_FIELDS + MULTIPLE_FIELDS + OPTIONAL_FIELDS:
+            digest.update(self.columns[field].tobytes())
+        self.content_hash = digest.hexdigest()
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+    @classmethod
+    def from_records(cls, records: List[Dict]) -> "CompsUniverse":
+        """Build from dicts shaped like COMPARABLE_COMPANIES"""
+        columns = {
+            field: np.array([r.get(field, np.nan) for r in records], dtype=float)
+            for field in NUMERIC_FIELDS + MULTIPLE_FIELDS + OPTIONAL_FIELDS
+        }
+        return cls([r["ticker"] for r in records], [r.get("company_name", "") for r in records], columns)
+
+    @classmethod
+    def from_file(cls, path: str) -> "CompsUniverse":
+        """Load a .json (list of records) or .csv (one row per company) universe"""
+        path = Path(path)
+        if path.suffix == ".json":
+            with open(path) as f:
+                return cls.from_records(json.load(f))
+        if path.suffix == ".csv":
+            with open(path, newline="") as f:
+                rows = list(csv.DictReader(f))
+            columns = {
+                field: np.array([row.get(field) or np.nan for row in rows], dtype=float)
+                for field in NUMERIC_FIELDS + MULTIPLE_FIELDS + OPTIONAL_FIELDS
+            }
+            return cls([r["ticker"] for r in rows], [r.get("company_name", "") for r in rows], columns)
+        raise ValueError(f"Unsupported comps universe format: {path.suffix}")
+
+    @property
+    def ebitda_margin(self) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(self.columns["revenue"] > 0,
+                            self.columns["ebitda"] / self.columns["revenue"], np.nan)
+
+    def mask(
+        self,
+        min_market_cap: Optional[float] = None,
+        max_market_cap: Optional[float] = None,
+        min_revenue: Optional[float] = None,
+        max_revenue: Optional[float] = None,
+        min_revenue_growth: Optional[float] = None,
+        max_revenue_growth: Optional[float] = None,
+        min_ebitda_margin: Optional[float] = None,
+        max_ebitda_margin: Optional[float] = None,
+        exclude_tickers: Optional[Sequence[str]] = None
+    ) -> np.ndarray:
+        """Boolean selection of companies matching every given bound"""
+        selected = np.ones(len(self), dtype=bool)
+        bounds = (
+            (self.columns["market_cap"], min_market_cap, max_market_cap),
+            (self.columns["revenue"], min_revenue, max_revenue),
+            (self.columns["revenue_growth"], min_revenue_growth, max_revenue_growth),
+            (self.ebitda_margin, min_ebitda_margin, max_ebitda_margin)
+        )
+        for values, low, high in bounds:
+            if low is not None:
+                selected &= values >= low
+            if high is not None:
+                selected &= values <= high
+        if exclude_tickers:
+            selected &= ~np.isin(self.tickers, list(exclude_tickers))
+        return selected
+
+    def multiple_stats(self, selected: np.ndarray) -> Dict[str, Dict]:
+        """Summary statistics of every multiple over the selection, in one pass
+
+        Non-positive multiples are ignored for their own statistics.
+        """
+        multiples = np.stack([self.columns[f][selected] for f in MULTIPLE_FIELDS])
+        multiples = np.where(multiples > 0, multiples, np.nan)
+        counts = np.count_nonzero(~np.isnan(multiples), axis=1)
+
+        stats = {}
+        filled = counts > 0
+        quantiles = np.full((len(STAT_PERCENTILES), len(MULTIPLE_FIELDS)), np.nan)
+        means = np.full(len(MULTIPLE_FIELDS), np.nan)
+        if filled.any():
+            quantiles[:, filled] = np.nanpercentile(multiples[filled], STAT_PERCENTILES, axis=1)
+            means[filled] = np.nanmean(multiples[filled], axis=1)
+        for i, field in enumerate(MULTIPLE_FIELDS):
+            if not filled[i]:
+                stats[field] = {"count": 0}
+                continue
+            low, p25, median, p75, high = quantiles[:, i]
+            stats[field] = {
+                "min": float(low),
+                "25th_percentile": float(p25),
+                "median": float(median),
+                "75th_percentile": float(p75),
+                "max": float(high),
+                "mean": float(means[i]),
+                "count": int(counts[i])
+            }
+        return stats
+
+    def records(self, selected: np.ndarray, limit: Optional[int] = None) -> List[Dict]:
+        """Selected companies as dicts, in universe order"""
+        rows = np.flatnonzero(selected)
+        if limit is not None:
+            rows = rows[:limit]
+        return [
+            {
+                "ticker": self.tickers[i],
+                "company_name": self.names[i],
+                **{f: float(self.columns[f][i]) for f in NUMERIC_FIELDS[:5] + MULTIPLE_FIELDS},
+                "revenue_growth": float(self.columns["revenue_growth"][i])
+            }
+            for i in rows
+        ]
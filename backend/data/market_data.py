@@ -145,7 +145,8 @@ PRECEDENT_TRANSACTIONS = [
         "target_ebitda": 456,
         "ev_revenue": 7.66,
         "ev_ebitda": 61.4,
-        "premium": 0.315
+        "premium": 0.315,
+        "sector": "Enterprise Software"
     },
     {
         "date": "2023-10",
@@ -156,7 +157,8 @@ PRECEDENT_TRANSACTIONS = [
         "target_ebitda": 4234,
         "ev_revenue": 5.19,
         "ev_ebitda": 16.3,
-        "premium": 0.188
+        "premium": 0.188,
+        "sector": "Enterprise Software"
     },
     {
         "date": "2022-12",
@@ -167,7 +169,8 @@ PRECEDENT_TRANSACTIONS = [
         "target_ebitda": 67,
         "ev_revenue": 9.78,
         "ev_ebitda": 125.4,
-        "premium": 0.287
+        "premium": 0.287,
+        "sector": "Enterprise Software"
     },
     {
         "date": "2022-09",
@@ -178,7 +181,8 @@ PRECEDENT_TRANSACTIONS = [
         "target_ebitda": 82,
         "ev_revenue": 36.56,
         "ev_ebitda": 243.9,
-        "premium": 0.502
+        "premium": 0.502,
+        "sector": "Enterprise Software"
     },
     {
         "date": "2022-06",
@@ -189,7 +193,8 @@ PRECEDENT_TRANSACTIONS = [
         "target_ebitda": -45,
         "ev_revenue": 15.55,
         "ev_ebitda": 0,
-        "premium": 0.293
+        "premium": 0.293,
+        "sector": "Enterprise Software"
     },
     {
         "date": "2021-10",
@@ -200,7 +205,8 @@ PRECEDENT_TRANSACTIONS = [
         "target_ebitda": -234,
         "ev_revenue": 24.19,
         "ev_ebitda": 0,
-        "premium": 0.548
+        "premium": 0.548,
+        "sector": "Enterprise Software"
     },
     {
         "date": "2021-03",
@@ -211,7 +217,8 @@ PRECEDENT_TRANSACTIONS = [
         "target_ebitda": 312,
         "ev_revenue": 15.00,
         "ev_ebitda": 38.5,
-        "premium": 0.0
+        "premium": 0.0,
+        "sector": "Enterprise Software"
     },
     {
         "date": "2020-12",
@@ -222,7 +229,8 @@ PRECEDENT_TRANSACTIONS = [
         "target_ebitda": 23,
         "ev_revenue": 3.86,
         "ev_ebitda": 57.8,
-        "premium": 0.0
+        "premium": 0.0,
+        "sector": "Enterprise Software"
     }
 ]
 
@@ -237,3 +245,22 @@ MARKET_ASSUMPTIONS = {
     "saas_median_ev_ebitda": 35.0,
     "saas_median_premium": 0.28
 }
+
+# Deal and DCF Assumptions used by the M&A analysis
+DEAL_ASSUMPTIONS = {
+    "growth_rates": [0.18, 0.16, 0.14, 0.12, 0.10],  # 5-year revenue projection
+    "ebitda_margin": 0.215,  # Target margin improvement
+    "da_percent": 0.06,  # D&A as % of revenue
+    "capex_percent": 0.045,  # CapEx as % of revenue
+    "nwc_percent": 0.12,  # Net working capital as % of revenue
+    "cost_of_debt": 0.05,
+    "cross_sell_rate": 0.15,  # 15% revenue uplift from cross-selling
+    "cost_synergy_percent": 0.18,  # 18% cost savings
+    "one_time_costs": 2500,  # $2.5B integration costs
+    "deal_value": 165000,  # $165B target price
+    "stock_consideration_percent": 0.10,  # 10% stock / 90% cash
+    "acquisition_premium": 0.30,  # 30% acquisition premium
+    "dcf_weight": 0.40,
+    "comps_weight": 0.35,
+    "precedents_weight": 0.25
+}
@@ -0,0 +1,131 @@
+"""Indexed store of precedent M&A transactions"""
+from pathlib import Path
+from typing import Dict, List, Optional
+import csv
+import hashlib
+import json
+import numpy as np
+
+
+NUMERIC_FIELDS = ("deal_value", "target_revenue", "target_ebitda", "ev_revenue", "ev_ebitda", "premium")
+TEXT_FIELDS = ("acquirer", "target", "sector")
+
+
+def month_ordinal(date: str, end: bool = False) -> int:
+    """'YYYY-MM' (or 'YYYY') as a month count; a bare year spans Jan-Dec"""
+    parts = str(date).split("-")
+    year = int(parts[0])
+    month = int(parts[1]) if len(parts) > 1 else (12 if end else 1)
+    if not 1 <= month <= 12:
+        raise ValueError(f"Invalid month in date: {date}")
+    return year * 12 + month - 1
+
+
+class PrecedentStore:
+    """Precedent transactions sorted by date, with a sorted deal-value index
+
+    Date and deal-value ranges resolve to row ranges by binary search, so a
+    query only touches the matching slice, however many deals are loaded.
+    """
+
+    def __init__(self, dates: np.ndarray, numeric: Dict[str, np.ndarray], text: Dict[str, np.ndarray]):
+        order = np.argsort(dates, kind="stable")
+        self.dates = np.asarray(dates, dtype=np.int32)[order]
+        self.numeric = {f: np.asarray(numeric[f], dtype=float)[order] for f in NUMERIC_FIELDS}
+        self.text = {f: np.asarray(text[f], dtype=object)[order] for f in TEXT_FIELDS}
+
+        # Secondary index: row ids ordered by deal value
+        self.value_order = np.argsort(self.numeric["deal_value"], kind="stable")
+        self.sorted_values = self.numeric["deal_value"][self.value_order]
+
+        # Sector codes for vectorized membership tests
+        sector_lower = np.array([str(s).lower() for s in self.text["sector"]], dtype=object)
+        self.sectors, self.sector_codes = np.unique(sector_lower.astype(str), return_inverse=True)
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self.dates.tobytes())
+        for f in NUMERIC_FIELDS:
+            digest.update(self.numeric[f].tobytes())
+        for f in TEXT_FIELDS:
+            digest.update("\x1f".join(map(str, self.text[f])).encode())
+        self.content_hash = digest.hexdigest()
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    @classmethod
+    def from_records(cls, records: List[Dict]) -> "PrecedentStore":
+        """Build from dicts shaped like PRECEDENT_TRANSACTIONS"""
+        return cls(
+            np.array([month_ordinal(r["date"]) for r in records], dtype=np.int32),
+            {f: np.array([float(r.get(f) or 0) for r in records]) for f in NUMERIC_FIELDS},
+            {f: np.array([r.get(f) or "" for r in records], dtype=object) for f in TEXT_FIELDS}
+        )
+
+    @classmethod
+    def from_file(cls, path: str) -> "PrecedentStore":
+        """Load a .json (list of records) or .csv (one row per deal) file"""
+        path = Path(path)
+        if path.suffix == ".json":
+            with open(path) as f:
+                return cls.from_records(json.load(f))
+        if path.suffix == ".csv":
+            with open(path, newline="") as f:
+                return cls.from_records(list(csv.DictReader(f)))
+        raise ValueError(f"Unsupported precedent transactions format: {path.suffix}")
+
+    def query(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        min_deal_value: Optional[float] = None,
+        max_deal_value: Optional[float] = None,
+        sector: Optional[str] = None
+    ) -> np.ndarray:
+        """Row ids matching every given filter, most recent deal first
+
+        sector matches case-insensitively on any part of the sector name.
+        """
+        lo = 0 if start_date is None else np.searchsorted(self.dates, month_ordinal(start_date), "left")
+        hi = len(self) if end_date is None else np.searchsorted(
+            self.dates, month_ordinal(end_date, end=True), "right")
+
+        if min_deal_value is not None or max_deal_value is not None:
+            v_lo = 0 if min_deal_value is None else np.searchsorted(self.sorted_values, min_deal_value, "left")
+            v_hi = len(self) if max_deal_value is None else np.searchsorted(
+                self.sorted_values, max_deal_value, "right")
+            # Walk whichever index gives the smaller candidate set
+            if v_hi - v_lo < hi - lo:
+                rows = self.value_order[v_lo:v_hi]
+                rows = np.sort(rows[(rows >= lo) & (rows < hi)])
+            else:
+                rows = np.arange(lo, hi)
+                values = self.numeric["deal_value"][rows]
+                keep = np.ones(rows.size, dtype=bool)
+                if min_deal_value is not None:
+                    keep &= values >= min_deal_value
+                if max_deal_value is not None:
+                    keep &= values <= max_deal_value
+                rows = rows[keep]
+        else:
+            rows = np.arange(lo, hi)
+
+        if sector is not None:
+            matching = np.flatnonzero(np.char.find(self.sectors, sector.lower()) >= 0)
+            rows = rows[np.isin(self.sector_codes[rows], matching)]
+        return rows[::-1]
+
+    def column(self, field: str, rows: np.ndarray) -> np.ndarray:
+        return self.numeric[field][rows]
+
+    def records(self, rows: np.ndarray) -> List[Dict]:
+        return [
+            {
+                "date": f"{self.dates[i] // 12}-{self.dates[i] % 12 + 1:02d}",
+                "acquirer": self.text["acquirer"][i],
+                "target": self.text["target"][i],
+                **{f: float(self.numeric[f][i]) for f in NUMERIC_FIELDS},
+                "sector": self.text["sector"][i]
+            }
+            for i in rows
+        ]
@@ -0,0 +1,150 @@
+"""Columnar store of historical financial statements"""
+from typing import Dict, List, Optional, Sequence, Union
+import numpy as np
+
+
+STATEMENTS = ("income_statements", "balance_sheets", "cash_flow_statements")
+
+
+class StatementStore:
+    """One (companies x years) array per line item, with ticker and year indexes
+
+    Missing company-years are NaN. Line item names are unique across the
+    three statements, so items are addressed by name alone.
+    """
+
+    def __init__(
+        self,
+        tickers: Sequence[str],
+        years: Sequence[int],
+        items: Dict[str, np.ndarray],
+        statement_of: Dict[str, str]
+    ):
+        self.tickers = list(tickers)
+        self.years = np.asarray(years, dtype=np.int32)
+        self.items = items
+        self.statement_of = statement_of
+        self._ticker_index = {t: i for i, t in enumerate(self.tickers)}
+        self._year_index = {int(y): i for i, y in enumerate(self.years)}
+
+    @classmethod
+    def from_companies(cls, companies: List[Dict], dtype=np.float64) -> "StatementStore":
+        """Build from company dicts shaped like SALESFORCE_DATA"""
+        tickers = [c["ticker"] for c in companies]
+        years = sorted({
+            row["year"] for c in companies for s in STATEMENTS for row in c.get(s, [])
+        })
+        year_index = {y: i for i, y in enumerate(years)}
+        shape = (len(tickers), len(years))
+
+        items: Dict[str, np.ndarray] = {}
+        statement_of: Dict[str, str] = {}
+        for row_index, company in enumerate(companies):
+            for statement in STATEMENTS:
+                for row in company.get(statement, []):
+                    col = year_index[row["year"]]
+                    for item, value in row.items():
+                        if item == "year":
+                            continue
+                        if item not in items:
+                            items[item] = np.full(shape, np.nan, dtype=dtype)
+                            statement_of[item] = statement
+                        items[item][row_index, col] = value
+        return cls(tickers, years, items, statement_of)
+
+    @classmethod
+    def load(cls, path: str) -> "StatementStore":
+        """Load a store written by save()"""
+        with np.load(path, allow_pickle=False) as data:
+            tickers = [str(t) for t in data["__tickers__"]]
+            years = data["__years__"]
+            statement_of = dict(zip(
+                (str(i) for i in data["__items__"]),
+                (str(s) for s in data["__statements__"])
+            ))
+            items = {item: data[item] for item in statement_of}
+        return cls(tickers, years, items, statement_of)
+
+    def save(self, path: str) -> None:
+        names = list(self.items)
+        np.savez_compressed(
+            path,
+            __tickers__=np.asarray(self.tickers),
+            __years__=self.years,
+            __items__=np.asarray(names),
+            __statements__=np.asarray([self.statement_of[n] for n in names]),
+            **self.items
+        )
+
+    @property
+    def nbytes(self) -> int:
+        return sum(a.nbytes for a in self.items.values())
+
+    def rows(self, tickers: Optional[Sequence[str]] = None) -> np.ndarray:
+        if tickers is None:
+            return np.arange(len(self.tickers))
+        return np.array([self._ticker_index[t] for t in tickers], dtype=np.intp)
+
+    def get(
+        self,
+        item: str,
+        tickers: Optional[Sequence[str]] = None,
+        years: Optional[Sequence[int]] = None
+    ) -> np.ndarray:
+        """Line item values, optionally restricted to some companies and years"""
+        values = self.items[item][self.rows(tickers)] if tickers is not None else self.items[item]
+        if years is not None:
+            values = values[:, [self._year_index[int(y)] for y in years]]
+        return values
+
+    def latest(self, item: str) -> np.ndarray:
+        """Most recent reported value per company"""
+        values = self.items[item]
+        reported = ~np.isnan(values)
+        last = values.shape[1] - 1 - np.argmax(reported[:, ::-1], axis=1)
+        latest = values[np.arange(values.shape[0]), last]
+        return np.where(reported.any(axis=1), latest, np.nan)
+
+    def ratio(self, numerator: Union[str, Sequence[str]], denominator: str) -> np.ndarray:
+        """Element-wise ratio of two line items, NaN where undefined
+
+        numerator may list several items, which are summed first (e.g. the
+        debt lines of a leverage ratio).
+        """
+        names = [numerator] if isinstance(numerator, str) else list(numerator)
+        total = sum(self.items[name] for name in names)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result = total / self.items[denominator]
+        return np.where(np.isfinite(result), result, np.nan)
+
+    def growth(self, item: str) -> np.ndarray:
+        """Year-over-year growth; the first year is NaN"""
+        values = self.items[item]
+        result = np.full(values.shape, np.nan, dtype=values.dtype)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result[:, 1:] = values[:, 1:] / values[:, :-1] - 1
+        return result
+
+    def cagr(self, item: str, start_year: Optional[int] = None,
+             end_year: Optional[int] = None) -> np.ndarray:
+        """Compound annual growth between two years (defaults: first and last)"""
+        start_year = int(self.years[0]) if start_year is None else start_year
+        end_year = int(self.years[-1]) if end_year is None else end_year
+        values = self.items[item]
+        start = values[:, self._year_index[start_year]]
+        end = values[:, self._year_index[end_year]]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result = (end / start) ** (1 / (end_year - start_year)) - 1
+        return np.where(np.isfinite(result), result, np.nan)
+
+    def records(self, ticker: str, statement: str) -> List[Dict]:
+        """Per-year dicts for one company and statement, like the source data"""
+        row = self._ticker_index[ticker]
+        names = [n for n, s in self.statement_of.items() if s == statement]
+        result = []
+        for col, year in enumerate(self.years):
+            values = {n: self.items[n][row, col] for n in names}
+            if all(np.isnan(v) for v in values.values()):
+                continue
+            result.append({"year": int(year), **{n: float(v) for n, v in values.items()}})
+        return result
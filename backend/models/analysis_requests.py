@@ -0,0 +1,137 @@
+"""Request models for parameterised M&A analysis endpoints"""
+from pydantic import BaseModel, Field
+from typing import List, Optional, Dict, Literal, Annotated, Union
+
+
+class DistributionSpec(BaseModel):
+    # Unset fields (kind included) keep the variable's default distribution
+    kind: Optional[Literal["fixed", "normal", "uniform", "triangular", "lognormal"]] = None
+    mean: Optional[float] = None
+    std: Optional[float] = Field(default=None, ge=0)
+    low: Optional[float] = None
+    high: Optional[float] = None
+    mode: Optional[float] = None
+
+
+class MonteCarloRequest(BaseModel):
+    company: Literal["target", "acquirer"] = "target"
+    n_paths: int = Field(default=100000, ge=1, le=1000000)
+    chunk_size: int = Field(default=50000, ge=1000, le=250000)
+    seed: Optional[int] = None
+    distributions: Dict[
+        Literal["growth_shift", "ebitda_margin", "beta", "market_risk_premium", "terminal_growth"],
+        DistributionSpec
+    ] = Field(default_factory=dict)
+    percentiles: List[Annotated[float, Field(ge=0, le=100)]] = Field(default=[1, 5, 10, 25, 50, 75, 90, 95, 99])
+    histogram_bins: int = Field(default=50, ge=5, le=500)
+
+
+class PriceProcess(BaseModel):
+    acquirer_volatility: float = Field(default=0.30, gt=0, le=3)
+    target_volatility: float = Field(default=0.35, gt=0, le=3)
+    correlation: float = Field(default=0.5, ge=-1, le=1)
+
+
+class CollarSimulationRequest(BaseModel):
+    n_paths: int = Field(default=100000, ge=1, le=1000000)
+    chunk_size: int = Field(default=100000, ge=1000, le=250000)
+    seed: Optional[int] = None
+    days_to_close: int = Field(default=126, ge=1, le=756)
+    averaging_days: int = Field(default=10, ge=1, le=756)
+    collar_lower: float = Field(default=0.9, gt=0, le=1)
+    collar_upper: float = Field(default=1.1, ge=1, le=10)
+    stock_percent: Optional[float] = Field(default=None, ge=0, le=1)
+    premium: Optional[float] = Field(default=None, ge=-1)
+    price_process: PriceProcess = Field(default_factory=PriceProcess)
+    percentiles: List[Annotated[float, Field(ge=0, le=100)]] = Field(default=[1, 5, 10, 25, 50, 75, 90, 95, 99])
+    histogram_bins: int = Field(default=50, ge=5, le=500)
+
+
+class ScenarioAssumptions(BaseModel):
+    assumptions: Dict[str, Union[float, List[float]]] = Field(default_factory=dict)
+
+
+class CompsFilters(BaseModel):
+    min_market_cap: Optional[float] = None
+    max_market_cap: Optional[float] = None
+    min_revenue: Optional[float] = None
+    max_revenue: Optional[float] = None
+    min_revenue_growth: Optional[float] = None
+    max_revenue_growth: Optional[float] = None
+    min_ebitda_margin: Optional[float] = None
+    max_ebitda_margin: Optional[float] = None
+
+
+class ScreeningRequest(BaseModel):
+    metric: Literal[
+        "accretion_dilution_percent", "combined_net_income", "synergies_after_tax",
+        "implied_offer_value", "target_ownership_percent"
+    ] = "accretion_dilution_percent"
+    ascending: bool = False
+    top_k: int = Field(default=100, ge=1, le=100000)
+    premium: Optional[float] = Field(default=None, ge=0)
+    stock_percent: Optional[float] = Field(default=None, ge=0, le=1)
+    acquirer_filters: Optional[CompsFilters] = None
+    target_filters: Optional[CompsFilters] = None
+    require_larger_acquirer: bool = True
+    format: Literal["json", "ndjson"] = "json"
+
+
+class DebtTranche(BaseModel):
+    name: str = Field(min_length=1, max_length=64)
+    share: float = Field(ge=0, le=1)
+    rate: float = Field(ge=0, le=1)
+    amortization: float = Field(default=0.0, ge=0, le=1)
+    sweep: bool = False
+
+
+class LBORequest(BaseModel):
+    leverage: Optional[List[Annotated[float, Field(ge=0, le=20)]]] = Field(default=None, min_length=1, max_length=200)
+    entry_multiples: Optional[List[Annotated[float, Field(gt=0)]]] = Field(default=None, min_length=1, max_length=200)
+    exit_multiples: Optional[List[Annotated[float, Field(ge=0)]]] = Field(default=None, min_length=1, max_length=200)
+    holding_periods: Optional[List[Annotated[int, Field(ge=1, le=30)]]] = Field(default=None, min_length=1, max_length=30)
+    tranches: Optional[List[DebtTranche]] = Field(default=None, min_length=1, max_length=10)
+    cash_sweep_percent: float = Field(default=1.0, ge=0, le=1)
+    transaction_fee_percent: float = Field(default=0.02, ge=0, le=0.2)
+    target_irr: float = Field(default=0.20, ge=-1, le=10)
+
+
+class GoalSeekRequest(BaseModel):
+    output: Literal[
+        "accretion_dilution_percent", "pro_forma_eps", "offer_price_per_share", "deal_value",
+        "target_ownership_percent", "premium_to_value_percent"
+    ] = "accretion_dilution_percent"
+    targets: List[float] = Field(default=[0.0], min_length=1, max_length=10000)
+    solve_for: Literal["premium", "stock_percent", "synergies"] = "premium"
+    premium: Optional[List[Annotated[float, Field(ge=-1)]]] = Field(default=None, min_length=1, max_length=10000)
+    stock_percent: Optional[List[Annotated[float, Field(ge=0, le=1)]]] = Field(default=None, min_length=1, max_length=10000)
+    synergies: Optional[List[float]] = Field(default=None, min_length=1, max_length=10000)
+    financing_rate: Optional[float] = Field(default=None, ge=0, le=1)
+    lower: Optional[float] = None
+    upper: Optional[float] = None
+
+
+class MixOptimizerRequest(BaseModel):
+    stock_percent: Optional[List[Annotated[float, Field(ge=0, le=1)]]] = Field(default=None, min_length=1, max_length=1000)
+    financing_rate: Optional[List[Annotated[float, Field(ge=0, le=1)]]] = Field(default=None, min_length=1, max_length=1000)
+    premium: Optional[List[Annotated[float, Field(ge=-1)]]] = Field(default=None, min_length=1, max_length=1000)
+    year: int = Field(default=2, ge=1, le=50)
+    max_leverage: Optional[float] = None
+
+
+class MultiYearAccretionRequest(BaseModel):
+    stock_percent: Optional[List[Annotated[float, Field(ge=0, le=1)]]] = Field(default=None, min_length=1, max_length=1000)
+    premium: Optional[List[Annotated[float, Field(ge=-1)]]] = Field(default=None, min_length=1, max_length=1000)
+    financing_rate: Optional[List[Annotated[float, Field(ge=0, le=1)]]] = Field(default=None, min_length=1, max_length=1000)
+    synergy_phase_in: Optional[List[Annotated[float, Field(ge=0, le=2)]]] = Field(default=None, min_length=1, max_length=50)
+    acquirer_growth_rates: Optional[List[Annotated[float, Field(ge=-1)]]] = Field(default=None, min_length=1, max_length=50)
+
+
+class TornadoRequest(BaseModel):
+    bump: float = Field(default=0.10, gt=0, le=1)
+    bumps: Dict[
+        Literal["growth_rates", "ebitda_margin", "da_percent", "capex_percent", "nwc_percent",
+                "cost_of_debt", "cross_sell_rate", "cost_synergy_percent", "one_time_costs",
+                "acquisition_premium", "dcf_weight", "comps_weight", "precedents_weight"],
+        Annotated[float, Field(gt=0, le=1)]
+    ] = Field(default_factory=dict)
@@ -82,6 +82,7 @@ class PrecedentTransaction(BaseModel):
     ev_revenue: float
     ev_ebitda: float
     premium: float
+    sector: Optional[str] = None
 
 
 class DCFAssumptions(BaseModel):
@@ -1,29 +1,58 @@
-from fastapi import FastAPI, APIRouter, HTTPException
-from dotenv import load_dotenv
-from starlette.middleware.cors import CORSMiddleware
-from motor.motor_asyncio import AsyncIOMotorClient
-import os
-import logging
-from pathlib import Path
-from pydantic import BaseModel, Field, ConfigDict
-from typing import List, Dict, Any
-import uuid
-from datetime import datetime, timezone
 import sys
+from pathlib import Path
 
 # Add backend directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-# Import M&A analysis services
-from backend.services.ma_analyzer import MAAnalyzer
+# Imported first, so everything after it shows up in the startup report
+from backend.services.startup import Lazy, startup_report
+
+with startup_report.track_imports():
+    from fastapi import FastAPI, APIRouter, HTTPException, Query, Request, Response
+    from dotenv import load_dotenv
+    from starlette.middleware.cors import CORSMiddleware
+    from starlette.responses import PlainTextResponse, StreamingResponse
+    import os
+    import logging
+    from pydantic import BaseModel, Field, ConfigDict
+    from typing import List, Dict, Any, Optional, Set
+    import uuid
+    import base64
+    import json
+    from datetime import datetime, timezone
+    import asyncio
+
+    # Import M&A analysis services (the NumPy-backed analyzer and scenario
+    # graph are imported when first built, see _build_analyzer)
+    from backend.services.executor import AnalysisExecutor, ExecutorBusyError
+    from backend.services.json_response import NumpyJSONResponse, dumps
+    from backend.services.result_cache import ResultCache
+    from backend.services.result_store import AnalysisResultStore
+    from backend.services.metrics import MetricsMiddleware, RequestMetrics, gauge_lines
+    from backend.models.analysis_requests import (
+        CollarSimulationRequest,
+        GoalSeekRequest,
+        LBORequest,
+        MixOptimizerRequest,
+        MonteCarloRequest,
+        MultiYearAccretionRequest,
+        ScenarioAssumptions,
+        ScreeningRequest,
+        TornadoRequest
+    )
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
-# MongoDB connection
+# MongoDB connection, opened on first use (motor and pymongo are slow to import)
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
-db = client[os.environ['DB_NAME']]
+
+def _connect_mongo():
+    from motor.motor_asyncio import AsyncIOMotorClient
+    return AsyncIOMotorClient(mongo_url, tz_aware=True)
+
+client = Lazy(_connect_mongo, "mongo_client")
+db = Lazy(lambda: client.get()[os.environ['DB_NAME']], "mongo_database")
 
 # Create the main app without a prefix
 app = FastAPI(title="M&A Analysis API", version="1.0.0")
@@ -31,8 +60,119 @@ app = FastAPI(title="M&A Analysis API", version="1.0.0")
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
 
-# Initialize M&A Analyzer
-ma_analyzer = MAAnalyzer()
+def _build_analyzer():
+    from backend.services.ma_analyzer import MAAnalyzer
+    return MAAnalyzer.from_env()
+
+def _code_version() -> str:
+    from backend.services.ma_analyzer import code_version
+    return code_version()
+
+def _build_scenario_store():
+    from backend.services.analysis_graph import ScenarioStore
+    return ScenarioStore(
+        max_sessions=int(os.environ.get('MA_MAX_SCENARIOS', 100)),
+        comparables=lambda: ma_analyzer.comparables,
+        precedents=lambda: ma_analyzer.precedents
+    )
+
+# M&A Analyzer (result cache size and optional comps/precedents files come
+# from MA_* environment variables), built on first use or by the startup warm-up
+ma_analyzer = Lazy(_build_analyzer, "analyzer")
+
+# Live what-if scenario sessions, sharing the analyzer's data sets once loaded
+scenario_store = Lazy(_build_scenario_store, "scenario_store")
+
+# Per-route latency, size and error metrics, served at /api/metrics
+request_metrics = RequestMetrics()
+
+# Analyses run in a bounded pool so they never block the event loop
+analysis_executor = AnalysisExecutor(
+    ma_analyzer,
+    kind=os.environ.get('MA_EXECUTOR', 'thread'),
+    max_workers=int(os.environ.get('MA_EXECUTOR_WORKERS', 4)),
+    max_queue=int(os.environ.get('MA_EXECUTOR_QUEUE_DEPTH', 32)),
+    analyzer_factory=_build_analyzer
+)
+
+
+def _busy(error: ExecutorBusyError) -> HTTPException:
+    return HTTPException(status_code=503, detail=str(error), headers={"Retry-After": "1"})
+
+
+# Serialized analysis payloads by ETag, so repeat requests skip compute and encoding
+rendered_responses = ResultCache(maxsize=int(os.environ.get('MA_RENDERED_CACHE_MAXSIZE', 128)), ttl=None)
+
+# Rendered results shared across restarts and workers (MA_RESULT_STORE=0 disables)
+result_store = AnalysisResultStore(
+    Lazy(lambda: db.analysis_results, "result_store_collection"),
+    code_version=_code_version,
+    ttl_seconds=int(os.environ.get('MA_RESULT_STORE_TTL_SECONDS', 7 * 24 * 3600))
+) if os.environ.get('MA_RESULT_STORE', '1') != '0' else None
+
+# Analysis responses are revalidated by ETag once this many seconds old
+ANALYSIS_CACHE_CONTROL = f"public, max-age={int(os.environ.get('MA_HTTP_MAX_AGE', 60))}, must-revalidate"
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(tag.removeprefix("W/") == etag for tag in candidates)
+
+async def _stored_body(key: str) -> Optional[bytes]:
+    """Rendered result for `key` from memory, else from the result store"""
+    hit, body = rendered_responses.get(key, "rendered")
+    if hit:
+        return body
+    body = await result_store.get(key) if result_store is not None else None
+    if body is not None:
+        rendered_responses.set(key, body)
+    return body
+
+def _remember(key: str, body: bytes) -> None:
+    rendered_responses.set(key, body)
+    if result_store is not None:
+        result_store.put(key, body)
+
+async def _tag(tag: str, *args, **kwargs) -> str:
+    """An analyzer tag method's result (etag, batch_etag), on a worker thread
+
+    Tags fingerprint the data sources, and the first one builds the analyzer
+    and loads its comparables/precedents, so none of that runs on the loop.
+    """
+    return await asyncio.to_thread(lambda: getattr(ma_analyzer, tag)(*args, **kwargs))
+
+async def _cached_response(request: Request, response: Response, tag: str,
+                           *args, **kwargs) -> Optional[Response]:
+    """304 if the client holds this result, our stored rendering of it if we have one
+
+    Otherwise sets ETag/Cache-Control on `response` for _render and returns
+    None. The tag is a hash of the analysis inputs, known before any compute.
+    """
+    try:
+        key = await _tag(tag, *args, **kwargs)
+    except (ValueError, TypeError):
+        return None  # let the handler report the bad request
+    headers = {"ETag": f'"{key}"', "Cache-Control": ANALYSIS_CACHE_CONTROL}
+    if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    body = await _stored_body(key)
+    if body is not None:
+        return NumpyJSONResponse(body, headers=headers)
+    response.headers.update(headers)
+    return None
+
+def _render(content: Any, response: Optional[Response] = None, key: Optional[str] = None) -> NumpyJSONResponse:
+    """Serialize once; keep the bytes when the payload has an ETag or key"""
+    body = dumps(content)
+    if response is not None and response.headers.get("etag"):
+        key = response.headers["etag"].strip('"')
+    if key:
+        _remember(key, body)
+    if response is None:
+        return NumpyJSONResponse(body)
+    return NumpyJSONResponse(body, headers=dict(response.headers))
 
 
 # Define Models
@@ -57,119 +197,707 @@ async def root():
         "endpoints": {
             "overview": "/api/ma/overview",
             "financials": "/api/ma/financials",
+            "historical_metrics": "/api/ma/historical-metrics",
             "dcf": "/api/ma/dcf",
+            "dcf_monte_carlo": "/api/ma/dcf/monte-carlo",
+            "dcf_sensitivity": "/api/ma/dcf/sensitivity",
+            "collar_simulation": "/api/ma/exchange-ratio/simulation",
             "comps": "/api/ma/comparable-companies",
             "precedents": "/api/ma/precedent-transactions",
             "synergies": "/api/ma/synergies",
             "accretion": "/api/ma/accretion-dilution",
+            "accretion_multi_year": "/api/ma/accretion-dilution/multi-year",
+            "consideration_mix": "/api/ma/consideration-mix",
             "valuation": "/api/ma/valuation-summary",
-            "executive": "/api/ma/executive-summary"
+            "tornado": "/api/ma/tornado",
+            "executive": "/api/ma/executive-summary",
+            "batch": "/api/ma/batch",
+            "screening": "/api/ma/screening",
+            "lbo": "/api/ma/lbo",
+            "goal_seek": "/api/ma/goal-seek",
+            "scenarios": "/api/ma/scenarios",
+            "cache_stats": "/api/ma/cache/stats",
+            "executor_stats": "/api/ma/executor/stats",
+            "metrics": "/api/metrics",
+            "startup": "/api/startup"
         }
     }
 
 @api_router.get("/ma/overview")
-async def get_ma_overview():
+async def get_ma_overview(request: Request, response: Response):
     """Get M&A transaction overview with company details and strategic rationale"""
+    cached = await _cached_response(request, response, "etag", "get_company_overview")
+    if cached:
+        return cached
     try:
-        overview = ma_analyzer.get_company_overview()
-        return overview
+        overview = await analysis_executor.run("overview", "get_company_overview")
+        return _render(overview, response)
+    except ExecutorBusyError as e:
+        raise _busy(e)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @api_router.get("/ma/financials")
-async def get_financial_statements():
+async def get_financial_statements(request: Request, response: Response):
     """Get historical financial statements for both companies"""
+    cached = await _cached_response(request, response, "etag", "get_financial_statements")
+    if cached:
+        return cached
     try:
-        financials = ma_analyzer.get_financial_statements()
-        return financials
+        financials = await analysis_executor.run("financials", "get_financial_statements")
+        return _render(financials, response)
+    except ExecutorBusyError as e:
+        raise _busy(e)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@api_router.get("/ma/historical-metrics")
+async def get_historical_metrics(request: Request, response: Response):
+    """Get historical growth, margin and leverage metrics for both companies"""
+    cached = await _cached_response(request, response, "etag", "get_historical_metrics")
+    if cached:
+        return cached
+    try:
+        metrics = await analysis_executor.run("historical_metrics", "get_historical_metrics")
+        return _render(metrics, response)
+    except ExecutorBusyError as e:
+        raise _busy(e)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @api_router.get("/ma/dcf")
-async def get_dcf_valuation(company: str = "target"):
+async def get_dcf_valuation(request: Request, response: Response, company: str = "target"):
     """Get DCF valuation analysis"""
+    cached = await _cached_response(request, response, "etag", "calculate_dcf_valuation", company)
+    if cached:
+        return cached
+    try:
+        dcf = await analysis_executor.run("dcf", "calculate_dcf_valuation", company)
+        return _render(dcf, response)
+    except ExecutorBusyError as e:
+        raise _busy(e)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@api_router.post("/ma/dcf/monte-carlo")
+async def run_dcf_monte_carlo(request: MonteCarloRequest):
+    """Run a Monte Carlo DCF over sampled growth, margin, WACC and terminal growth"""
+    params = {
+        "company": request.company,
+        "n_paths": request.n_paths,
+        "distributions": {
+            name: spec.model_dump(exclude_unset=True, exclude_none=True)
+            for name, spec in request.distributions.items()
+        },
+        "seed": request.seed,
+        "chunk_size": request.chunk_size,
+        "percentiles": request.percentiles,
+        "histogram_bins": request.histogram_bins
+    }
+    # Only seeded runs are reproducible, and so worth storing
+    key = await _tag("etag", "simulate_dcf_valuation", **params) if request.seed is not None else None
+    body = await _stored_body(key) if key else None
+    if body is not None:
+        return NumpyJSONResponse(body)
+    try:
+        simulation = await analysis_executor.run("dcf_monte_carlo", "simulate_dcf_valuation", **params)
+        return _render(simulation, key=key)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ExecutorBusyError as e:
+        raise _busy(e)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@api_router.post("/ma/exchange-ratio/simulation")
+async def simulate_exchange_ratio_collar(request: CollarSimulationRequest):
+    """Value per target share and acquirer dilution under fixed/floating exchange ratios and collars"""
+    params = request.model_dump()
+    # Only seeded runs are reproducible, and so worth storing. chunk_size only
+    # bounds memory (same paths, percentiles within histogram resolution), so
+    # it is left out of the key: runs differing only in it share one result.
+    key_params = {name: value for name, value in params.items() if name != "chunk_size"}
+    key = await _tag("etag", "simulate_exchange_ratio_collar", **key_params) if request.seed is not None else None
+    body = await _stored_body(key) if key else None
+    if body is not None:
+        return NumpyJSONResponse(body)
+    try:
+        simulation = await analysis_executor.run(
+            "collar_simulation", "simulate_exchange_ratio_collar", **params
+        )
+        return _render(simulation, key=key)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ExecutorBusyError as e:
+        raise _busy(e)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+def _grid_axis(low: Optional[float], high: Optional[float], steps: int) -> Optional[List[float]]:
+    """Evenly spaced sensitivity axis, or None to use the analyzer's default"""
+    if low is None and high is None:
+        return None
+    if low is None or high is None:
+        raise HTTPException(status_code=400, detail="Both ends of a sensitivity range are required")
+    return [low + (high - low) * i / max(steps - 1, 1) for i in range(steps)]
+
+@api_router.get("/ma/dcf/sensitivity")
+async def get_dcf_sensitivity(
+    request: Request,
+    response: Response,
+    company: str = "target",
+    wacc_min: Optional[float] = None,
+    wacc_max: Optional[float] = None,
+    wacc_steps: int = Query(default=9, ge=1, le=500),
+    growth_min: Optional[float] = None,
+    growth_max: Optional[float] = None,
+    growth_steps: int = Query(default=5, ge=1, le=500),
+    exit_multiples: Optional[List[float]] = Query(default=None, max_length=500)
+):
+    """Get WACC x terminal growth (and optional exit multiple) sensitivity grid"""
+    wacc_values = _grid_axis(wacc_min, wacc_max, wacc_steps)
+    growth_values = _grid_axis(growth_min, growth_max, growth_steps)
+    cached = await _cached_response(
+        request, response, "etag", "get_dcf_sensitivity",
+        company=company,
+        wacc_values=wacc_values,
+        terminal_growth_values=growth_values,
+        exit_multiples=exit_multiples
+    )
+    if cached:
+        return cached
     try:
-        dcf = ma_analyzer.calculate_dcf_valuation(company)
-        return dcf
+        sensitivity = await analysis_executor.run(
+            "dcf_sensitivity", "get_dcf_sensitivity",
+            company=company,
+            wacc_values=wacc_values,
+            terminal_growth_values=growth_values,
+            exit_multiples=exit_multiples
+        )
+        return _render(sensitivity, response)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ExecutorBusyError as e:
+        raise _busy(e)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @api_router.get("/ma/comparable-companies")
-async def get_comparable_companies():
+async def get_comparable_companies(
+    request: Request,
+    response: Response,
+    min_market_cap: Optional[float] = None,
+    max_market_cap: Optional[float] = None,
+    min_revenue: Optional[float] = None,
+    max_revenue: Optional[float] = None,
+    min_revenue_growth: Optional[float] = None,
+    max_revenue_growth: Optional[float] = None,
+    min_ebitda_margin: Optional[float] = None,
+    max_ebitda_margin: Optional[float] = None,
+    limit: int = Query(default=500, ge=0, le=20000)
+):
     """Get comparable companies analysis with trading multiples"""
+    filters = {
+        name: value for name, value in {
+            "min_market_cap": min_market_cap,
+            "max_market_cap": max_market_cap,
+            "min_revenue": min_revenue,
+            "max_revenue": max_revenue,
+            "min_revenue_growth": min_revenue_growth,
+            "max_revenue_growth": max_revenue_growth,
+            "min_ebitda_margin": min_ebitda_margin,
+            "max_ebitda_margin": max_ebitda_margin
+        }.items() if value is not None
+    }
+    cached = await _cached_response(
+        request, response, "etag", "get_comparable_companies_analysis",
+        filters=filters or None, limit=limit
+    )
+    if cached:
+        return cached
     try:
-        comps = ma_analyzer.get_comparable_companies_analysis()
-        return comps
+        comps = await analysis_executor.run(
+            "comps", "get_comparable_companies_analysis", filters=filters or None, limit=limit
+        )
+        return _render(comps, response)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ExecutorBusyError as e:
+        raise _busy(e)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @api_router.get("/ma/precedent-transactions")
-async def get_precedent_transactions():
-    """Get precedent transactions analysis"""
+async def get_precedent_transactions(
+    request: Request,
+    response: Response,
+    start_date: Optional[str] = Query(default=None, pattern=r"^\d{4}(-\d{2})?$"),
+    end_date: Optional[str] = Query(default=None, pattern=r"^\d{4}(-\d{2})?$"),
+    min_deal_value: Optional[float] = None,
+    max_deal_value: Optional[float] = None,
+    sector: Optional[str] = None,
+    limit: int = Query(default=500, ge=0, le=20000)
+):
+    """Get precedent transactions analysis, optionally over a date/size/sector slice"""
+    filters = {
+        name: value for name, value in {
+            "start_date": start_date,
+            "end_date": end_date,
+            "min_deal_value": min_deal_value,
+            "max_deal_value": max_deal_value,
+            "sector": sector
+        }.items() if value is not None
+    }
+    cached = await _cached_response(
+        request, response, "etag", "get_precedent_transactions_analysis",
+        filters=filters or None, limit=limit
+    )
+    if cached:
+        return cached
     try:
-        precedents = ma_analyzer.get_precedent_transactions_analysis()
-        return precedents
+        precedents = await analysis_executor.run(
+            "precedents", "get_precedent_transactions_analysis", filters=filters or None, limit=limit
+        )
+        return _render(precedents, response)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ExecutorBusyError as e:
+        raise _busy(e)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @api_router.get("/ma/synergies")
-async def get_synergy_analysis():
+async def get_synergy_analysis(request: Request, response: Response):
     """Get merger synergies analysis"""
+    cached = await _cached_response(request, response, "etag", "calculate_synergies")
+    if cached:
+        return cached
     try:
-        synergies = ma_analyzer.calculate_synergies()
-        return synergies
+        synergies = await analysis_executor.run("synergies", "calculate_synergies")
+        return _render(synergies, response)
+    except ExecutorBusyError as e:
+        raise _busy(e)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @api_router.get("/ma/accretion-dilution")
-async def get_accretion_dilution():
+async def get_accretion_dilution(request: Request, response: Response):
     """Get EPS accretion/dilution analysis"""
+    cached = await _cached_response(request, response, "etag", "calculate_accretion_dilution")
+    if cached:
+        return cached
     try:
-        accretion = ma_analyzer.calculate_accretion_dilution()
-        return accretion
+        accretion = await analysis_executor.run("accretion", "calculate_accretion_dilution")
+        return _render(accretion, response)
+    except ExecutorBusyError as e:
+        raise _busy(e)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @api_router.get("/ma/valuation-summary")
-async def get_valuation_summary():
+async def get_valuation_summary(request: Request, response: Response):
     """Get comprehensive valuation summary with recommendation"""
+    cached = await _cached_response(request, response, "etag", "get_valuation_summary")
+    if cached:
+        return cached
     try:
-        valuation = ma_analyzer.get_valuation_summary()
-        return valuation
+        valuation = await analysis_executor.run("valuation", "get_valuation_summary")
+        return _render(valuation, response)
+    except ExecutorBusyError as e:
+        raise _busy(e)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @api_router.get("/ma/executive-summary")
-async def get_executive_summary():
+async def get_executive_summary(request: Request, response: Response):
     """Get executive summary of the transaction"""
+    cached = await _cached_response(request, response, "etag", "get_executive_summary")
+    if cached:
+        return cached
+    try:
+        summary = await analysis_executor.run("executive", "get_executive_summary")
+        return _render(summary, response)
+    except ExecutorBusyError as e:
+        raise _busy(e)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@api_router.get("/ma/batch")
+async def get_batch(
+    request: Request,
+    response: Response,
+    sections: List[str] = Query(...),
+    company: str = "target"
+):
+    """Get several analysis sections in one payload, sharing intermediate results"""
+    cached = await _cached_response(request, response, "batch_etag", sections, company)
+    if cached:
+        return cached
+    try:
+        batch = await analysis_executor.run("batch", "get_batch", sections, company)
+        return _render(batch, response)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ExecutorBusyError as e:
+        raise _busy(e)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+def _ndjson_pairs(screen: Dict) -> bytes:
+    """Summary line, then the ranked pairs one per line
+
+    The ranking is only final once the whole pair matrix has been scanned,
+    so the body is built from the finished screen rather than streamed.
+    """
+    header = {k: v for k, v in screen.items() if k != "pairs"}
+    return b"".join(dumps(line) + b"\n" for line in [header, *screen["pairs"]])
+
+@api_router.post("/ma/screening")
+async def screen_acquisition_pairs(request: ScreeningRequest):
+    """Screen every acquirer x target pairing in the comps universe, top-K by a metric"""
+    params = {
+        "metric": request.metric,
+        "ascending": request.ascending,
+        "top_k": request.top_k,
+        "premium": request.premium,
+        "stock_percent": request.stock_percent,
+        "acquirer_filters": request.acquirer_filters.model_dump(exclude_none=True)
+        if request.acquirer_filters else None,
+        "target_filters": request.target_filters.model_dump(exclude_none=True)
+        if request.target_filters else None,
+        "require_larger_acquirer": request.require_larger_acquirer
+    }
+    key = await _tag("etag", "screen_acquisition_pairs", **params) if request.format == "json" else None
+    body = await _stored_body(key) if key else None
+    if body is not None:
+        return NumpyJSONResponse(body)
+    try:
+        screen = await analysis_executor.run("screening", "screen_acquisition_pairs", **params)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ExecutorBusyError as e:
+        raise _busy(e)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    if request.format == "ndjson":
+        return Response(_ndjson_pairs(screen), media_type="application/x-ndjson")
+    return _render(screen, key=key)
+
+@api_router.post("/ma/accretion-dilution/multi-year")
+async def calculate_multi_year_accretion(request: MultiYearAccretionRequest):
+    """Pro forma EPS accretion/dilution per projection year, with phased synergies and financing cost"""
+    params = request.model_dump()
+    key = await _tag("etag", "calculate_multi_year_accretion", **params)
+    body = await _stored_body(key)
+    if body is not None:
+        return NumpyJSONResponse(body)
+    try:
+        accretion = await analysis_executor.run(
+            "accretion_multi_year", "calculate_multi_year_accretion", **params
+        )
+        return _render(accretion, key=key)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ExecutorBusyError as e:
+        raise _busy(e)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@api_router.post("/ma/consideration-mix")
+async def optimize_consideration_mix(request: MixOptimizerRequest):
+    """Accretion and pro forma leverage over premium x financing rate x cash/stock mix, with the efficient frontier"""
+    params = request.model_dump()
+    key = await _tag("etag", "optimize_consideration_mix", **params)
+    body = await _stored_body(key)
+    if body is not None:
+        return NumpyJSONResponse(body)
+    try:
+        mix = await analysis_executor.run(
+            "consideration_mix", "optimize_consideration_mix", **params
+        )
+        return _render(mix, key=key)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ExecutorBusyError as e:
+        raise _busy(e)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@api_router.post("/ma/lbo")
+async def calculate_lbo_returns(request: LBORequest):
+    """Sponsor LBO returns matrix over leverage, entry/exit multiples and holding periods"""
+    params = {
+        **request.model_dump(exclude={"tranches"}),
+        "tranches": [t.model_dump() for t in request.tranches] if request.tranches else None
+    }
+    key = await _tag("etag", "calculate_lbo_returns", **params)
+    body = await _stored_body(key)
+    if body is not None:
+        return NumpyJSONResponse(body)
+    try:
+        lbo = await analysis_executor.run("lbo", "calculate_lbo_returns", **params)
+        return _render(lbo, key=key)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ExecutorBusyError as e:
+        raise _busy(e)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@api_router.post("/ma/tornado")
+async def calculate_tornado(request: TornadoRequest):
+    """Offer price and offer-based EPS accretion impact of bumping each deal assumption down and up, ranked"""
+    params = request.model_dump()
+    key = await _tag("etag", "calculate_tornado", **params)
+    body = await _stored_body(key)
+    if body is not None:
+        return NumpyJSONResponse(body)
     try:
-        summary = ma_analyzer.get_executive_summary()
-        return summary
+        tornado = await analysis_executor.run("tornado", "calculate_tornado", **params)
+        return _render(tornado, key=key)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ExecutorBusyError as e:
+        raise _busy(e)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@api_router.post("/ma/goal-seek")
+async def solve_deal_terms(request: GoalSeekRequest):
+    """Solve for the premium, stock mix or synergies that hit output targets"""
+    params = request.model_dump()
+    key = await _tag("etag", "solve_deal_terms", **params)
+    body = await _stored_body(key)
+    if body is not None:
+        return NumpyJSONResponse(body)
+    try:
+        solution = await analysis_executor.run("goal_seek", "solve_deal_terms", **params)
+        return _render(solution, key=key)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ExecutorBusyError as e:
+        raise _busy(e)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@api_router.post("/ma/scenarios")
+async def create_scenario(request: ScenarioAssumptions):
+    """Start a what-if session from the base case plus optional assumption overrides"""
+    try:
+        # The first session builds the store, and imports the analyzer, off the loop
+        session = await analysis_executor.run_callable(
+            "scenarios", lambda: scenario_store.create(request.assumptions)
+        )
+        return _render(session.state())
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ExecutorBusyError as e:
+        raise _busy(e)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+def _scenario(scenario_id: str):
+    """A live what-if session, or None; there are none before the store is built"""
+    return scenario_store.get().get(scenario_id) if scenario_store.loaded else None
+
+@api_router.get("/ma/scenarios/{scenario_id}")
+async def get_scenario(scenario_id: str):
+    """Get the current assumptions and outputs of a what-if session"""
+    session = _scenario(scenario_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Scenario not found")
+    return _render(session.state())
+
+@api_router.patch("/ma/scenarios/{scenario_id}")
+async def update_scenario(scenario_id: str, request: ScenarioAssumptions):
+    """Apply an assumption delta and return only the outputs that changed"""
+    session = _scenario(scenario_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Scenario not found")
+    try:
+        delta = await analysis_executor.run_callable("scenarios", session.apply, request.assumptions)
+        return _render(delta)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ExecutorBusyError as e:
+        raise _busy(e)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@api_router.delete("/ma/scenarios/{scenario_id}")
+async def delete_scenario(scenario_id: str):
+    """End a what-if session"""
+    if not (scenario_store.loaded and scenario_store.delete(scenario_id)):
+        raise HTTPException(status_code=404, detail="Scenario not found")
+    return {"scenario_id": scenario_id, "deleted": True}
+
+def _worker_caches() -> bool:
+    """Whether analyses run in worker processes, each with its own result cache
+
+    Those caches are out of reach of this process, so the analysis cache
+    routes decline to act on (or report) the unused local one.
+    """
+    return analysis_executor.kind == "process"
+
+@api_router.get("/ma/cache/stats")
+async def get_cache_stats():
+    """Get analysis result cache hit/miss counters"""
+    if _worker_caches():
+        analysis = {"analysis": None, "detail": "Analysis caches live in the executor's worker processes"}
+    else:
+        analysis = ma_analyzer.cache_stats()
+    return {
+        **analysis,
+        "rendered": rendered_responses.stats(),
+        "result_store": result_store.stats() if result_store is not None else None
+    }
+
+@api_router.get("/ma/executor/stats")
+async def get_executor_stats():
+    """Get analysis executor load and per-endpoint queue wait times"""
+    return analysis_executor.stats()
+
+def _analysis_metric_lines() -> List[str]:
+    """Executor and cache counters in Prometheus format"""
+    executor = analysis_executor.stats()
+    endpoints = executor["endpoints"].items()
+    # Scrapes must not build the analyzer: its cache is absent until loaded
+    cache = ma_analyzer.cache_stats() if ma_analyzer.loaded and not _worker_caches() else {}
+    lines = gauge_lines("ma_executor_in_flight", "Analysis calls running or queued.",
+                        [({}, executor["in_flight"])])
+    lines += gauge_lines("ma_executor_queued", "Analysis calls waiting for a worker.",
+                         [({}, executor["queued"])])
+    for name, key, help_text in (
+        ("ma_executor_calls_total", "calls", "Analysis calls completed, by endpoint."),
+        ("ma_executor_rejected_total", "rejected", "Analysis calls rejected with a full queue, by endpoint."),
+        ("ma_executor_errors_total", "errors", "Analysis calls that raised, by endpoint.")
+    ):
+        lines += gauge_lines(name, help_text, [({"endpoint": e}, s[key]) for e, s in endpoints], "counter")
+    lines += gauge_lines("ma_executor_queue_wait_avg_seconds", "Mean queue wait, by endpoint.",
+                         [({"endpoint": e}, s["avg_queue_wait_ms"] / 1000) for e, s in endpoints])
+    if cache:
+        lines += gauge_lines("ma_result_cache_hits_total", "Analysis result cache hits.",
+                             [({}, cache["hits"])], "counter")
+        lines += gauge_lines("ma_result_cache_misses_total", "Analysis result cache misses.",
+                             [({}, cache["misses"])], "counter")
+        lines += gauge_lines("ma_result_cache_size", "Analysis results held in memory.",
+                             [({}, cache["size"])])
+    return lines
+
+@api_router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Request, executor and cache metrics in Prometheus text format"""
+    return PlainTextResponse(
+        request_metrics.render(_analysis_metric_lines()),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+@api_router.get("/startup")
+async def get_startup_report(top: int = Query(25, ge=1, le=500)):
+    """Import times per module and package, and how long each lazy service took to build"""
+    return {
+        **startup_report.as_dict(top),
+        "loaded": {
+            "analyzer": ma_analyzer.loaded,
+            "scenario_store": scenario_store.loaded,
+            "mongo_client": client.loaded
+        }
+    }
+
+@api_router.post("/ma/cache/invalidate")
+async def invalidate_cache(source: Optional[str] = None):
+    """Drop cached analyses that depend on an input source (all if omitted)"""
+    if _worker_caches():
+        raise HTTPException(
+            status_code=409,
+            detail="Analysis caches live in the executor's worker processes; restart the workers to clear them"
+        )
+    rendered_responses.invalidate()
+    return {"source": source, "invalidated": ma_analyzer.invalidate(source)}
+
 # Legacy endpoints
 @api_router.post("/status", response_model=StatusCheck)
 async def create_status_check(input: StatusCheckCreate):
     status_dict = input.model_dump()
     status_obj = StatusCheck(**status_dict)
     
+    # timestamp is stored as a native BSON datetime
     doc = status_obj.model_dump()
-    doc['timestamp'] = doc['timestamp'].isoformat()
     
     _ = await db.status_checks.insert_one(doc)
     return status_obj
 
+STATUS_SORT = [("timestamp", 1), ("id", 1)]
+
+def _encode_status_cursor(check: Dict) -> str:
+    timestamp = check["timestamp"]
+    if isinstance(timestamp, str):  # legacy document not yet converted to a BSON date
+        timestamp = datetime.fromisoformat(timestamp)
+    position = json.dumps([timestamp.isoformat(), check["id"]])
+    return base64.urlsafe_b64encode(position.encode()).decode()
+
+def _status_filter(cursor: Optional[str]) -> Dict:
+    """Checks strictly after the (timestamp, id) position encoded in `cursor`"""
+    if cursor is None:
+        return {}
+    try:
+        timestamp, check_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        timestamp = datetime.fromisoformat(timestamp)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return {"$or": [
+        {"timestamp": {"$gt": timestamp}},
+        {"timestamp": timestamp, "id": {"$gt": check_id}}
+    ]}
+
+async def _stream_status_checks(query: Dict, batch_size: int = 1000):
+    """Every matching check as NDJSON, one batch in memory at a time"""
+    cursor = db.status_checks.find(query, {"_id": 0}).sort(STATUS_SORT).batch_size(batch_size)
+    lines = []
+    async for check in cursor:
+        lines.append(dumps(check))
+        if len(lines) == batch_size:
+            yield b"\n".join(lines) + b"\n"
+            lines = []
+    if lines:
+        yield b"\n".join(lines) + b"\n"
+
 @api_router.get("/status", response_model=List[StatusCheck])
-async def get_status_checks():
-    status_checks = await db.status_checks.find({}, {"_id": 0}).to_list(1000)
-    
-    for check in status_checks:
-        if isinstance(check['timestamp'], str):
-            check['timestamp'] = datetime.fromisoformat(check['timestamp'])
+async def get_status_checks(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(default=1000, ge=1, le=1000),
+    format: str = Query(default="json", pattern="^(json|ndjson)$")
+):
+    """Status checks oldest first, a page at a time
+
+    Pass the X-Next-Cursor header of a page as `cursor` for the next one;
+    format=ndjson streams every check from the cursor on instead.
+    """
+    query = _status_filter(cursor)
+    if format == "ndjson":
+        return StreamingResponse(_stream_status_checks(query), media_type="application/x-ndjson")
     
+    status_checks = await db.status_checks.find(query, {"_id": 0}).sort(STATUS_SORT).to_list(limit + 1)
+    if len(status_checks) > limit:
+        status_checks = status_checks[:limit]
+        response.headers["X-Next-Cursor"] = _encode_status_cursor(status_checks[-1])
     return status_checks
 
+async def _prepare_status_checks():
+    """Index status checks for keyset paging and convert legacy ISO-string timestamps"""
+    from pymongo.errors import PyMongoError
+    try:
+        await db.status_checks.create_index(STATUS_SORT, name="timestamp_id")
+        migrated = await db.status_checks.update_many(
+            {"timestamp": {"$type": "string"}},
+            [{"$set": {"timestamp": {"$toDate": "$timestamp"}}}]
+        )
+        if migrated.modified_count:
+            logger.info("Converted %d status check timestamps to BSON dates", migrated.modified_count)
+    except PyMongoError as e:
+        logger.warning("Could not prepare status_checks collection: %s", e)
+
 # Include the router in the main app
 app.include_router(api_router)
 
@@ -179,8 +907,12 @@ app.add_middleware(
     allow_origins=os.environ.get('CORS_ORIGINS', '*').split(','),
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
+# Outermost, so CORS preflights and error responses are measured too
+app.add_middleware(MetricsMiddleware, metrics=request_metrics)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -188,6 +920,50 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Strong references to fire-and-forget tasks: the loop only keeps weak ones
+_background_tasks: Set[asyncio.Task] = set()
+
+def _log_task_failure(task: asyncio.Task) -> None:
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Background task %s failed", task.get_name(), exc_info=task.exception())
+
+def _spawn(coro, name: str) -> asyncio.Task:
+    """Run `coro` in the background, keeping it referenced and logging its failure"""
+    task = asyncio.get_running_loop().create_task(coro, name=name)
+    _background_tasks.add(task)
+    task.add_done_callback(_log_task_failure)
+    return task
+
+def _warm_analyzer():
+    analyzer = ma_analyzer.get()
+    with startup_report.phase("datasets"), startup_report.track_imports():
+        analyzer.comparables, analyzer.precedents
+
+async def _warm_up():
+    """Connect to Mongo and build the analyzer off the event loop, then log startup timings
+
+    Requests are served meanwhile; one that arrives first simply builds what it needs.
+    """
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, db.get)
+    if result_store is not None:
+        result_store.start()
+    _spawn(_prepare_status_checks(), "prepare_status_checks")
+    await loop.run_in_executor(None, _warm_analyzer)
+    startup_report.log(logger)
+
+@app.on_event("startup")
+async def start_background_tasks():
+    if os.environ.get('MA_WARM_UP', '1') != '0':
+        _spawn(_warm_up(), "warm_up")
+    elif result_store is not None:
+        result_store.start()
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
-    client.close()
\ No newline at end of file
+    if result_store is not None:
+        await result_store.stop()
+    if client.loaded:
+        client.close()
+    analysis_executor.shutdown()
\ No newline at end of file
@@ -0,0 +1,230 @@
+"""Incremental recomputation of M&A analyses when deal assumptions change"""
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Set, Union
+import math
+import threading
+import uuid
+
+from backend.data.comps_universe import CompsUniverse
+from backend.data.market_data import DEAL_ASSUMPTIONS
+from backend.data.precedent_store import PrecedentStore
+from backend.services.ma_analyzer import ANALYSIS_DEPENDENCIES, MAAnalyzer
+from backend.services.result_cache import ResultCache, fingerprint
+
+
+# Outputs tracked by a what-if scenario, keyed by the name returned to clients
+SCENARIO_OUTPUTS = {
+    "dcf": "calculate_dcf_valuation",
+    "comparable_companies": "get_comparable_companies_analysis",
+    "precedent_transactions": "get_precedent_transactions_analysis",
+    "synergies": "calculate_synergies",
+    "accretion_dilution": "calculate_accretion_dilution",
+    "valuation_summary": "get_valuation_summary",
+    "executive_summary": "get_executive_summary"
+}
+
+
+class AnalysisGraph:
+    """Dependency graph of analyses: inputs -> analyses -> downstream analyses"""
+
+    def __init__(self, dependencies: Dict[str, Dict] = ANALYSIS_DEPENDENCIES,
+                 nodes: Optional[List[str]] = None):
+        self.nodes = list(nodes or dependencies)
+        self.inputs = {n: set(dependencies[n]["inputs"]) for n in self.nodes}
+        self.upstream = {n: [u for u in dependencies[n]["upstream"] if u in self.inputs]
+                         for n in self.nodes}
+        self.downstream: Dict[str, Set[str]] = {n: set() for n in self.nodes}
+        for node, parents in self.upstream.items():
+            for parent in parents:
+                self.downstream[parent].add(node)
+        self.order = self._topological_order()
+
+    def _topological_order(self) -> List[str]:
+        order, visiting, done = [], set(), set()
+
+        def visit(node):
+            if node in done:
+                return
+            if node in visiting:
+                raise ValueError(f"Dependency cycle at {node}")
+            visiting.add(node)
+            for parent in self.upstream[node]:
+                visit(parent)
+            visiting.discard(node)
+            done.add(node)
+            order.append(node)
+
+        for node in self.nodes:
+            visit(node)
+        return order
+
+    def affected(self, changed_inputs: Set[str]) -> List[str]:
+        """Analyses that read a changed input, plus everything downstream, in order"""
+        dirty = {n for n, inputs in self.inputs.items() if inputs & changed_inputs}
+        pending = list(dirty)
+        while pending:
+            for child in self.downstream[pending.pop()]:
+                if child not in dirty:
+                    dirty.add(child)
+                    pending.append(child)
+        return [n for n in self.order if n in dirty]
+
+
+SCENARIO_GRAPH = AnalysisGraph(nodes=list(SCENARIO_OUTPUTS.values()))
+
+
+# Accepted range of each deal assumption (every year, for growth_rates);
+# None leaves that side open
+ASSUMPTION_RANGES = {
+    "growth_rates": (-0.5, 1.0),
+    "ebitda_margin": (-1.0, 1.0),
+    "da_percent": (0.0, 1.0),
+    "capex_percent": (0.0, 1.0),
+    "nwc_percent": (0.0, 1.0),
+    "cost_of_debt": (0.0, 0.5),
+    "cross_sell_rate": (0.0, 1.0),
+    "cost_synergy_percent": (0.0, 1.0),
+    "one_time_costs": (0.0, None),
+    "deal_value": (0.0, None),
+    "stock_consideration_percent": (0.0, 1.0),
+    "acquisition_premium": (0.0, 5.0),
+    "dcf_weight": (0.0, 1.0),
+    "comps_weight": (0.0, 1.0),
+    "precedents_weight": (0.0, 1.0)
+}
+_WEIGHTS = ("dcf_weight", "comps_weight", "precedents_weight")
+
+
+def validate_assumptions(delta: Dict, base: Dict) -> None:
+    """Reject unknown keys, values shaped unlike the base assumption, and out-of-range values
+
+    A list assumption (e.g. growth_rates) must stay a list of the same
+    length and a scalar a number, each within ASSUMPTION_RANGES; the
+    valuation weights must still sum to one once the delta is applied.
+    """
+    unknown = set(delta) - set(base)
+    if unknown:
+        raise ValueError(f"Unknown assumptions: {sorted(unknown)}")
+    for key, value in delta.items():
+        expected = base[key]
+        if isinstance(expected, list):
+            if not isinstance(value, list) or len(value) != len(expected):
+                raise ValueError(f"{key} must be a list of {len(expected)} numbers")
+            values = value
+        else:
+            values = [value]
+        if any(isinstance(v, (list, bool)) or not isinstance(v, (int, float)) for v in values):
+            raise ValueError(f"{key} must be {'a list of numbers' if values is value else 'a number'}")
+        low, high = ASSUMPTION_RANGES.get(key, (None, None))
+        if any(not math.isfinite(v) or (low is not None and v < low) or (high is not None and v > high)
+               for v in values):
+            bounds = f"between {low:g} and {high:g}" if high is not None else f"at least {low:g}"
+            raise ValueError(f"{key} must be {bounds}")
+    if any(key in delta for key in _WEIGHTS):
+        total = sum({**base, **delta}[key] for key in _WEIGHTS)
+        if not math.isclose(total, 1.0, abs_tol=1e-9):
+            raise ValueError(f"Valuation weights must sum to 1, got {total:g}")
+
+
+class ScenarioSession:
+    """A what-if session: its own assumptions and the last value of each output
+
+    Only analyses downstream of a changed assumption are re-run; clean
+    upstream results come from the session's cache.
+    """
+
+    def __init__(self, assumptions: Optional[Dict] = None, graph: AnalysisGraph = SCENARIO_GRAPH,
+                 comparables: Union[CompsUniverse, Callable[[], CompsUniverse], None] = None,
+                 precedents: Union[PrecedentStore, Callable[[], PrecedentStore], None] = None):
+        self.id = str(uuid.uuid4())
+        self.graph = graph
+        self.analyzer = MAAnalyzer(assumptions=assumptions, cache=ResultCache(maxsize=64),
+                                   comparables=comparables, precedents=precedents)
+        self.outputs: Dict[str, Dict] = {}
+        self._fingerprints: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        with self._lock:
+            self._evaluate(self.graph.order)
+
+    def _evaluate(self, nodes: List[str]) -> Dict[str, Dict]:
+        changed = {}
+        for label, method in SCENARIO_OUTPUTS.items():
+            if method not in nodes:
+                continue
+            value = getattr(self.analyzer, method)()
+            digest = fingerprint(value)
+            if self._fingerprints.get(label) != digest:
+                self._fingerprints[label] = digest
+                self.outputs[label] = value
+                changed[label] = value
+        return changed
+
+    def apply(self, delta: Dict) -> Dict:
+        """Apply an assumption delta and return only the outputs that changed
+        
+        The delta is all or nothing: if any recomputation fails, the session
+        keeps its previous assumptions and outputs.
+        """
+        with self._lock:
+            current = self.analyzer.assumptions
+            validate_assumptions(delta, current)
+            changed_inputs = {
+                f"assumptions.{key}" for key, value in delta.items()
+                if fingerprint(current[key]) != fingerprint(value)
+            }
+            outputs, fingerprints = dict(self.outputs), dict(self._fingerprints)
+            self.analyzer.assumptions = {**current, **delta}
+            recomputed = self.graph.affected(changed_inputs)
+            try:
+                changed = self._evaluate(recomputed)
+            except Exception:
+                self.analyzer.assumptions = current
+                self.outputs, self._fingerprints = outputs, fingerprints
+                raise
+        return {
+            "scenario_id": self.id,
+            "changed_inputs": sorted(i.split(".", 1)[1] for i in changed_inputs),
+            "recomputed": [label for label, m in SCENARIO_OUTPUTS.items() if m in recomputed],
+            "outputs": changed
+        }
+
+    def state(self) -> Dict:
+        return {
+            "scenario_id": self.id,
+            "assumptions": self.analyzer.assumptions,
+            "outputs": self.outputs
+        }
+
+
+class ScenarioStore:
+    """Bounded, least-recently-used set of live scenario sessions"""
+
+    def __init__(self, max_sessions: int = 100,
+                 comparables: Union[CompsUniverse, Callable[[], CompsUniverse], None] = None,
+                 precedents: Union[PrecedentStore, Callable[[], PrecedentStore], None] = None):
+        self.max_sessions = max_sessions
+        self.comparables = comparables
+        self.precedents = precedents
+        self._sessions: "OrderedDict[str, ScenarioSession]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self, assumptions: Optional[Dict] = None) -> ScenarioSession:
+        validate_assumptions(assumptions or {}, DEAL_ASSUMPTIONS)
+        session = ScenarioSession(assumptions, comparables=self.comparables,
+                                  precedents=self.precedents)
+        with self._lock:
+            self._sessions[session.id] = session
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        return session
+
+    def get(self, scenario_id: str) -> Optional[ScenarioSession]:
+        with self._lock:
+            session = self._sessions.get(scenario_id)
+            if session is not None:
+                self._sessions.move_to_end(scenario_id)
+            return session
+
+    def delete(self, scenario_id: str) -> bool:
+        with self._lock:
+            return self._sessions.pop(scenario_id, None) is not None
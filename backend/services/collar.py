@@ -0,0 +1,105 @@
+"""Exchange-ratio structures between signing and close, valued over simulated share prices"""
+from typing import Dict
+import numpy as np
+
+
+TRADING_DAYS_PER_YEAR = 252
+
+# Stock consideration terms: how many acquirer shares a target share gets
+# for the stock portion of the offer, given the acquirer's measured price
+# (its average over the pricing window before close).
+#   fixed_ratio            ratio set at signing; value floats with the acquirer
+#   floating_ratio         value set at signing; the ratio absorbs price moves
+#   fixed_ratio_collar     fixed ratio inside the collar, fixed value outside it
+#   floating_ratio_collar  fixed value inside the collar, fixed ratio outside it
+EXCHANGE_STRUCTURES = ("fixed_ratio", "floating_ratio", "fixed_ratio_collar", "floating_ratio_collar")
+
+# Price process defaults; the company data carries spot prices but no
+# volatilities, so these are typical large-cap software figures
+DEFAULT_PRICE_PROCESS = {
+    "acquirer_volatility": 0.30,
+    "target_volatility": 0.35,
+    "correlation": 0.5
+}
+
+
+def simulate_pricing_window(
+    rng: np.random.Generator,
+    n_paths: int,
+    acquirer_price: float,
+    target_price: float,
+    acquirer_volatility: float,
+    target_volatility: float,
+    correlation: float,
+    drift: float,
+    days_to_close: int,
+    averaging_days: int
+) -> Dict[str, np.ndarray]:
+    """Correlated GBM prices for the acquirer and target at daily steps
+
+    Only the last averaging_days steps (the pricing window, ending on the
+    closing day) are needed by the exchange terms, so the days before the
+    window are drawn as a single GBM increment, which has exactly the same
+    distribution as compounding them day by day. Every call draws one
+    (n_paths, averaging_days + 1, 2) block from rng, so splitting paths
+    into chunks does not change the draws (though statistics summarised
+    chunk by chunk, like histogram percentiles, can still differ slightly).
+
+    Returns the acquirer's average price over the window and both closing
+    prices, one value per path.
+    """
+    if not 1 <= averaging_days <= days_to_close:
+        raise ValueError("averaging_days must be between 1 and days_to_close")
+    if not -1 <= correlation <= 1:
+        raise ValueError("correlation must be between -1 and 1")
+    dt = 1.0 / TRADING_DAYS_PER_YEAR
+    step_years = np.full(averaging_days + 1, dt)
+    step_years[0] = (days_to_close - averaging_days) * dt
+    step_scale = np.sqrt(step_years)
+    years = days_to_close * dt
+
+    z = rng.standard_normal((n_paths, averaging_days + 1, 2))
+    acquirer_z, own_z = z[..., 0], z[..., 1]
+    acquirer_log = np.cumsum(
+        acquirer_z * (acquirer_volatility * step_scale) +
+        (drift - acquirer_volatility ** 2 / 2) * step_years,
+        axis=1
+    )
+    acquirer_window = acquirer_price * np.exp(acquirer_log[:, 1:])
+    # Only the target's closing price matters, so its increments are just
+    # summed; its shock loads on the acquirer's by the correlation
+    target_shock = correlation * (acquirer_z @ step_scale) + np.sqrt(1 - correlation ** 2) * (own_z @ step_scale)
+    target_close = target_price * np.exp(
+        target_volatility * target_shock + (drift - target_volatility ** 2 / 2) * years
+    )
+
+    return {
+        "acquirer_average": acquirer_window.mean(axis=1),
+        "acquirer_close": acquirer_window[:, -1],
+        "target_close": target_close
+    }
+
+
+def exchange_ratios(
+    measured_price: np.ndarray,
+    stock_value: float,
+    signing_price: float,
+    collar_lower: float,
+    collar_upper: float
+) -> Dict[str, np.ndarray]:
+    """Acquirer shares per target share under each exchange structure
+
+    stock_value is the stock portion of the offer per target share at
+    signing; the collar bounds are fractions of the acquirer's signing price.
+    """
+    if not 0 < collar_lower <= 1 <= collar_upper:
+        raise ValueError("The collar must satisfy 0 < collar_lower <= 1 <= collar_upper")
+    measured_price = np.asarray(measured_price, dtype=float)
+    banded = np.clip(measured_price, collar_lower * signing_price, collar_upper * signing_price)
+    fixed = stock_value / signing_price
+    return {
+        "fixed_ratio": np.full(measured_price.shape, fixed),
+        "floating_ratio": stock_value / measured_price,
+        "fixed_ratio_collar": fixed * banded / measured_price,
+        "floating_ratio_collar": stock_value / banded
+    }
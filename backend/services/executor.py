@@ -0,0 +1,147 @@
+"""Run CPU-bound analyses off the asyncio event loop"""
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+import asyncio
+import threading
+import time
+
+
+class ExecutorBusyError(RuntimeError):
+    """Raised when the executor queue is full and a call is rejected"""
+
+
+# Analyzer owned by each worker process in process-pool mode
+_worker_analyzer = None
+
+
+def _init_worker(factory: Callable[[], Any]) -> None:
+    global _worker_analyzer
+    _worker_analyzer = factory()
+
+
+def _timed_call(target: Any, method: str, args: Tuple, kwargs: Dict) -> Tuple[float, Any]:
+    """Run `method` on `target` (or the worker's analyzer); return (start time, result)"""
+    started = time.time()
+    obj = _worker_analyzer if target is None else target
+    func = getattr(obj, method) if method else obj
+    return started, func(*args, **kwargs)
+
+
+class _EndpointStats:
+    __slots__ = ("calls", "rejected", "errors", "wait_total", "wait_max", "run_total", "run_max")
+
+    def __init__(self):
+        self.calls = self.rejected = self.errors = 0
+        self.wait_total = self.wait_max = self.run_total = self.run_max = 0.0
+
+    def as_dict(self) -> Dict:
+        return {
+            "calls": self.calls,
+            "rejected": self.rejected,
+            "errors": self.errors,
+            "avg_queue_wait_ms": self.wait_total / self.calls * 1000 if self.calls else 0.0,
+            "max_queue_wait_ms": self.wait_max * 1000,
+            "avg_run_ms": self.run_total / self.calls * 1000 if self.calls else 0.0,
+            "max_run_ms": self.run_max * 1000
+        }
+
+
+class AnalysisExecutor:
+    """Bounded thread- or process-pool executor for analysis calls
+
+    At most max_workers calls run at once and at most max_queue more wait;
+    further calls are rejected with ExecutorBusyError so callers can shed
+    load instead of piling up. In process mode every worker builds its own
+    analyzer with `analyzer_factory` (and so keeps its own result cache);
+    calls to in-process callables always run on threads.
+    """
+
+    def __init__(
+        self,
+        analyzer: Any,
+        kind: str = "thread",
+        max_workers: int = 4,
+        max_queue: int = 32,
+        analyzer_factory: Optional[Callable[[], Any]] = None
+    ):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown executor kind: {kind}")
+        if kind == "process" and analyzer_factory is None:
+            raise ValueError("Process executors need an analyzer_factory")
+        self.analyzer = analyzer
+        self.kind = kind
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._threads = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="analysis")
+        self._processes = ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_worker, initargs=(analyzer_factory,)
+        ) if kind == "process" else None
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._stats: Dict[str, _EndpointStats] = {}
+
+    def _endpoint(self, name: str) -> _EndpointStats:
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats.setdefault(name, _EndpointStats())
+        return stats
+
+    async def run(self, endpoint: str, method: str, *args, **kwargs) -> Any:
+        """Call an analyzer method in the pool"""
+        if self._processes is not None:
+            return await self._submit(endpoint, self._processes, None, method, args, kwargs)
+        return await self._submit(endpoint, self._threads, self.analyzer, method, args, kwargs)
+
+    async def run_callable(self, endpoint: str, func: Callable, *args, **kwargs) -> Any:
+        """Call an in-process function (e.g. a stateful session) on a worker thread"""
+        return await self._submit(endpoint, self._threads, func, "", args, kwargs)
+
+    async def _submit(self, endpoint, pool, target, method, args, kwargs) -> Any:
+        stats = self._endpoint(endpoint)
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                stats.rejected += 1
+            raise ExecutorBusyError("Analysis queue is full, retry shortly")
+
+        submitted = time.time()
+        with self._lock:
+            self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            started, result = await loop.run_in_executor(
+                pool, _timed_call, target, method, args, kwargs
+            )
+            finished = time.time()
+            with self._lock:
+                stats.calls += 1
+                wait = max(started - submitted, 0.0)
+                stats.wait_total += wait
+                stats.wait_max = max(stats.wait_max, wait)
+                stats.run_total += finished - started
+                stats.run_max = max(stats.run_max, finished - started)
+            return result
+        except Exception:
+            with self._lock:
+                stats.errors += 1
+            raise
+        finally:
+            with self._lock:
+                self._pending -= 1
+            self._slots.release()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "kind": self.kind,
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "in_flight": self._pending,
+                "queued": max(self._pending - self.max_workers, 0),
+                "endpoints": {name: s.as_dict() for name, s in self._stats.items()}
+            }
+
+    def shutdown(self) -> None:
+        self._threads.shutdown(wait=False, cancel_futures=True)
+        if self._processes is not None:
+            self._processes.shutdown(wait=False, cancel_futures=True)
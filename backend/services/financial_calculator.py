@@ -1,9 +1,149 @@
 """Financial calculations for M&A analysis"""
 import numpy as np
-from typing import List, Dict
+from typing import List, Dict, Union
 import math
 
 
+ArrayLike = Union[float, List[float], np.ndarray]
+
+
+def _scenario_column(value: ArrayLike) -> np.ndarray:
+    """An assumption shaped to broadcast against (scenarios, years) arrays"""
+    arr = np.asarray(value, dtype=float)
+    if arr.ndim == 1:
+        return arr[:, None]
+    return arr
+
+
+# Rates probed for a sign change of NPV before an IRR is polished
+_IRR_BRACKET_RATES = np.array([
+    -0.99, -0.9, -0.75, -0.5, -0.3, -0.2, -0.1, -0.05, 0.0, 0.025, 0.05, 0.075, 0.1,
+    0.15, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.5, 5.0, 10.0, 100.0
+])
+
+
+def _rate_column(rate: ArrayLike) -> np.ndarray:
+    """A scalar rate, or one rate per stream, shaped (streams, 1)"""
+    return np.asarray(rate, dtype=float).reshape(-1, 1)
+
+
+def _year_fractions(dates: ArrayLike) -> np.ndarray:
+    """Years from each row's first date, Actual/365"""
+    days = np.asarray(dates, dtype="datetime64[D]").astype(np.int64)
+    first = days[..., :1]
+    return (days - first) / 365.0
+
+
+def _discount_factors(rates: np.ndarray, times: np.ndarray) -> np.ndarray:
+    """(1 + rate) ** -time; NaN for rates at or below -100%"""
+    with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
+        return np.exp(-times * np.log1p(np.where(rates > -1.0, rates, np.nan)))
+
+
+def _npv_and_derivative(flows: np.ndarray, rates: np.ndarray, times: np.ndarray):
+    """NPV and dNPV/drate of (streams, periods) flows at (streams, 1) rates
+
+    times is (periods,) when every stream shares its timing, else
+    (streams, periods).
+    """
+    discounted = flows * _discount_factors(rates, times)
+    with np.errstate(over="ignore", invalid="ignore"):
+        npv = discounted.sum(axis=1)
+        derivative = -(discounted * times).sum(axis=1) / (1.0 + rates[:, 0])
+    return npv, derivative
+
+
+def _solve_rate(flows: np.ndarray, times: np.ndarray, guess: float, tol: float,
+                max_iterations: int) -> Dict:
+    """Discount rate zeroing each row's NPV, by safeguarded Newton iteration
+
+    Each row is first bracketed: NPV is evaluated over _IRR_BRACKET_RATES and
+    the sign change nearest `guess` is kept (streams with several sign
+    changes can have several IRRs). Newton steps that leave the bracket are
+    replaced by a secant or bisection step inside it, so every bracketed row
+    converges; rows converge independently and drop out of the iteration.
+    Rows with no sign change have no IRR and come back as NaN.
+
+    Returns 'irr' (streams,), 'converged' (streams,) bools, 'iterations'
+    per row and 'failed_rows', the indices of rows without a converged IRR.
+    """
+    n_rows = flows.shape[0]
+    shared_times = times.ndim == 1
+    if not shared_times:
+        times = np.broadcast_to(times, flows.shape)
+
+    # Bracket: NPV at every probe rate, (rows, probes); one matrix product
+    # when every row has the same timing
+    with np.errstate(over="ignore", invalid="ignore"):
+        if shared_times:
+            probes = flows @ _discount_factors(_IRR_BRACKET_RATES[None, :], times[:, None])
+        else:
+            probes = np.column_stack([
+                (flows * _discount_factors(rate, times)).sum(axis=1) for rate in _IRR_BRACKET_RATES
+            ])
+    finite = np.isfinite(probes)
+    sign_change = finite[:, :-1] & finite[:, 1:] & (np.sign(probes[:, :-1]) != np.sign(probes[:, 1:]))
+    midpoints = (_IRR_BRACKET_RATES[:-1] + _IRR_BRACKET_RATES[1:]) / 2
+    distance = np.where(sign_change, np.abs(midpoints - guess), np.inf)
+    interval = distance.argmin(axis=1)
+    bracketed = sign_change[np.arange(n_rows), interval]
+
+    lo = _IRR_BRACKET_RATES[interval]
+    hi = _IRR_BRACKET_RATES[interval + 1]
+    f_lo = probes[np.arange(n_rows), interval]
+    f_hi = probes[np.arange(n_rows), interval + 1]
+    # Start from the secant through the bracket ends
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rate = lo - f_lo * (hi - lo) / (f_hi - f_lo)
+    rate = np.where(np.isfinite(rate), rate, (lo + hi) / 2)
+
+    irr = np.full(n_rows, np.nan)
+    converged = np.zeros(n_rows, dtype=bool)
+    iterations = np.zeros(n_rows, dtype=np.int64)
+    # Exact roots at a probe rate need no iteration
+    exact = bracketed & (f_lo == 0)
+    irr[exact] = lo[exact]
+    converged[exact] = True
+
+    active = np.flatnonzero(bracketed & ~exact)
+    for _ in range(max_iterations):
+        if active.size == 0:
+            break
+        r = rate[active]
+        f, df = _npv_and_derivative(flows[active], r[:, None], times if shared_times else times[active])
+        iterations[active] += 1
+
+        # Shrink the bracket around the root
+        same_side = np.sign(f) == np.sign(f_lo[active])
+        lo[active] = np.where(same_side, r, lo[active])
+        f_lo[active] = np.where(same_side, f, f_lo[active])
+        hi[active] = np.where(same_side, hi[active], r)
+        f_hi[active] = np.where(same_side, f_hi[active], f)
+        low, high = lo[active], hi[active]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            newton = r - f / df
+            secant = low - f_lo[active] * (high - low) / (f_hi[active] - f_lo[active])
+        # A Newton step this small means r is the root (checked before the
+        # bracket test, which rounding can fail right at the root)
+        done = (f == 0) | (np.abs(newton - r) <= tol * (1 + np.abs(r)))
+        irr[active[done]] = np.where(f == 0, r, newton)[done]
+        converged[active[done]] = True
+
+        # Newton if it stays in the bracket, else the bracket's secant, else bisection
+        step = np.where(np.isfinite(secant) & (secant > low) & (secant < high), secant, (low + high) / 2)
+        step = np.where(np.isfinite(newton) & (newton > low) & (newton < high), newton, step)
+        rate[active] = step
+        active = active[~done]
+
+    return {
+        'irr': irr,
+        'converged': converged,
+        'iterations': iterations,
+        'failed_rows': np.flatnonzero(~converged)
+    }
+
+
 class FinancialCalculator:
     
     @staticmethod
@@ -41,11 +181,69 @@ class FinancialCalculator:
     
     @staticmethod
     def calculate_npv(cash_flows: List[float], discount_rate: float) -> float:
-        """Calculate Net Present Value"""
-        npv = 0
-        for i, cf in enumerate(cash_flows, 1):
-            npv += cf / ((1 + discount_rate) ** i)
-        return npv
+        """Calculate Net Present Value (first cash flow one period out)"""
+        flows = np.asarray(cash_flows, dtype=float)
+        return float(flows @ (1.0 + discount_rate) ** -np.arange(1.0, flows.size + 1.0))
+    
+    @staticmethod
+    def calculate_npv_batch(
+        cash_flows: ArrayLike,
+        discount_rate: ArrayLike,
+        first_period: int = 1
+    ) -> np.ndarray:
+        """NPV of many cash-flow streams at once
+
+        cash_flows is a (periods,) stream or a (streams, periods) array;
+        discount_rate is a scalar or one rate per stream. The first cash flow
+        falls `first_period` periods out (1 as in calculate_npv, 0 when it is
+        the initial investment). Returns one NPV per stream.
+        """
+        flows = np.atleast_2d(np.asarray(cash_flows, dtype=float))
+        times = np.arange(first_period, first_period + flows.shape[1], dtype=float)
+        return (flows * _discount_factors(_rate_column(discount_rate), times)).sum(axis=1)
+    
+    @staticmethod
+    def calculate_irr_batch(
+        cash_flows: ArrayLike,
+        guess: float = 0.10,
+        tol: float = 1e-10,
+        max_iterations: int = 100
+    ) -> Dict:
+        """Internal rate of return of many cash-flow streams at once
+
+        cash_flows is a (periods,) stream or a (streams, periods) array whose
+        first column is the time-0 flow (usually the investment). See
+        _solve_rate for the method and the returned fields.
+        """
+        flows = np.atleast_2d(np.asarray(cash_flows, dtype=float))
+        times = np.arange(flows.shape[1], dtype=float)
+        return _solve_rate(flows, times, guess, tol, max_iterations)
+    
+    @staticmethod
+    def calculate_xnpv_batch(
+        cash_flows: ArrayLike,
+        dates: ArrayLike,
+        discount_rate: ArrayLike
+    ) -> np.ndarray:
+        """NPV of dated cash flows, discounted Actual/365 to the first date
+
+        dates matches cash_flows in shape, or is one (periods,) row of dates
+        shared by every stream (datetime64, date objects or ISO strings).
+        """
+        flows = np.atleast_2d(np.asarray(cash_flows, dtype=float))
+        return (flows * _discount_factors(_rate_column(discount_rate), _year_fractions(dates))).sum(axis=1)
+    
+    @staticmethod
+    def calculate_xirr_batch(
+        cash_flows: ArrayLike,
+        dates: ArrayLike,
+        guess: float = 0.10,
+        tol: float = 1e-10,
+        max_iterations: int = 100
+    ) -> Dict:
+        """IRR of dated cash flows (Actual/365 from the first date), per stream"""
+        flows = np.atleast_2d(np.asarray(cash_flows, dtype=float))
+        return _solve_rate(flows, _year_fractions(dates), guess, tol, max_iterations)
     
     @staticmethod
     def calculate_pv(future_value: float, discount_rate: float, periods: int) -> float:
@@ -172,6 +370,169 @@ class FinancialCalculator:
             'value_per_share': value_per_share
         }
     
+    @staticmethod
+    def project_financials_batch(
+        base_revenue: ArrayLike,
+        growth_rates: ArrayLike,
+        ebitda_margin: ArrayLike,
+        tax_rate: ArrayLike,
+        da_percent_revenue: ArrayLike,
+        capex_percent_revenue: ArrayLike,
+        nwc_percent_revenue: ArrayLike
+    ) -> Dict[str, np.ndarray]:
+        """Project financial statements for many scenarios at once
+
+        Assumptions are scalars, per-scenario vectors or (scenarios, years) arrays.
+        """
+        growth = np.atleast_2d(np.asarray(growth_rates, dtype=float))
+        base = _scenario_column(base_revenue)
+        margin = _scenario_column(ebitda_margin)
+        tax = _scenario_column(tax_rate)
+        da_pct = _scenario_column(da_percent_revenue)
+        capex_pct = _scenario_column(capex_percent_revenue)
+        nwc_pct = _scenario_column(nwc_percent_revenue)
+
+        n_scenarios = np.broadcast_shapes(
+            growth.shape[:1], *(np.shape(a)[:1] for a in
+                                (base, margin, tax, da_pct, capex_pct, nwc_pct)
+                                if np.ndim(a) == 2)
+        )[0]
+        shape = (n_scenarios, growth.shape[1])
+
+        revenue = np.broadcast_to(base * np.cumprod(1 + growth, axis=1), shape)
+        ebitda = revenue * margin
+        da = revenue * da_pct
+        ebit = ebitda - da
+        nopat = ebit * (1 - tax)
+        capex = revenue * capex_pct
+
+        nwc = revenue * nwc_pct
+        opening_nwc = base * (nwc_pct[:, :1] if np.ndim(nwc_pct) == 2 else nwc_pct)
+        prev_nwc = np.concatenate(
+            [np.broadcast_to(opening_nwc, (n_scenarios, 1)), nwc[:, :-1]], axis=1
+        )
+        nwc_change = nwc - prev_nwc
+
+        fcf = nopat + da - capex - nwc_change
+
+        return {
+            'revenue': revenue,
+            'ebitda': ebitda,
+            'ebit': ebit,
+            'nopat': nopat,
+            'da': da,
+            'capex': capex,
+            'nwc_change': nwc_change,
+            'fcf': fcf
+        }
+
+    @staticmethod
+    def calculate_dcf_valuation_batch(
+        base_revenue: ArrayLike,
+        growth_rates: ArrayLike,
+        ebitda_margin: ArrayLike,
+        tax_rate: ArrayLike,
+        da_percent_revenue: ArrayLike,
+        capex_percent_revenue: ArrayLike,
+        nwc_percent_revenue: ArrayLike,
+        wacc: ArrayLike,
+        terminal_growth_rate: ArrayLike,
+        net_debt: ArrayLike,
+        shares_outstanding: ArrayLike
+    ) -> Dict:
+        """calculate_dcf_valuation over many assumption sets at once"""
+        projections = FinancialCalculator.project_financials_batch(
+            base_revenue, growth_rates, ebitda_margin, tax_rate,
+            da_percent_revenue, capex_percent_revenue, nwc_percent_revenue
+        )
+        fcf = projections['fcf']
+        n_years = fcf.shape[1]
+
+        wacc = np.asarray(wacc, dtype=float)
+        terminal_growth = np.asarray(terminal_growth_rate, dtype=float)
+        net_debt = np.asarray(net_debt, dtype=float)
+        shares = np.asarray(shares_outstanding, dtype=float)
+
+        # Scenarios that only differ in discounting share one projection row
+        n_scenarios = np.broadcast_shapes(
+            fcf.shape[:1], wacc.shape, terminal_growth.shape,
+            net_debt.shape, shares.shape
+        )[0]
+        shape = (n_scenarios, n_years)
+        projections = {k: np.broadcast_to(v, shape) for k, v in projections.items()}
+        fcf = projections['fcf']
+
+        # Discount factors (scenarios, years)
+        periods = np.arange(1, n_years + 1)
+        discount = (1 + wacc[..., None]) ** -periods
+        pv_fcf = fcf * discount
+
+        # Terminal Value and its PV
+        terminal_value = (fcf[:, -1] * (1 + terminal_growth)) / \
+                         (wacc - terminal_growth)
+        pv_terminal_value = terminal_value * discount[..., -1]
+
+        enterprise_value = pv_fcf.sum(axis=1) + pv_terminal_value
+        equity_value = enterprise_value - net_debt
+        value_per_share = equity_value / shares
+
+        return {
+            'projections': projections,
+            'pv_fcf': pv_fcf,
+            'terminal_value': terminal_value,
+            'pv_terminal_value': pv_terminal_value,
+            'enterprise_value': enterprise_value,
+            'equity_value': equity_value,
+            'value_per_share': value_per_share
+        }
+
+    @staticmethod
+    def calculate_dcf_sensitivity_grid(
+        fcf: List[float],
+        wacc_values: ArrayLike,
+        terminal_growth_values: ArrayLike,
+        net_debt: float,
+        shares_outstanding: float,
+        final_ebitda: float = None,
+        exit_multiples: ArrayLike = None
+    ) -> Dict[str, np.ndarray]:
+        """Two-way DCF sensitivity over WACC x terminal growth (and exit multiple)
+
+        The projected FCF path is shared, so the grid is one broadcasted
+        computation. Cells where WACC <= terminal growth have no perpetuity
+        value and are returned as NaN.
+        """
+        fcf = np.asarray(fcf, dtype=float)
+        wacc = np.asarray(wacc_values, dtype=float)[:, None]
+        growth = np.asarray(terminal_growth_values, dtype=float)[None, :]
+        n_years = fcf.size
+
+        discount = (1 + wacc) ** -np.arange(1, n_years + 1)
+        sum_pv_fcf = (fcf * discount).sum(axis=1, keepdims=True)
+        final_discount = discount[:, -1:]
+
+        valid = wacc > growth
+        with np.errstate(divide='ignore', invalid='ignore'):
+            terminal_value = np.where(
+                valid, fcf[-1] * (1 + growth) / (wacc - growth), np.nan
+            )
+        enterprise_value = sum_pv_fcf + terminal_value * final_discount
+        grid = {
+            'enterprise_value': enterprise_value,
+            'value_per_share': (enterprise_value - net_debt) / shares_outstanding,
+            'valid': valid
+        }
+
+        if exit_multiples is not None:
+            if final_ebitda is None:
+                raise ValueError("final_ebitda is required for exit multiple sensitivity")
+            multiples = np.asarray(exit_multiples, dtype=float)[None, :]
+            exit_ev = sum_pv_fcf + final_ebitda * multiples * final_discount
+            grid['exit_multiple_enterprise_value'] = exit_ev
+            grid['exit_multiple_value_per_share'] = (exit_ev - net_debt) / shares_outstanding
+
+        return grid
+
     @staticmethod
     def calculate_multiples(
         market_cap: float,
@@ -217,6 +578,123 @@ class FinancialCalculator:
             'net_synergy_value': net_synergy_value
         }
     
+    @staticmethod
+    def calculate_deal_outcomes_batch(
+        acquirer_net_income: ArrayLike,
+        target_net_income: ArrayLike,
+        acquirer_shares: ArrayLike,
+        acquirer_share_price: ArrayLike,
+        target_shares: ArrayLike,
+        target_share_price: ArrayLike,
+        premium: ArrayLike,
+        stock_percent: ArrayLike,
+        total_synergies: ArrayLike,
+        one_time_costs: ArrayLike,
+        tax_rate: ArrayLike,
+        financing_rate: ArrayLike = 0.0,
+        target_value_per_share: ArrayLike = np.nan
+    ) -> Dict[str, np.ndarray]:
+        """Deal terms to pro forma EPS for many scenarios at once
+
+        The offer follows the premium and its cash portion is financed at financing_rate.
+        """
+        premium = np.asarray(premium, dtype=float)
+        stock_percent = np.asarray(stock_percent, dtype=float)
+        offer_price = np.asarray(target_share_price, dtype=float) * (1 + premium)
+        deal_value = offer_price * target_shares
+        stock_consideration = deal_value * stock_percent
+        cash_consideration = deal_value - stock_consideration
+        new_shares = stock_consideration / acquirer_share_price
+        financing_cost = cash_consideration * financing_rate * (1 - np.asarray(tax_rate, dtype=float))
+        synergies_after_tax = (np.asarray(total_synergies, dtype=float) - one_time_costs) * (1 - tax_rate)
+
+        eps = FinancialCalculator.calculate_accretion_dilution(
+            acquirer_net_income=acquirer_net_income,
+            target_net_income=target_net_income,
+            acquirer_shares=acquirer_shares,
+            synergies_after_tax=synergies_after_tax - financing_cost,
+            new_shares_issued=new_shares
+        )
+        pro_forma_shares = acquirer_shares + new_shares
+        with np.errstate(divide="ignore", invalid="ignore"):
+            premium_to_value = (offer_price / target_value_per_share - 1) * 100
+
+        return {
+            'offer_price_per_share': offer_price,
+            'deal_value': deal_value,
+            'cash_consideration': cash_consideration,
+            'stock_consideration': stock_consideration,
+            'new_shares_issued': new_shares,
+            'financing_cost_after_tax': financing_cost,
+            'synergies_after_tax': synergies_after_tax,
+            'acquirer_standalone_eps': eps['acquirer_standalone_eps'],
+            'pro_forma_eps': eps['combined_eps_with_synergies'],
+            'accretion_dilution_percent': eps['accretion_dilution_percent'],
+            'target_ownership_percent': new_shares / pro_forma_shares * 100,
+            'premium_to_value_percent': premium_to_value
+        }
+    
+    @staticmethod
+    def calculate_accretion_dilution_batch(
+        acquirer_net_income: ArrayLike,
+        target_net_income: ArrayLike,
+        acquirer_shares: ArrayLike,
+        acquirer_share_price: ArrayLike,
+        deal_value: ArrayLike,
+        stock_percent: ArrayLike,
+        financing_rate: ArrayLike,
+        tax_rate: ArrayLike,
+        run_rate_synergies: ArrayLike,
+        synergy_phase_in: ArrayLike,
+        one_time_costs: ArrayLike = 0.0
+    ) -> Dict[str, np.ndarray]:
+        """Pro forma EPS over a projection horizon for many deal structures
+
+        Net incomes, synergy_phase_in (fraction of run-rate synergies
+        realised each year) and one_time_costs are (years,) paths shared by
+        every scenario or (scenarios, years) arrays. The deal terms, rates and
+        run-rate synergies are scalars or one value per scenario. New shares
+        are issued once at close; the cash portion is debt-financed and its
+        after-tax interest is charged every year. Every output has shape
+        (scenarios, years).
+        """
+        acquirer_ni = np.atleast_2d(np.asarray(acquirer_net_income, dtype=float))
+        target_ni = np.atleast_2d(np.asarray(target_net_income, dtype=float))
+        phase_in = np.atleast_2d(np.asarray(synergy_phase_in, dtype=float))
+        one_time = np.atleast_2d(np.asarray(one_time_costs, dtype=float))
+        deal_value = _scenario_column(deal_value)
+        stock_percent = _scenario_column(stock_percent)
+        tax = _scenario_column(tax_rate)
+
+        new_shares = deal_value * stock_percent / _scenario_column(acquirer_share_price)
+        pro_forma_shares = _scenario_column(acquirer_shares) + new_shares
+        financing_cost = deal_value * (1 - stock_percent) * _scenario_column(financing_rate) * (1 - tax)
+        synergies = _scenario_column(run_rate_synergies) * phase_in
+        synergies_after_tax = (synergies - one_time) * (1 - tax)
+        # Combined earnings before synergies and financing
+        combined_ni = acquirer_ni + target_ni
+
+        pro_forma_ni = combined_ni + synergies_after_tax - financing_cost
+        standalone_eps = acquirer_ni / _scenario_column(acquirer_shares)
+        pro_forma_eps = pro_forma_ni / pro_forma_shares
+        accretion = (pro_forma_eps - standalone_eps) / np.abs(standalone_eps) * 100
+        # Pre-tax synergies each year that would make the deal EPS-neutral
+        break_even = (standalone_eps * pro_forma_shares - combined_ni + financing_cost) / (1 - tax) + one_time
+
+        shape = np.broadcast_shapes(pro_forma_eps.shape, standalone_eps.shape)
+        outputs = {
+            'synergies': synergies,
+            'synergies_after_tax': synergies_after_tax,
+            'financing_cost_after_tax': financing_cost,
+            'pro_forma_net_income': pro_forma_ni,
+            'pro_forma_shares': pro_forma_shares,
+            'acquirer_standalone_eps': standalone_eps,
+            'pro_forma_eps': pro_forma_eps,
+            'accretion_dilution_percent': accretion,
+            'break_even_synergies': break_even
+        }
+        return {name: np.broadcast_to(values, shape) for name, values in outputs.items()}
+    
     @staticmethod
     def calculate_accretion_dilution(
         acquirer_net_income: float,
@@ -0,0 +1,88 @@
+"""Vectorized goal seek: solve many one-variable targets at once"""
+from typing import Callable, Dict
+import numpy as np
+
+
+def solve_bracketed(
+    func: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    targets: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    xtol: float = 1e-10,
+    ftol: float = 1e-10,
+    max_iterations: int = 100
+) -> Dict[str, np.ndarray]:
+    """x with func(x) == target for every row, by vectorized Illinois regula falsi
+
+    func(x, rows) evaluates the rows listed in `rows` at the points x (same
+    length), so converged rows drop out and cost nothing. Each row must
+    change sign over [lower, upper]; rows that do not have no root in their
+    bracket and come back as NaN. Illinois' halving of the stale end keeps
+    false position superlinear without giving up the bracket, so every
+    bracketed row converges.
+
+    Returns 'x', 'converged' and 'iterations' per row, 'value' (func at x),
+    'at_lower' and 'at_upper' (func at the bracket ends, which show how far
+    off an unsolvable row is) and 'failed_rows', the indices of rows
+    without a converged solution.
+    """
+    targets = np.asarray(targets, dtype=float)
+    n_rows = targets.size
+    rows = np.arange(n_rows)
+    lo = np.broadcast_to(np.asarray(lower, dtype=float), (n_rows,)).copy()
+    hi = np.broadcast_to(np.asarray(upper, dtype=float), (n_rows,)).copy()
+    f_lo = func(lo, rows) - targets
+    f_hi = func(hi, rows) - targets
+    at_lower, at_upper = f_lo + targets, f_hi + targets
+
+    x = np.full(n_rows, np.nan)
+    value = np.full(n_rows, np.nan)
+    converged = np.zeros(n_rows, dtype=bool)
+    iterations = np.zeros(n_rows, dtype=np.int64)
+    for end, f_end in ((lo, f_lo), (hi, f_hi)):
+        exact = ~converged & (f_end == 0)
+        x[exact] = end[exact]
+        value[exact] = targets[exact]
+        converged |= exact
+
+    bracketed = np.isfinite(f_lo) & np.isfinite(f_hi) & (np.sign(f_lo) != np.sign(f_hi))
+    active = np.flatnonzero(bracketed & ~converged)
+    for _ in range(max_iterations):
+        if active.size == 0:
+            break
+        a, b, fa, fb = lo[active], hi[active], f_lo[active], f_hi[active]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            trial = b - fb * (b - a) / (fb - fa)
+        # Guard against a degenerate secant (flat segment, rounding) with bisection
+        inside = np.isfinite(trial) & (trial > np.minimum(a, b)) & (trial < np.maximum(a, b))
+        trial = np.where(inside, trial, (a + b) / 2)
+        f_trial = func(trial, active) - targets[active]
+        iterations[active] += 1
+
+        # The root stays between b and trial when they differ in sign;
+        # otherwise keep a and halve its stale value (the Illinois step)
+        crossed = np.sign(f_trial) != np.sign(fb)
+        lo[active] = np.where(crossed, b, a)
+        f_lo[active] = np.where(crossed, fb, fa / 2)
+        hi[active] = trial
+        f_hi[active] = f_trial
+
+        done = (
+            (f_trial == 0)
+            | (np.abs(f_trial) <= ftol * (1 + np.abs(targets[active])))
+            | (np.abs(trial - np.where(crossed, b, a)) <= xtol * (1 + np.abs(trial)))
+        )
+        x[active[done]] = trial[done]
+        value[active[done]] = f_trial[done] + targets[active[done]]
+        converged[active[done]] = True
+        active = active[~done]
+
+    return {
+        "x": x,
+        "value": value,
+        "converged": converged,
+        "iterations": iterations,
+        "at_lower": at_lower,
+        "at_upper": at_upper,
+        "failed_rows": np.flatnonzero(~converged)
+    }
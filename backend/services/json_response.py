@@ -0,0 +1,73 @@
+"""JSON rendering for analysis payloads full of NumPy values"""
+from datetime import date, datetime
+from typing import Any
+import json
+import math
+import sys
+
+from starlette.responses import Response
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the standard library encoder
+    orjson = None
+
+
+_ORJSON_OPTIONS = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+
+def _numpy():
+    """NumPy if something has imported it; until then no value can be a NumPy one"""
+    return sys.modules.get("numpy")
+
+
+def _default(value: Any) -> Any:
+    np = _numpy()
+    if np is not None and isinstance(value, np.ndarray):
+        return value.tolist()
+    if np is not None and isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _finite(value: Any) -> Any:
+    """`value` with non-finite floats (NumPy ones included) replaced by None"""
+    np = _numpy()
+    if isinstance(value, float) or (np is not None and isinstance(value, np.floating)):
+        return float(value) if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {k: _finite(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(v) for v in value]
+    if np is not None and isinstance(value, np.ndarray):
+        return _finite(value.tolist())
+    return value
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize dicts, lists, NumPy scalars and arrays straight to JSON bytes
+
+    Non-finite floats become null. Uses orjson when installed, otherwise the
+    standard library encoder on a sanitized copy, so both give the same body.
+    """
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
+    return json.dumps(
+        _finite(content), default=_default, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class NumpyJSONResponse(Response):
+    """JSON response that skips FastAPI's jsonable_encoder walk
+
+    Pass already-rendered bytes to reuse a serialized payload as-is.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
@@ -0,0 +1,177 @@
+"""Sponsor LBO returns: tranche debt schedules and IRR/MOIC grids"""
+from typing import Dict, List, Optional
+import numpy as np
+
+
+# Default capital structure: an amortizing, sweepable term loan ahead of
+# bullet senior notes. share is the tranche's fraction of total debt and
+# amortization its mandatory annual repayment as a fraction of the original
+# principal. Tranches are repaid from the sweep in this order.
+DEFAULT_TRANCHES = [
+    {"name": "term_loan", "share": 0.6, "rate": 0.075, "amortization": 0.05, "sweep": True},
+    {"name": "senior_notes", "share": 0.4, "rate": 0.0875, "amortization": 0.0, "sweep": False}
+]
+
+# Upper bound on leverage x entry x exit x holding-period cells per call
+MAX_LBO_CELLS = 1_000_000
+
+
+def _validate_tranches(tranches: List[Dict]) -> None:
+    if not tranches:
+        raise ValueError("At least one debt tranche is required")
+    shares = [t["share"] for t in tranches]
+    if min(shares) < 0 or not np.isclose(sum(shares), 1.0):
+        raise ValueError("Tranche shares must be non-negative and sum to 1")
+    names = [t["name"] for t in tranches]
+    if len(set(names)) != len(names):
+        raise ValueError("Tranche names must be unique")
+
+
+def debt_schedules(
+    ebitda: np.ndarray,
+    ebit: np.ndarray,
+    capex: np.ndarray,
+    nwc_change: np.ndarray,
+    tax_rate: float,
+    debt: np.ndarray,
+    tranches: List[Dict],
+    cash_sweep_percent: float = 1.0
+) -> Dict[str, np.ndarray]:
+    """Year-by-year debt paydown for many opening debt levels at once
+
+    ebitda, ebit, capex and nwc_change are the (years,) operating
+    projections; debt is one opening total per scenario. Interest accrues on
+    opening balances (no circularity) and is tax deductible. Levered free
+    cash flow first meets each tranche's mandatory amortization; then
+    cash_sweep_percent of what is left repays sweepable tranches in order.
+    Cash that is not swept builds up on the balance sheet (a shortfall shows
+    as negative cash, i.e. a revolver draw).
+
+    Returns balances (scenarios, tranches, years + 1) including the opening
+    column, and (scenarios, years) interest, taxes, free cash flow,
+    mandatory and sweep repayments, plus cash (scenarios, years + 1).
+    """
+    _validate_tranches(tranches)
+    debt = np.asarray(debt, dtype=float)
+    n_scenarios, n_years, n_tranches = debt.size, ebitda.size, len(tranches)
+    share = np.array([t["share"] for t in tranches], dtype=float)
+    rate = np.array([t["rate"] for t in tranches], dtype=float)
+    amortization = np.array([t["amortization"] for t in tranches], dtype=float)
+    sweepable = np.array([bool(t["sweep"]) for t in tranches])
+
+    original = debt[:, None] * share
+    balances = np.empty((n_scenarios, n_tranches, n_years + 1))
+    balances[:, :, 0] = original
+    cash = np.zeros((n_scenarios, n_years + 1))
+    interest = np.empty((n_scenarios, n_years))
+    taxes = np.empty((n_scenarios, n_years))
+    fcf = np.empty((n_scenarios, n_years))
+    mandatory = np.empty((n_scenarios, n_years))
+    swept = np.empty((n_scenarios, n_years))
+
+    for year in range(n_years):
+        opening = balances[:, :, year]
+        interest[:, year] = (opening * rate).sum(axis=1)
+        taxes[:, year] = np.maximum(ebit[year] - interest[:, year], 0) * tax_rate
+        fcf[:, year] = ebitda[year] - taxes[:, year] - capex[year] - nwc_change[year] - interest[:, year]
+
+        required = np.minimum(original * amortization, opening)
+        closing = opening - required
+        available = np.maximum((fcf[:, year] - required.sum(axis=1)) * cash_sweep_percent, 0)
+
+        # Waterfall: each sweepable tranche takes what the ones ahead of it left
+        sweep_balances = np.where(sweepable, closing, 0)
+        ahead = np.cumsum(sweep_balances, axis=1) - sweep_balances
+        repay = np.clip(available[:, None] - ahead, 0, sweep_balances)
+        closing -= repay
+
+        balances[:, :, year + 1] = closing
+        mandatory[:, year] = required.sum(axis=1)
+        swept[:, year] = repay.sum(axis=1)
+        cash[:, year + 1] = cash[:, year] + fcf[:, year] - mandatory[:, year] - swept[:, year]
+
+    return {
+        "balances": balances,
+        "cash": cash,
+        "interest": interest,
+        "taxes": taxes,
+        "levered_fcf": fcf,
+        "mandatory_repayment": mandatory,
+        "sweep_repayment": swept
+    }
+
+
+def lbo_returns(
+    projections: Dict[str, List[float]],
+    ltm_ebitda: float,
+    tax_rate: float,
+    leverage: np.ndarray,
+    entry_multiples: np.ndarray,
+    exit_multiples: np.ndarray,
+    holding_periods: np.ndarray,
+    tranches: Optional[List[Dict]] = None,
+    cash_sweep_percent: float = 1.0,
+    transaction_fee_percent: float = 0.02
+) -> Dict[str, np.ndarray]:
+    """Sponsor IRR and MOIC over leverage x entry multiple x exit multiple x holding period
+
+    projections come from FinancialCalculator.project_financials and must
+    cover the longest holding period. Debt is leverage x LTM EBITDA and
+    depends on nothing else, so one debt schedule per leverage level serves
+    every other axis; the returns grid is then a single broadcast. The
+    sponsor funds entry EV plus fees less debt and receives exit EV
+    (exit multiple x exit-year EBITDA) less net debt, with no interim
+    distributions, so IRR = MOIC ** (1 / years) - 1.
+    """
+    tranches = tranches or DEFAULT_TRANCHES
+    leverage = np.asarray(leverage, dtype=float)
+    entry_multiples = np.asarray(entry_multiples, dtype=float)
+    exit_multiples = np.asarray(exit_multiples, dtype=float)
+    holding_periods = np.asarray(holding_periods, dtype=int)
+    ebitda = np.asarray(projections["ebitda"], dtype=float)
+    if holding_periods.min() < 1 or holding_periods.max() > ebitda.size:
+        raise ValueError(f"Holding periods must be between 1 and {ebitda.size} years")
+    cells = leverage.size * entry_multiples.size * exit_multiples.size * holding_periods.size
+    if cells > MAX_LBO_CELLS:
+        raise ValueError(f"Returns grid has {cells} cells; the limit is {MAX_LBO_CELLS}")
+
+    debt = leverage * ltm_ebitda
+    schedule = debt_schedules(
+        ebitda=ebitda,
+        ebit=np.asarray(projections["ebit"], dtype=float),
+        capex=np.asarray(projections["capex"], dtype=float),
+        nwc_change=np.asarray(projections["nwc_change"], dtype=float),
+        tax_rate=tax_rate,
+        debt=debt,
+        tranches=tranches,
+        cash_sweep_percent=cash_sweep_percent
+    )
+
+    # Axes: [leverage, entry, exit, holding period]
+    entry_ev = entry_multiples * ltm_ebitda
+    equity_in = entry_ev[None, :] * (1 + transaction_fee_percent) - debt[:, None]
+    net_debt_at_exit = (schedule["balances"].sum(axis=1) - schedule["cash"])[:, holding_periods]
+    exit_ev = exit_multiples[:, None] * ebitda[holding_periods - 1][None, :]
+    equity_out = exit_ev[None, :, :] - net_debt_at_exit[:, None, :]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        moic = equity_out[:, None, :, :] / equity_in[:, :, None, None]
+        irr = np.where(
+            moic > 0, np.power(np.maximum(moic, 0), 1.0 / holding_periods) - 1, -1.0
+        )
+    # Leverage at or above the purchase price leaves no sponsor equity to return on
+    funded = equity_in > 0
+    moic = np.where(funded[:, :, None, None], moic, np.nan)
+    irr = np.where(funded[:, :, None, None], irr, np.nan)
+
+    return {
+        "debt": debt,
+        "entry_enterprise_value": entry_ev,
+        "sponsor_equity": equity_in,
+        "exit_enterprise_value": exit_ev,
+        "net_debt_at_exit": net_debt_at_exit,
+        "exit_equity": equity_out,
+        "moic": moic,
+        "irr": irr,
+        "schedule": schedule
+    }
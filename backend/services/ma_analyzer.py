@@ -1,24 +1,369 @@
 """M&A Analysis Service"""
-from typing import Dict, List
+import hashlib
+import inspect
+import os
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
 from backend.services.financial_calculator import FinancialCalculator
+from backend.services.result_cache import (
+    ResultCache,
+    analysis_key,
+    bind_call_args,
+    cached_analysis,
+    fingerprint,
+    shared_results
+)
+from backend.services.pair_screening import screen_pairs
+from backend.services.lbo import DEFAULT_TRANCHES, lbo_returns
+from backend.services.goal_seek import solve_bracketed
+from backend.services.collar import (
+    DEFAULT_PRICE_PROCESS,
+    EXCHANGE_STRUCTURES,
+    exchange_ratios,
+    simulate_pricing_window
+)
+from backend.services.monte_carlo import (
+    DEFAULT_DCF_DISTRIBUTIONS,
+    StreamingDistribution,
+    sample_distribution
+)
+from backend.data.statement_store import StatementStore
+from backend.data.comps_universe import CompsUniverse
+from backend.data.precedent_store import PrecedentStore
 from backend.data.salesforce_data import SALESFORCE_DATA
 from backend.data.servicenow_data import SERVICENOW_DATA
 from backend.data.market_data import (
     COMPARABLE_COMPANIES,
     PRECEDENT_TRANSACTIONS,
-    MARKET_ASSUMPTIONS
+    MARKET_ASSUMPTIONS,
+    DEAL_ASSUMPTIONS
 )
 import numpy as np
 
 
+# Inputs each analysis reads directly, and the analyses it builds on.
+# "assumptions.<key>" refers to a single entry of the deal assumptions.
+ANALYSIS_DEPENDENCIES = {
+    "get_company_overview": {
+        "inputs": ["acquirer", "target"],
+        "upstream": []
+    },
+    "get_financial_statements": {
+        "inputs": ["acquirer", "target"],
+        "upstream": []
+    },
+    "calculate_dcf_valuation": {
+        "inputs": ["acquirer", "target", "market", "assumptions.growth_rates",
+                   "assumptions.ebitda_margin", "assumptions.da_percent",
+                   "assumptions.capex_percent", "assumptions.nwc_percent",
+                   "assumptions.cost_of_debt"],
+        "upstream": []
+    },
+    "simulate_dcf_valuation": {
+        "inputs": ["acquirer", "target", "market", "assumptions.growth_rates",
+                   "assumptions.ebitda_margin", "assumptions.da_percent",
+                   "assumptions.capex_percent", "assumptions.nwc_percent",
+                   "assumptions.cost_of_debt"],
+        "upstream": []
+    },
+    "simulate_exchange_ratio_collar": {
+        "inputs": ["acquirer", "target", "market", "assumptions.deal_value",
+                   "assumptions.stock_consideration_percent"],
+        "upstream": []
+    },
+    "get_dcf_sensitivity": {
+        "inputs": ["acquirer", "target", "market", "assumptions.growth_rates",
+                   "assumptions.ebitda_margin", "assumptions.da_percent",
+                   "assumptions.capex_percent", "assumptions.nwc_percent",
+                   "assumptions.cost_of_debt"],
+        "upstream": []
+    },
+    "get_historical_metrics": {
+        "inputs": ["acquirer", "target"],
+        "upstream": []
+    },
+    "get_comparable_companies_analysis": {
+        "inputs": ["target", "comparable_companies"],
+        "upstream": []
+    },
+    "get_precedent_transactions_analysis": {
+        "inputs": ["target", "precedent_transactions"],
+        "upstream": []
+    },
+    "calculate_synergies": {
+        "inputs": ["acquirer", "target", "assumptions.cross_sell_rate",
+                   "assumptions.cost_synergy_percent", "assumptions.one_time_costs"],
+        "upstream": []
+    },
+    "calculate_accretion_dilution": {
+        "inputs": ["acquirer", "target", "market", "assumptions.deal_value",
+                   "assumptions.stock_consideration_percent"],
+        "upstream": ["calculate_synergies"]
+    },
+    "calculate_multi_year_accretion": {
+        "inputs": ["acquirer", "target", "market", "assumptions.growth_rates",
+                   "assumptions.deal_value", "assumptions.stock_consideration_percent",
+                   "assumptions.cost_of_debt", "assumptions.one_time_costs"],
+        "upstream": ["calculate_synergies"]
+    },
+    "optimize_consideration_mix": {
+        "inputs": ["acquirer", "target", "market", "assumptions.growth_rates",
+                   "assumptions.acquisition_premium", "assumptions.cost_of_debt",
+                   "assumptions.one_time_costs"],
+        "upstream": ["calculate_synergies"]
+    },
+    "get_valuation_summary": {
+        "inputs": ["target", "assumptions.acquisition_premium", "assumptions.dcf_weight",
+                   "assumptions.comps_weight", "assumptions.precedents_weight"],
+        "upstream": ["calculate_dcf_valuation", "get_comparable_companies_analysis",
+                     "get_precedent_transactions_analysis"]
+    },
+    "calculate_lbo_returns": {
+        "inputs": ["target", "market", "assumptions.growth_rates",
+                   "assumptions.ebitda_margin", "assumptions.da_percent",
+                   "assumptions.capex_percent", "assumptions.nwc_percent",
+                   "assumptions.acquisition_premium"],
+        "upstream": []
+    },
+    "solve_deal_terms": {
+        "inputs": ["acquirer", "target", "market", "assumptions.acquisition_premium",
+                   "assumptions.stock_consideration_percent", "assumptions.cost_of_debt",
+                   "assumptions.one_time_costs"],
+        "upstream": ["calculate_synergies", "calculate_dcf_valuation"]
+    },
+    "screen_acquisition_pairs": {
+        "inputs": ["target", "market", "comparable_companies", "assumptions.acquisition_premium",
+                   "assumptions.stock_consideration_percent", "assumptions.cross_sell_rate",
+                   "assumptions.cost_synergy_percent", "assumptions.one_time_costs"],
+        "upstream": []
+    },
+    "calculate_tornado": {
+        "inputs": ["acquirer", "target", "market", "comparable_companies", "precedent_transactions",
+                   "assumptions.growth_rates", "assumptions.ebitda_margin", "assumptions.da_percent",
+                   "assumptions.capex_percent", "assumptions.nwc_percent", "assumptions.cost_of_debt",
+                   "assumptions.cross_sell_rate", "assumptions.cost_synergy_percent",
+                   "assumptions.one_time_costs", "assumptions.acquisition_premium",
+                   "assumptions.stock_consideration_percent", "assumptions.dcf_weight",
+                   "assumptions.comps_weight", "assumptions.precedents_weight"],
+        "upstream": ["get_comparable_companies_analysis", "get_precedent_transactions_analysis",
+                     "calculate_dcf_valuation"]
+    },
+    "get_executive_summary": {
+        "inputs": ["acquirer", "target", "assumptions.stock_consideration_percent"],
+        "upstream": ["get_valuation_summary", "calculate_synergies",
+                     "calculate_accretion_dilution"]
+    }
+}
+
+
+# Packages whose sources shape analysis results: the services, the data
+# loaders and the models the requests are validated against
+_VERSIONED_PACKAGES = ("services", "data", "models")
+
+
+@lru_cache(maxsize=None)
+def code_version() -> str:
+    """Version tag mixed into every result identity (ETags, stored results)
+
+    MA_CODE_VERSION if set, else a digest of the analysis sources, so
+    results change with the code. Hashed on first use, not at import.
+    """
+    if os.environ.get("MA_CODE_VERSION"):
+        return os.environ["MA_CODE_VERSION"]
+    backend = Path(__file__).resolve().parent.parent
+    digest = hashlib.blake2b(digest_size=8)
+    for package in _VERSIONED_PACKAGES:
+        for path in sorted((backend / package).glob("*.py")):
+            digest.update(f"{package}/{path.name}".encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _masked_matrix(values: np.ndarray) -> List[List[Optional[float]]]:
+    """(Nested) lists for JSON, with non-finite cells as None"""
+    return np.where(np.isfinite(values), values, None).tolist()
+
+
+# Sections served by get_batch: name -> (method, takes the company argument)
+BATCH_SECTIONS = {
+    "overview": ("get_company_overview", False),
+    "financials": ("get_financial_statements", False),
+    "historical_metrics": ("get_historical_metrics", False),
+    "dcf": ("calculate_dcf_valuation", True),
+    "comps": ("get_comparable_companies_analysis", False),
+    "precedents": ("get_precedent_transactions_analysis", False),
+    "synergies": ("calculate_synergies", False),
+    "accretion": ("calculate_accretion_dilution", False),
+    "valuation": ("get_valuation_summary", False),
+    "executive": ("get_executive_summary", False)
+}
+
+
+# Share of run-rate synergies realised in years 1, 2 and 3 onwards
+SYNERGY_PHASE_IN = (0.25, 0.65, 1.0)
+MAX_ACCRETION_SCENARIOS = 100_000
+MAX_MIX_GRID_CELLS = 2_000_000
+
+# Deal outputs solve_deal_terms can hit, and the deal terms it can solve for
+GOAL_SEEK_OUTPUTS = (
+    "accretion_dilution_percent",
+    "pro_forma_eps",
+    "offer_price_per_share",
+    "deal_value",
+    "target_ownership_percent",
+    "premium_to_value_percent"
+)
+GOAL_SEEK_VARIABLES = ("premium", "stock_percent", "synergies")
+MAX_GOAL_SEEK_CASES = 1_000_000
+
+# How the deal-terms analyses price a deal. calculate_accretion_dilution
+# takes the deal_value assumption as given and charges no financing cost,
+# so its accretion differs from theirs for the same assumptions.
+OFFER_ACCRETION_BASIS = (
+    "deal value = target share price x (1 + premium) x target shares; "
+    "after-tax interest at financing_rate on the cash portion"
+)
+
+# Deal assumptions the tornado bumps, one at a time
+TORNADO_ASSUMPTIONS = (
+    "growth_rates", "ebitda_margin", "da_percent", "capex_percent", "nwc_percent",
+    "cost_of_debt", "cross_sell_rate", "cost_synergy_percent", "one_time_costs",
+    "acquisition_premium", "dcf_weight", "comps_weight", "precedents_weight"
+)
+_VALUATION_WEIGHTS = ("dcf_weight", "comps_weight", "precedents_weight")
+
+
+def _structure_label(stock_percent: float) -> str:
+    return f"{1 - stock_percent:.0%} Cash / {stock_percent:.0%} Stock"
+
+
 class MAAnalyzer:
-    """Complete M&A Analysis Engine"""
+    """Complete M&A Analysis Engine
+    
+    comparables and precedents may be given as loaders (zero-argument
+    callables); data sets are loaded on first use, so large files cost
+    nothing until an analysis needs them.
+    """
     
-    def __init__(self):
+    def __init__(
+        self,
+        assumptions: Optional[Dict] = None,
+        cache: Optional[ResultCache] = None,
+        comparables: Union[CompsUniverse, Callable[[], CompsUniverse], None] = None,
+        precedents: Union[PrecedentStore, Callable[[], PrecedentStore], None] = None
+    ):
         self.calc = FinancialCalculator()
         self.acquirer = SALESFORCE_DATA
         self.target = SERVICENOW_DATA
         self.market = MARKET_ASSUMPTIONS
+        self._datasets = {
+            "comparables": comparables or (lambda: CompsUniverse.from_records(COMPARABLE_COMPANIES)),
+            "precedents": precedents or (lambda: PrecedentStore.from_records(PRECEDENT_TRANSACTIONS))
+        }
+        self._datasets_lock = threading.Lock()
+        self.assumptions = {**DEAL_ASSUMPTIONS, **(assumptions or {})}
+        self.cache = cache if cache is not None else ResultCache()
+        # source -> (the object hashed, its fingerprint)
+        self._fingerprints: Dict[str, tuple] = {}
+        # (acquirer, target, StatementStore built from them)
+        self._statements: Optional[tuple] = None
+    
+    def _dataset(self, name: str):
+        dataset = self._datasets[name]
+        if callable(dataset):
+            with self._datasets_lock:
+                if callable(self._datasets[name]):
+                    self._datasets[name] = self._datasets[name]()
+                dataset = self._datasets[name]
+        return dataset
+    
+    @property
+    def comparables(self) -> CompsUniverse:
+        return self._dataset("comparables")
+    
+    @property
+    def precedents(self) -> PrecedentStore:
+        return self._dataset("precedents")
+    
+    @property
+    def statements(self) -> StatementStore:
+        """Columnar statements of the acquirer (row 0) and target (row 1)
+        
+        Built on first use and again only when either company's data is
+        replaced or invalidated.
+        """
+        built = self._statements
+        if built is None or built[0] is not self.acquirer or built[1] is not self.target:
+            built = (self.acquirer, self.target, StatementStore.from_companies([self.acquirer, self.target]))
+            self._statements = built
+        return built[2]
+    
+    @classmethod
+    def from_env(cls) -> "MAAnalyzer":
+        """Build an analyzer configured from MA_* environment variables"""
+        comps_path = os.environ.get("MA_COMPS_UNIVERSE_PATH")
+        precedents_path = os.environ.get("MA_PRECEDENTS_PATH")
+        return cls(
+            cache=ResultCache(
+                maxsize=int(os.environ.get("MA_CACHE_MAXSIZE", 256)),
+                ttl=float(os.environ.get("MA_CACHE_TTL_SECONDS", 3600))
+            ),
+            comparables=(lambda: CompsUniverse.from_file(comps_path)) if comps_path else None,
+            precedents=(lambda: PrecedentStore.from_file(precedents_path)) if precedents_path else None
+        )
+    
+    def analysis_sources(self, name: str) -> List[str]:
+        """All inputs an analysis depends on, including through upstream analyses"""
+        sources = set()
+        pending = [name]
+        while pending:
+            deps = ANALYSIS_DEPENDENCIES[pending.pop()]
+            sources.update(deps["inputs"])
+            pending.extend(deps["upstream"])
+        return sorted(sources)
+    
+    def source_fingerprint(self, source: str) -> str:
+        """Content hash of one analysis input
+        
+        Hashes are memoized per source and recomputed when the source is
+        replaced (a different object) or invalidated; a source changed in
+        place must be invalidated to be rehashed.
+        """
+        if source == "comparable_companies":
+            return self.comparables.content_hash
+        if source == "precedent_transactions":
+            return self.precedents.content_hash
+        if source.startswith("assumptions."):
+            value = self.assumptions[source.split(".", 1)[1]]
+        else:
+            value = {"acquirer": self.acquirer, "target": self.target, "market": self.market}[source]
+        memo = self._fingerprints.get(source)
+        if memo is not None and memo[0] is value:
+            return memo[1]
+        # Holding the object keeps its identity from being reused
+        digest = fingerprint(value)
+        self._fingerprints[source] = (value, digest)
+        return digest
+    
+    def etag(self, name: str, *args, **kwargs) -> str:
+        """Entity tag of an analysis call, computed from its inputs without running it"""
+        signature = inspect.signature(getattr(type(self), name))
+        call_args = bind_call_args(signature, self, args, kwargs)
+        return fingerprint([code_version(), analysis_key(self, name, call_args)[0]])
+    
+    def invalidate(self, source: Optional[str] = None) -> int:
+        """Drop cached results that depend on `source` (all results if None)"""
+        for name in list(self._fingerprints):
+            if source is None or name == source or name.startswith(source + "."):
+                self._fingerprints.pop(name, None)
+        if source in (None, "acquirer", "target"):
+            self._statements = None
+        return self.cache.invalidate(source) if self.cache is not None else 0
+    
+    def cache_stats(self) -> Dict:
+        return self.cache.stats() if self.cache is not None else {}
     
     def get_company_overview(self) -> Dict:
         """Get overview of both companies"""
@@ -76,38 +421,95 @@ class MAAnalyzer:
             }
         }
     
-    def calculate_dcf_valuation(self, company: str = "target") -> Dict:
-        """Calculate DCF valuation for target company"""
+    @cached_analysis
+    def get_historical_metrics(self) -> Dict:
+        """Historical growth, margins and leverage for both companies"""
+        store = self.statements
+        metrics = {
+            "revenue_growth": store.growth("revenue"),
+            "gross_margin": store.ratio("gross_profit", "revenue"),
+            "ebitda_margin": store.ratio("ebitda", "revenue"),
+            "net_margin": store.ratio("net_income", "revenue"),
+            "fcf_margin": store.ratio("free_cash_flow", "revenue"),
+            "debt_to_equity": store.ratio(("long_term_debt", "short_term_debt"), "shareholders_equity"),
+            "return_on_equity": store.ratio("net_income", "shareholders_equity")
+        }
+        cagrs = {item: store.cagr(item) for item in ("revenue", "ebitda", "net_income", "free_cash_flow")}
+        
+        companies = {}
+        for row, role in enumerate(("acquirer", "target")):
+            companies[role] = {
+                "ticker": store.tickers[row],
+                **{name: _masked_matrix(values[row]) for name, values in metrics.items()},
+                "cagr": {item: _masked_matrix(values[row]) for item, values in cagrs.items()}
+            }
+        
+        return {
+            "years": store.years.tolist(),
+            "companies": companies,
+            "target_to_acquirer": {
+                item: _masked_matrix(store.items[item][1] / store.items[item][0])
+                for item in ("revenue", "ebitda", "net_income", "free_cash_flow")
+            }
+        }
+    
+    def _dcf_inputs(self, company: str = "target") -> Dict:
+        """Base-case DCF assumptions for the acquirer or target"""
         data = self.target if company == "target" else self.acquirer
         
         # Get latest financials
         latest_is = data["income_statements"][-1]
         latest_bs = data["balance_sheets"][-1]
         
+        return {
+            "base_revenue": latest_is["revenue"],
+            "growth_rates": self.assumptions["growth_rates"],
+            "ebitda_margin": self.assumptions["ebitda_margin"],
+            "tax_rate": self.market["tax_rate"],
+            "da_percent": self.assumptions["da_percent"],
+            "capex_percent": self.assumptions["capex_percent"],
+            "nwc_percent": self.assumptions["nwc_percent"],
+            "risk_free_rate": self.market["risk_free_rate"],
+            "beta": data["key_metrics"]["beta"],
+            "market_risk_premium": self.market["market_risk_premium"],
+            "cost_of_debt": self.assumptions["cost_of_debt"],
+            "debt_to_equity": data["key_metrics"]["debt_to_equity"],
+            "terminal_growth": self.market["terminal_growth_rate"],
+            "net_debt": latest_bs["long_term_debt"] + latest_bs["short_term_debt"] - latest_bs["cash"],
+            "shares": data["shares_outstanding"],
+            "current_price": data["current_share_price"]
+        }
+    
+    @cached_analysis
+    def calculate_dcf_valuation(self, company: str = "target") -> Dict:
+        """Calculate DCF valuation for target company"""
+        data = self.target if company == "target" else self.acquirer
+        inputs = self._dcf_inputs(company)
+        
         # DCF Assumptions
-        base_revenue = latest_is["revenue"]
-        growth_rates = [0.18, 0.16, 0.14, 0.12, 0.10]  # 5-year projection
-        ebitda_margin = 0.215  # Target margin improvement
-        tax_rate = self.market["tax_rate"]
-        da_percent = 0.06
-        capex_percent = 0.045
-        nwc_percent = 0.12
+        base_revenue = inputs["base_revenue"]
+        growth_rates = inputs["growth_rates"]
+        ebitda_margin = inputs["ebitda_margin"]
+        tax_rate = inputs["tax_rate"]
+        da_percent = inputs["da_percent"]
+        capex_percent = inputs["capex_percent"]
+        nwc_percent = inputs["nwc_percent"]
         
         # Calculate WACC
         wacc = self.calc.calculate_wacc(
-            risk_free_rate=self.market["risk_free_rate"],
-            beta=data["key_metrics"]["beta"],
-            market_risk_premium=self.market["market_risk_premium"],
-            cost_of_debt=0.05,
+            risk_free_rate=inputs["risk_free_rate"],
+            beta=inputs["beta"],
+            market_risk_premium=inputs["market_risk_premium"],
+            cost_of_debt=inputs["cost_of_debt"],
             tax_rate=tax_rate,
-            debt_to_equity=data["key_metrics"]["debt_to_equity"]
+            debt_to_equity=inputs["debt_to_equity"]
         )
         
-        terminal_growth = self.market["terminal_growth_rate"]
+        terminal_growth = inputs["terminal_growth"]
         
         # Calculate net debt
-        net_debt = latest_bs["long_term_debt"] + latest_bs["short_term_debt"] - latest_bs["cash"]
-        shares = data["shares_outstanding"]
+        net_debt = inputs["net_debt"]
+        shares = inputs["shares"]
         
         # Perform DCF
         dcf_result = self.calc.calculate_dcf_valuation(
@@ -158,25 +560,295 @@ class MAAnalyzer:
             }
         }
     
-    def get_comparable_companies_analysis(self) -> Dict:
-        """Perform comparable companies analysis"""
+    def simulate_dcf_valuation(
+        self,
+        company: str = "target",
+        n_paths: int = 100000,
+        distributions: Optional[Dict[str, Dict]] = None,
+        seed: Optional[int] = None,
+        chunk_size: int = 50000,
+        percentiles: Optional[List[float]] = None,
+        histogram_bins: int = 50
+    ) -> Dict:
+        """Monte Carlo DCF: value-per-share distribution over sampled assumptions
+
+        Paths are valued chunk by chunk; a seed gives the same draws whatever the chunk size.
+        """
+        if n_paths < 1 or chunk_size < 1:
+            raise ValueError("n_paths and chunk_size must be positive")
+        inputs = self._dcf_inputs(company)
+        distributions = distributions or {}
+        unknown = set(distributions) - set(DEFAULT_DCF_DISTRIBUTIONS)
+        if unknown:
+            raise ValueError(f"Unknown simulated variables: {sorted(unknown)}")
+        specs = {
+            name: {**default, **distributions.get(name, {})}
+            for name, default in DEFAULT_DCF_DISTRIBUTIONS.items()
+        }
+        percentiles = percentiles or [1, 5, 10, 25, 50, 75, 90, 95, 99]
+        
+        base_means = {
+            "growth_shift": 0.0,
+            "ebitda_margin": inputs["ebitda_margin"],
+            "beta": inputs["beta"],
+            "market_risk_premium": inputs["market_risk_premium"],
+            "terminal_growth": inputs["terminal_growth"]
+        }
+        streams = dict(zip(
+            sorted(specs),
+            (np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(len(specs)))
+        ))
+        growth_path = np.asarray(inputs["growth_rates"])
+        stats = StreamingDistribution(bins=histogram_bins)
+        upside_paths = 0
+        invalid_paths = 0
+        
+        for start in range(0, n_paths, chunk_size):
+            size = min(chunk_size, n_paths - start)
+            draws = {
+                name: sample_distribution(specs[name], streams[name], size, base_means[name])
+                for name in specs
+            }
+            wacc = self.calc.calculate_wacc(
+                risk_free_rate=inputs["risk_free_rate"],
+                beta=draws["beta"],
+                market_risk_premium=draws["market_risk_premium"],
+                cost_of_debt=inputs["cost_of_debt"],
+                tax_rate=inputs["tax_rate"],
+                debt_to_equity=inputs["debt_to_equity"]
+            )
+            result = self.calc.calculate_dcf_valuation_batch(
+                base_revenue=inputs["base_revenue"],
+                growth_rates=growth_path + draws["growth_shift"][:, None],
+                ebitda_margin=draws["ebitda_margin"],
+                tax_rate=inputs["tax_rate"],
+                da_percent_revenue=inputs["da_percent"],
+                capex_percent_revenue=inputs["capex_percent"],
+                nwc_percent_revenue=inputs["nwc_percent"],
+                wacc=wacc,
+                terminal_growth_rate=draws["terminal_growth"],
+                net_debt=inputs["net_debt"],
+                shares_outstanding=inputs["shares"]
+            )
+            # Perpetuity growth is undefined when WACC <= terminal growth
+            valid = (wacc > draws["terminal_growth"]) & np.isfinite(result["value_per_share"])
+            values = result["value_per_share"][valid]
+            invalid_paths += size - values.size
+            upside_paths += int(np.count_nonzero(values > inputs["current_price"]))
+            stats.update(values)
+        
+        valid_paths = n_paths - invalid_paths
+        return {
+            "company": company,
+            "n_paths": n_paths,
+            "valid_paths": valid_paths,
+            "invalid_paths": invalid_paths,
+            "seed": seed,
+            "distributions": specs,
+            "current_price": inputs["current_price"],
+            "value_per_share": {
+                **stats.summary(),
+                "percentiles": stats.percentiles(percentiles)
+            },
+            "histogram": stats.histogram(),
+            "probability_of_upside": upside_paths / valid_paths if valid_paths else None
+        }
+    
+    def simulate_exchange_ratio_collar(
+        self,
+        n_paths: int = 100000,
+        days_to_close: int = 126,
+        averaging_days: int = 10,
+        collar_lower: float = 0.9,
+        collar_upper: float = 1.1,
+        stock_percent: Optional[float] = None,
+        premium: Optional[float] = None,
+        price_process: Optional[Dict[str, float]] = None,
+        seed: Optional[int] = None,
+        chunk_size: int = 100000,
+        percentiles: Optional[List[float]] = None,
+        histogram_bins: int = 50
+    ) -> Dict:
+        """Fixed vs floating exchange ratios and collars over simulated prices to close
+        
+        Acquirer and target prices follow correlated risk-neutral GBM from
+        their current share prices. The stock portion of the offer is
+        converted at the acquirer's average price over the final
+        averaging_days and valued at its closing price; the cash portion is
+        fixed. Every structure is valued on the same paths, chunk by chunk.
+        Premium None uses the deal_value assumption.
+        
+        A seed fixes the paths whatever the chunk_size. Percentiles and
+        histograms are approximate (StreamingDistribution), and its range is
+        set by the first chunk, so they can move slightly with chunk_size;
+        the other summary statistics do not depend on it.
+        """
+        if n_paths < 1 or chunk_size < 1:
+            raise ValueError("n_paths and chunk_size must be positive")
+        process = {**DEFAULT_PRICE_PROCESS, **(price_process or {})}
+        unknown = set(process) - set(DEFAULT_PRICE_PROCESS)
+        if unknown:
+            raise ValueError(f"Unknown price process parameters: {sorted(unknown)}")
+        percentiles = percentiles or [1, 5, 10, 25, 50, 75, 90, 95, 99]
+        stock_percent = self.assumptions["stock_consideration_percent"] if stock_percent is None else stock_percent
+        acquirer_price = self.acquirer["current_share_price"]
+        target_price = self.target["current_share_price"]
+        target_shares = self.target["shares_outstanding"]
+        acquirer_shares = self.acquirer["shares_outstanding"]
+        offer_price = (
+            self.assumptions["deal_value"] / target_shares if premium is None
+            else target_price * (1 + premium)
+        )
+        stock_value = offer_price * stock_percent
+        cash_value = offer_price - stock_value
+        
+        rng = np.random.default_rng(seed)
+        measures = ("value_per_share", "premium_at_close", "exchange_ratio", "ownership_dilution_percent")
+        stats = {
+            name: {measure: StreamingDistribution(bins=histogram_bins) for measure in measures}
+            for name in EXCHANGE_STRUCTURES
+        }
+        below_market = dict.fromkeys(EXCHANGE_STRUCTURES, 0)
+        
+        for start in range(0, n_paths, chunk_size):
+            size = min(chunk_size, n_paths - start)
+            prices = simulate_pricing_window(
+                rng, size, acquirer_price, target_price,
+                drift=self.market["risk_free_rate"],
+                days_to_close=days_to_close,
+                averaging_days=averaging_days,
+                **process
+            )
+            ratios = exchange_ratios(
+                prices["acquirer_average"], stock_value, acquirer_price, collar_lower, collar_upper
+            )
+            for name, ratio in ratios.items():
+                value = cash_value + ratio * prices["acquirer_close"]
+                new_shares = ratio * target_shares
+                below_market[name] += int(np.count_nonzero(value < prices["target_close"]))
+                stats[name]["value_per_share"].update(value)
+                stats[name]["premium_at_close"].update((value / prices["target_close"] - 1) * 100)
+                stats[name]["exchange_ratio"].update(ratio)
+                stats[name]["ownership_dilution_percent"].update(
+                    new_shares / (acquirer_shares + new_shares) * 100
+                )
+        
+        structures = {}
+        for name, by_measure in stats.items():
+            structures[name] = {
+                measure: {**dist.summary(), "percentiles": dist.percentiles(percentiles)}
+                for measure, dist in by_measure.items()
+            }
+            structures[name]["histogram"] = by_measure["value_per_share"].histogram()
+            structures[name]["probability_below_target_price"] = below_market[name] / n_paths
+        
+        return {
+            "n_paths": n_paths,
+            "seed": seed,
+            "days_to_close": days_to_close,
+            "averaging_days": averaging_days,
+            "price_process": {**process, "drift": self.market["risk_free_rate"]},
+            "signing": {
+                "acquirer_share_price": acquirer_price,
+                "target_share_price": target_price,
+                "offer_price_per_share": offer_price,
+                "cash_per_share": cash_value,
+                "stock_value_per_share": stock_value,
+                "exchange_ratio": stock_value / acquirer_price,
+                "collar_prices": [collar_lower * acquirer_price, collar_upper * acquirer_price]
+            },
+            "structures": structures
+        }
+    
+    @cached_analysis
+    def get_dcf_sensitivity(
+        self,
+        company: str = "target",
+        wacc_values: Optional[List[float]] = None,
+        terminal_growth_values: Optional[List[float]] = None,
+        exit_multiples: Optional[List[float]] = None
+    ) -> Dict:
+        """WACC x terminal growth sensitivity table around the base-case DCF"""
+        inputs = self._dcf_inputs(company)
+        base_wacc = self.calc.calculate_wacc(
+            risk_free_rate=inputs["risk_free_rate"],
+            beta=inputs["beta"],
+            market_risk_premium=inputs["market_risk_premium"],
+            cost_of_debt=inputs["cost_of_debt"],
+            tax_rate=inputs["tax_rate"],
+            debt_to_equity=inputs["debt_to_equity"]
+        )
+        if wacc_values is None:
+            wacc_values = list(base_wacc + np.linspace(-0.02, 0.02, 9))
+        if terminal_growth_values is None:
+            terminal_growth_values = list(inputs["terminal_growth"] + np.linspace(-0.01, 0.01, 5))
+        
+        projections = self.calc.project_financials(
+            inputs["base_revenue"], inputs["growth_rates"], inputs["ebitda_margin"],
+            inputs["tax_rate"], inputs["da_percent"], inputs["capex_percent"],
+            inputs["nwc_percent"]
+        )
+        grid = self.calc.calculate_dcf_sensitivity_grid(
+            fcf=projections["fcf"],
+            wacc_values=wacc_values,
+            terminal_growth_values=terminal_growth_values,
+            net_debt=inputs["net_debt"],
+            shares_outstanding=inputs["shares"],
+            final_ebitda=projections["ebitda"][-1],
+            exit_multiples=exit_multiples
+        )
+        
+        result = {
+            "company": company,
+            "base_case": {
+                "wacc": base_wacc,
+                "terminal_growth_rate": inputs["terminal_growth"],
+                "current_price": inputs["current_price"]
+            },
+            "wacc_values": [float(w) for w in wacc_values],
+            "terminal_growth_values": [float(g) for g in terminal_growth_values],
+            "enterprise_value": _masked_matrix(grid["enterprise_value"]),
+            "value_per_share": _masked_matrix(grid["value_per_share"]),
+            "invalid_cells": int((~grid["valid"]).sum())
+        }
+        if exit_multiples is not None:
+            result["exit_multiples"] = [float(m) for m in exit_multiples]
+            result["exit_multiple_enterprise_value"] = _masked_matrix(
+                grid["exit_multiple_enterprise_value"])
+            result["exit_multiple_value_per_share"] = _masked_matrix(
+                grid["exit_multiple_value_per_share"])
+        return result
+    
+    @cached_analysis
+    def get_comparable_companies_analysis(
+        self,
+        filters: Optional[Dict] = None,
+        limit: Optional[int] = 500
+    ) -> Dict:
+        """Perform comparable companies analysis
+        
+        filters are CompsUniverse.mask bounds on size, growth and margin.
+        """
+        universe = self.comparables
         # Filter out companies with negative metrics
-        valid_comps = [c for c in COMPARABLE_COMPANIES if c["ev_revenue"] > 0 and c["ev_ebitda"] > 0]
+        selected = universe.mask(**(filters or {}))
+        selected &= (universe.columns["ev_revenue"] > 0) & (universe.columns["ev_ebitda"] > 0)
+        if not selected.any():
+            raise ValueError("No comparable companies match the filters")
         
-        # Calculate statistics
-        ev_revenue_multiples = [c["ev_revenue"] for c in valid_comps]
-        ev_ebitda_multiples = [c["ev_ebitda"] for c in valid_comps]
+        # All multiples' statistics in one vectorized pass
+        stats = universe.multiple_stats(selected)
         
         # Target metrics
         target_revenue = self.target["income_statements"][-1]["revenue"]
         target_ebitda = self.target["income_statements"][-1]["ebitda"]
         
         # Calculate implied valuations
-        median_ev_revenue = np.median(ev_revenue_multiples)
-        mean_ev_revenue = np.mean(ev_revenue_multiples)
+        median_ev_revenue = stats["ev_revenue"]["median"]
+        mean_ev_revenue = stats["ev_revenue"]["mean"]
         
-        median_ev_ebitda = np.median(ev_ebitda_multiples)
-        mean_ev_ebitda = np.mean(ev_ebitda_multiples)
+        median_ev_ebitda = stats["ev_ebitda"]["median"]
+        mean_ev_ebitda = stats["ev_ebitda"]["mean"]
         
         implied_ev_revenue_median = target_revenue * median_ev_revenue
         implied_ev_revenue_mean = target_revenue * mean_ev_revenue
@@ -185,25 +857,10 @@ class MAAnalyzer:
         implied_ev_ebitda_mean = target_ebitda * mean_ev_ebitda
         
         return {
-            "comparable_companies": valid_comps,
-            "multiples_analysis": {
-                "ev_revenue": {
-                    "min": min(ev_revenue_multiples),
-                    "25th_percentile": np.percentile(ev_revenue_multiples, 25),
-                    "median": median_ev_revenue,
-                    "75th_percentile": np.percentile(ev_revenue_multiples, 75),
-                    "max": max(ev_revenue_multiples),
-                    "mean": mean_ev_revenue
-                },
-                "ev_ebitda": {
-                    "min": min(ev_ebitda_multiples),
-                    "25th_percentile": np.percentile(ev_ebitda_multiples, 25),
-                    "median": median_ev_ebitda,
-                    "75th_percentile": np.percentile(ev_ebitda_multiples, 75),
-                    "max": max(ev_ebitda_multiples),
-                    "mean": mean_ev_ebitda
-                }
-            },
+            "comparable_companies": universe.records(selected, limit),
+            "universe_size": len(universe),
+            "matched_companies": int(selected.sum()),
+            "multiples_analysis": stats,
             "implied_valuations": {
                 "target_revenue": target_revenue,
                 "target_ebitda": target_ebitda,
@@ -215,15 +872,31 @@ class MAAnalyzer:
             }
         }
     
-    def get_precedent_transactions_analysis(self) -> Dict:
-        """Perform precedent transactions analysis"""
+    @cached_analysis
+    def get_precedent_transactions_analysis(
+        self,
+        filters: Optional[Dict] = None,
+        limit: Optional[int] = 500
+    ) -> Dict:
+        """Perform precedent transactions analysis
+        
+        filters are PrecedentStore.query ranges (date, deal value, sector);
+        statistics cover only the matching deals.
+        """
+        store = self.precedents
+        rows = store.query(**(filters or {}))
+        
         # Filter valid transactions
-        valid_txns = [t for t in PRECEDENT_TRANSACTIONS if t["ev_revenue"] > 0]
+        valid_rows = rows[store.column("ev_revenue", rows) > 0]
         
         # Calculate statistics
-        ev_revenue_multiples = [t["ev_revenue"] for t in valid_txns]
-        ev_ebitda_multiples = [t["ev_ebitda"] for t in valid_txns if t["ev_ebitda"] > 0]
-        premiums = [t["premium"] for t in valid_txns if t["premium"] > 0]
+        ev_revenue_multiples = store.column("ev_revenue", valid_rows)
+        ev_ebitda_multiples = store.column("ev_ebitda", valid_rows)
+        ev_ebitda_multiples = ev_ebitda_multiples[ev_ebitda_multiples > 0]
+        premiums = store.column("premium", valid_rows)
+        premiums = premiums[premiums > 0]
+        if not (ev_revenue_multiples.size and ev_ebitda_multiples.size and premiums.size):
+            raise ValueError("Not enough precedent transactions match the filters")
         
         # Target metrics
         target_revenue = self.target["income_statements"][-1]["revenue"]
@@ -238,24 +911,26 @@ class MAAnalyzer:
         implied_ev_ebitda = target_ebitda * median_ev_ebitda
         
         return {
-            "precedent_transactions": valid_txns,
+            "precedent_transactions": store.records(valid_rows[:limit]),
+            "total_transactions": len(store),
+            "matched_transactions": int(valid_rows.size),
             "multiples_analysis": {
                 "ev_revenue": {
-                    "min": min(ev_revenue_multiples),
+                    "min": ev_revenue_multiples.min(),
                     "median": median_ev_revenue,
-                    "max": max(ev_revenue_multiples),
+                    "max": ev_revenue_multiples.max(),
                     "mean": np.mean(ev_revenue_multiples)
                 },
                 "ev_ebitda": {
-                    "min": min(ev_ebitda_multiples),
+                    "min": ev_ebitda_multiples.min(),
                     "median": median_ev_ebitda,
-                    "max": max(ev_ebitda_multiples),
+                    "max": ev_ebitda_multiples.max(),
                     "mean": np.mean(ev_ebitda_multiples)
                 },
                 "acquisition_premium": {
-                    "min": min(premiums) * 100,
+                    "min": premiums.min() * 100,
                     "median": median_premium * 100,
-                    "max": max(premiums) * 100,
+                    "max": premiums.max() * 100,
                     "mean": np.mean(premiums) * 100
                 }
             },
@@ -269,6 +944,7 @@ class MAAnalyzer:
             }
         }
     
+    @cached_analysis
     def calculate_synergies(self) -> Dict:
         """Calculate merger synergies"""
         target_revenue = self.target["income_statements"][-1]["revenue"]
@@ -278,10 +954,10 @@ class MAAnalyzer:
         synergies = self.calc.calculate_synergies(
             acquirer_revenue=acquirer_revenue,
             target_revenue=target_revenue,
-            cross_sell_rate=0.15,  # 15% revenue uplift from cross-selling
-            cost_synergy_percent=0.18,  # 18% cost savings
+            cross_sell_rate=self.assumptions["cross_sell_rate"],
+            cost_synergy_percent=self.assumptions["cost_synergy_percent"],
             target_opex=target_opex,
-            one_time_costs=2500  # $2.5B integration costs
+            one_time_costs=self.assumptions["one_time_costs"]
         )
         
         return {
@@ -299,12 +975,13 @@ class MAAnalyzer:
                 "Vendor and procurement savings": synergies["cost_synergies"] * 0.20
             },
             "synergy_realization_timeline": {
-                "Year 1": synergies["total_synergies"] * 0.25,
-                "Year 2": synergies["total_synergies"] * 0.65,
-                "Year 3+": synergies["total_synergies"]
+                "Year 1": synergies["total_synergies"] * SYNERGY_PHASE_IN[0],
+                "Year 2": synergies["total_synergies"] * SYNERGY_PHASE_IN[1],
+                "Year 3+": synergies["total_synergies"] * SYNERGY_PHASE_IN[2]
             }
         }
     
+    @cached_analysis
     def calculate_accretion_dilution(self) -> Dict:
         """Calculate EPS accretion/dilution"""
         acquirer_ni = self.acquirer["income_statements"][-1]["net_income"]
@@ -315,9 +992,10 @@ class MAAnalyzer:
         synergies = self.calculate_synergies()
         synergies_after_tax = synergies["net_synergy_value"] * (1 - self.market["tax_rate"])
         
-        # Assume 10% stock consideration
-        deal_value = 165000  # $165B target price
-        stock_consideration = deal_value * 0.10
+        # Stock/cash consideration mix
+        deal_value = self.assumptions["deal_value"]
+        stock_percent = self.assumptions["stock_consideration_percent"]
+        stock_consideration = deal_value * stock_percent
         new_shares = stock_consideration / self.acquirer["current_share_price"]
         
         ad_analysis = self.calc.calculate_accretion_dilution(
@@ -337,7 +1015,7 @@ class MAAnalyzer:
             "break_even_synergies": ad_analysis["break_even_synergies"],
             "deal_structure": {
                 "total_consideration": deal_value,
-                "cash_component": deal_value * 0.90,
+                "cash_component": deal_value * (1 - stock_percent),
                 "stock_component": stock_consideration,
                 "new_shares_issued": new_shares,
                 "pro_forma_shares": acquirer_shares + new_shares
@@ -345,6 +1023,219 @@ class MAAnalyzer:
             "synergies_impact": synergies_after_tax
         }
     
+    def _projected_net_income(self, data: Dict, growth_rates: List[float]) -> np.ndarray:
+        """Net income path at the latest net margin on projected revenue"""
+        latest_is = data["income_statements"][-1]
+        revenue = latest_is["revenue"] * np.cumprod(1 + np.asarray(growth_rates, dtype=float))
+        return revenue * latest_is["net_income"] / latest_is["revenue"]
+    
+    def _pro_forma_paths(
+        self,
+        synergy_phase_in: Optional[List[float]] = None,
+        acquirer_growth_rates: Optional[List[float]] = None
+    ) -> Dict:
+        """Per-year inputs of calculate_accretion_dilution_batch over the projection horizon"""
+        growth_rates = list(self.assumptions["growth_rates"])
+        n_years = len(growth_rates)
+        if acquirer_growth_rates is None:
+            acquirer_growth_rates = [float(self.statements.cagr("revenue")[0])] * n_years
+        if len(acquirer_growth_rates) != n_years:
+            raise ValueError(f"acquirer_growth_rates needs {n_years} values")
+        phase_in = list(synergy_phase_in or SYNERGY_PHASE_IN)[:n_years]
+        phase_in += [phase_in[-1]] * (n_years - len(phase_in))
+        one_time_costs = np.zeros(n_years)
+        one_time_costs[0] = self.assumptions["one_time_costs"]
+        first_year = self.target["income_statements"][-1]["year"] + 1
+        return {
+            "years": list(range(first_year, first_year + n_years)),
+            "acquirer_growth_rates": [float(g) for g in acquirer_growth_rates],
+            "acquirer_net_income": self._projected_net_income(self.acquirer, acquirer_growth_rates),
+            "target_net_income": self._projected_net_income(self.target, growth_rates),
+            "synergy_phase_in": phase_in,
+            "one_time_costs": one_time_costs
+        }
+    
+    @cached_analysis
+    def calculate_multi_year_accretion(
+        self,
+        stock_percent: Optional[List[float]] = None,
+        premium: Optional[List[float]] = None,
+        financing_rate: Optional[List[float]] = None,
+        synergy_phase_in: Optional[List[float]] = None,
+        acquirer_growth_rates: Optional[List[float]] = None
+    ) -> Dict:
+        """EPS accretion/dilution for each projection year and deal structure
+        
+        The target's net income follows the DCF revenue path, the acquirer's
+        its historical revenue CAGR (or acquirer_growth_rates), both at their
+        latest net margin. Synergies phase in per synergy_phase_in (default
+        SYNERGY_PHASE_IN, the last share holding thereafter) and one-time
+        costs land in year 1. Scenarios are every combination of stock_percent,
+        premium and financing_rate (default: the base case, with the deal
+        value fixed at its assumption unless premiums are given).
+        """
+        paths = self._pro_forma_paths(synergy_phase_in, acquirer_growth_rates)
+        
+        axes = {
+            "stock_percent": stock_percent or [self.assumptions["stock_consideration_percent"]],
+            "premium": premium or [None],
+            "financing_rate": financing_rate or [self.assumptions["cost_of_debt"]]
+        }
+        n_scenarios = len(axes["stock_percent"]) * len(axes["premium"]) * len(axes["financing_rate"])
+        if n_scenarios > MAX_ACCRETION_SCENARIOS:
+            raise ValueError(f"{n_scenarios} scenarios requested; the limit is {MAX_ACCRETION_SCENARIOS}")
+        offer_values = np.array([
+            self.assumptions["deal_value"] if p is None else
+            self.target["current_share_price"] * (1 + p) * self.target["shares_outstanding"]
+            for p in axes["premium"]
+        ])
+        stock_grid, deal_grid, rate_grid = np.meshgrid(
+            np.asarray(axes["stock_percent"], dtype=float), offer_values,
+            np.asarray(axes["financing_rate"], dtype=float), indexing="ij"
+        )
+        
+        result = self.calc.calculate_accretion_dilution_batch(
+            acquirer_net_income=paths["acquirer_net_income"],
+            target_net_income=paths["target_net_income"],
+            acquirer_shares=self.acquirer["shares_outstanding"],
+            acquirer_share_price=self.acquirer["current_share_price"],
+            deal_value=deal_grid.ravel(),
+            stock_percent=stock_grid.ravel(),
+            financing_rate=rate_grid.ravel(),
+            tax_rate=self.market["tax_rate"],
+            run_rate_synergies=self.calculate_synergies()["total_synergies"],
+            synergy_phase_in=paths["synergy_phase_in"],
+            one_time_costs=paths["one_time_costs"]
+        )
+        
+        years = paths["years"]
+        accretive = result["accretion_dilution_percent"] > 0
+        first_accretive = np.where(accretive.any(axis=1), accretive.argmax(axis=1), -1)
+        
+        return {
+            "years": years,
+            # Scenarios run over these axes in row-major order
+            "axes": {
+                "stock_percent": [float(v) for v in axes["stock_percent"]],
+                "premium": axes["premium"],
+                "financing_rate": [float(v) for v in axes["financing_rate"]]
+            },
+            "scenarios": {
+                "stock_percent": stock_grid.ravel().tolist(),
+                "deal_value": deal_grid.ravel().tolist(),
+                "financing_rate": rate_grid.ravel().tolist()
+            },
+            "synergy_phase_in": paths["synergy_phase_in"],
+            "acquirer_growth_rates": paths["acquirer_growth_rates"],
+            # (scenarios, years)
+            **{name: _masked_matrix(values) for name, values in result.items()},
+            "first_accretive_year": [years[i] if i >= 0 else None for i in first_accretive]
+        }
+    
+    @cached_analysis
+    def optimize_consideration_mix(
+        self,
+        stock_percent: Optional[List[float]] = None,
+        financing_rate: Optional[List[float]] = None,
+        premium: Optional[List[float]] = None,
+        year: int = 2,
+        max_leverage: Optional[float] = None
+    ) -> Dict:
+        """Cash/stock mix sweep: accretion surface, pro forma leverage and efficient frontier
+        
+        Every premium x financing rate x stock mix cell is one scenario of
+        the multi-year engine, evaluated for a single projection year. The
+        cash portion is borrowed, so pro forma net debt / LTM EBITDA depends
+        on premium and mix only. A mix is on the efficient frontier of its
+        (premium, rate) slice when no mix with less leverage is at least as
+        accretive; `optimal` is the most accretive mix within max_leverage.
+        """
+        stock_percent = np.asarray(
+            stock_percent if stock_percent is not None else np.linspace(0, 1, 21), dtype=float)
+        base_rate = self.assumptions["cost_of_debt"]
+        financing_rate = np.asarray(
+            financing_rate if financing_rate is not None else base_rate + np.linspace(-0.02, 0.03, 11),
+            dtype=float)
+        base_premium = self.assumptions["acquisition_premium"]
+        premium = np.asarray(
+            premium if premium is not None else base_premium + np.linspace(-0.2, 0.2, 9), dtype=float)
+        shape = (premium.size, financing_rate.size, stock_percent.size)
+        if not all(shape) or int(np.prod(shape)) > MAX_MIX_GRID_CELLS:
+            raise ValueError(f"Mix grid needs between 1 and {MAX_MIX_GRID_CELLS} cells, got {int(np.prod(shape))}")
+        paths = self._pro_forma_paths()
+        if not 1 <= year <= len(paths["years"]):
+            raise ValueError(f"year must be between 1 and {len(paths['years'])}")
+        t = year - 1
+        
+        # Axes: [premium, financing rate, stock mix]
+        deal_value = self.target["current_share_price"] * (1 + premium) * self.target["shares_outstanding"]
+        deal_grid, rate_grid, stock_grid = np.meshgrid(deal_value, financing_rate, stock_percent, indexing="ij")
+        result = self.calc.calculate_accretion_dilution_batch(
+            acquirer_net_income=paths["acquirer_net_income"][t],
+            target_net_income=paths["target_net_income"][t],
+            acquirer_shares=self.acquirer["shares_outstanding"],
+            acquirer_share_price=self.acquirer["current_share_price"],
+            deal_value=deal_grid.ravel(),
+            stock_percent=stock_grid.ravel(),
+            financing_rate=rate_grid.ravel(),
+            tax_rate=self.market["tax_rate"],
+            run_rate_synergies=self.calculate_synergies()["total_synergies"],
+            synergy_phase_in=paths["synergy_phase_in"][t],
+            one_time_costs=paths["one_time_costs"][t]
+        )
+        accretion = result["accretion_dilution_percent"].reshape(shape)
+        
+        # Pro forma leverage at close: (premium, mix)
+        net_debt = sum(
+            data["balance_sheets"][-1]["long_term_debt"] + data["balance_sheets"][-1]["short_term_debt"] -
+            data["balance_sheets"][-1]["cash"]
+            for data in (self.acquirer, self.target)
+        )
+        ebitda = sum(data["income_statements"][-1]["ebitda"] for data in (self.acquirer, self.target))
+        leverage = (net_debt + deal_value[:, None] * (1 - stock_percent)) / ebitda
+        
+        # Frontier: walk each slice from least to most leverage, keeping
+        # mixes that beat every less-levered one
+        order = np.argsort(leverage, axis=1, kind="stable")
+        by_leverage = np.take_along_axis(accretion, order[:, None, :], axis=2)
+        best_so_far = np.maximum.accumulate(by_leverage, axis=2)
+        improves = np.concatenate(
+            [np.ones(shape[:2] + (1,), dtype=bool), by_leverage[..., 1:] > best_so_far[..., :-1]], axis=2
+        )
+        on_frontier = np.empty(shape, dtype=bool)
+        np.put_along_axis(on_frontier, np.broadcast_to(order[:, None, :], shape), improves, axis=2)
+        
+        allowed = np.ones(leverage.shape, dtype=bool) if max_leverage is None else leverage <= max_leverage
+        capped = np.where(allowed[:, None, :], accretion, -np.inf)
+        best = capped.argmax(axis=2)
+        feasible = np.isfinite(np.take_along_axis(capped, best[..., None], axis=2)[..., 0])
+        
+        return {
+            "year": paths["years"][t],
+            "axes": ["premium", "financing_rate", "stock_percent"],
+            "premium": premium.tolist(),
+            "financing_rate": financing_rate.tolist(),
+            "stock_percent": stock_percent.tolist(),
+            "max_leverage": max_leverage,
+            # [premium][financing rate][stock mix]
+            "accretion_dilution_percent": _masked_matrix(accretion),
+            "pro_forma_eps": _masked_matrix(result["pro_forma_eps"].reshape(shape)),
+            "on_frontier": on_frontier.tolist(),
+            # [premium][stock mix]
+            "pro_forma_net_leverage": _masked_matrix(leverage),
+            # [premium][financing rate]
+            "optimal": {
+                "stock_percent": _masked_matrix(np.where(feasible, stock_percent[best], np.nan)),
+                "accretion_dilution_percent": _masked_matrix(
+                    np.where(feasible, np.take_along_axis(accretion, best[..., None], axis=2)[..., 0], np.nan)),
+                "pro_forma_net_leverage": _masked_matrix(
+                    np.where(feasible, np.take_along_axis(
+                        np.broadcast_to(leverage[:, None, :], shape), best[..., None], axis=2)[..., 0], np.nan))
+            },
+            "acquirer_standalone_eps": float(result["acquirer_standalone_eps"].flat[0])
+        }
+    
+    @cached_analysis
     def get_valuation_summary(self) -> Dict:
         """Comprehensive valuation summary"""
         dcf = self.calculate_dcf_valuation("target")
@@ -356,11 +1247,13 @@ class MAAnalyzer:
         comps_val = comps["implied_valuations"]["blended_valuation"]
         precedents_val = precedents["implied_valuations"]["blended_valuation"]
         
-        # Weights: DCF 40%, Comps 35%, Precedents 25%
-        weighted_ev = (dcf_val * 0.40) + (comps_val * 0.35) + (precedents_val * 0.25)
+        # Weights: DCF 40%, Comps 35%, Precedents 25% by default
+        weighted_ev = (dcf_val * self.assumptions["dcf_weight"]) + \
+                      (comps_val * self.assumptions["comps_weight"]) + \
+                      (precedents_val * self.assumptions["precedents_weight"])
         
         # Apply premium
-        premium = 0.30  # 30% acquisition premium
+        premium = self.assumptions["acquisition_premium"]
         implied_offer_ev = weighted_ev * (1 + premium)
         
         target_shares = self.target["shares_outstanding"]
@@ -401,6 +1294,7 @@ class MAAnalyzer:
             }
         }
     
+    @cached_analysis
     def get_executive_summary(self) -> Dict:
         """Generate executive summary for the deal"""
         valuation = self.get_valuation_summary()
@@ -414,7 +1308,7 @@ class MAAnalyzer:
                 "proposed_deal_value": valuation["recommendation"]["total_deal_value"],
                 "offer_price_per_share": valuation["recommendation"]["target_offer_price"],
                 "premium_to_current": valuation["offer_analysis"]["implied_premium"],
-                "structure": "90% Cash / 10% Stock"
+                "structure": _structure_label(self.assumptions["stock_consideration_percent"])
             },
             "strategic_rationale": [
                 "Creates leading enterprise cloud platform combining CRM and ITSM",
@@ -448,3 +1342,429 @@ class MAAnalyzer:
                 "rationale": "Compelling strategic fit with achievable synergies, accretive to EPS, and strengthens competitive moat in enterprise cloud software market"
             }
         }
+    
+    @cached_analysis
+    def screen_acquisition_pairs(
+        self,
+        metric: str = "accretion_dilution_percent",
+        ascending: bool = False,
+        top_k: int = 100,
+        premium: Optional[float] = None,
+        stock_percent: Optional[float] = None,
+        acquirer_filters: Optional[Dict] = None,
+        target_filters: Optional[Dict] = None,
+        require_larger_acquirer: bool = True
+    ) -> Dict:
+        """Rank every acquirer x target pairing in the comps universe
+        
+        Deal terms default to this deal's assumptions; synergies and one-time
+        costs scale with each target's revenue and cost base.
+        """
+        target_revenue = self.target["income_statements"][-1]["revenue"]
+        premium = self.assumptions["acquisition_premium"] if premium is None else premium
+        stock_percent = (self.assumptions["stock_consideration_percent"]
+                         if stock_percent is None else stock_percent)
+        one_time_cost_percent = self.assumptions["one_time_costs"] / target_revenue
+        
+        screen = screen_pairs(
+            self.comparables,
+            premium=premium,
+            stock_percent=stock_percent,
+            cross_sell_rate=self.assumptions["cross_sell_rate"],
+            cost_synergy_percent=self.assumptions["cost_synergy_percent"],
+            one_time_cost_percent=one_time_cost_percent,
+            tax_rate=self.market["tax_rate"],
+            metric=metric,
+            ascending=ascending,
+            top_k=top_k,
+            acquirer_mask=self.comparables.mask(**acquirer_filters) if acquirer_filters else None,
+            target_mask=self.comparables.mask(**target_filters) if target_filters else None,
+            require_larger_acquirer=require_larger_acquirer
+        )
+        
+        return {
+            "universe_size": len(self.comparables),
+            "deal_terms": {
+                "premium": premium,
+                "stock_percent": stock_percent,
+                "cross_sell_rate": self.assumptions["cross_sell_rate"],
+                "cost_synergy_percent": self.assumptions["cost_synergy_percent"],
+                "one_time_cost_percent_of_target_revenue": one_time_cost_percent,
+                "tax_rate": self.market["tax_rate"]
+            },
+            **screen
+        }
+    
+    @cached_analysis
+    def calculate_lbo_returns(
+        self,
+        leverage: Optional[List[float]] = None,
+        entry_multiples: Optional[List[float]] = None,
+        exit_multiples: Optional[List[float]] = None,
+        holding_periods: Optional[List[int]] = None,
+        tranches: Optional[List[Dict]] = None,
+        cash_sweep_percent: float = 1.0,
+        transaction_fee_percent: float = 0.02,
+        target_irr: float = 0.20
+    ) -> Dict:
+        """Sponsor LBO of the target: IRR/MOIC matrix and debt schedules
+        
+        leverage is total debt / LTM EBITDA. Entry multiples default to the
+        offer multiple (current EV/EBITDA with the acquisition premium) +/-20%,
+        exit multiples to 60-100% of the current multiple. Growth beyond the
+        projection horizon holds the final year's rate.
+        """
+        inputs = self._dcf_inputs("target")
+        latest_is = self.target["income_statements"][-1]
+        ltm_ebitda = latest_is["ebitda"]
+        current_multiple = (self.target["market_cap"] + inputs["net_debt"]) / ltm_ebitda
+        offer_multiple = current_multiple * (1 + self.assumptions["acquisition_premium"])
+        
+        leverage = [3.0, 4.0, 5.0, 6.0, 7.0] if leverage is None else leverage
+        if entry_multiples is None:
+            entry_multiples = list(offer_multiple * np.linspace(0.8, 1.2, 5))
+        if exit_multiples is None:
+            exit_multiples = list(current_multiple * np.linspace(0.6, 1.0, 5))
+        holding_periods = [3, 4, 5, 6, 7] if holding_periods is None else holding_periods
+        tranches = tranches or DEFAULT_TRANCHES
+        if not (leverage and entry_multiples and exit_multiples and holding_periods):
+            raise ValueError("Every LBO grid axis needs at least one value")
+        
+        growth_rates = list(inputs["growth_rates"])
+        years = max(max(holding_periods), len(growth_rates))
+        growth_rates += [growth_rates[-1]] * (years - len(growth_rates))
+        projections = self.calc.project_financials(
+            inputs["base_revenue"], growth_rates, inputs["ebitda_margin"],
+            inputs["tax_rate"], inputs["da_percent"], inputs["capex_percent"],
+            inputs["nwc_percent"]
+        )
+        
+        result = lbo_returns(
+            projections,
+            ltm_ebitda=ltm_ebitda,
+            tax_rate=inputs["tax_rate"],
+            leverage=leverage,
+            entry_multiples=entry_multiples,
+            exit_multiples=exit_multiples,
+            holding_periods=holding_periods,
+            tranches=tranches,
+            cash_sweep_percent=cash_sweep_percent,
+            transaction_fee_percent=transaction_fee_percent
+        )
+        schedule = result["schedule"]
+        irr = result["irr"]
+        
+        # Best funded cell and how many clear the sponsor's hurdle
+        funded = np.isfinite(irr)
+        best = None
+        if funded.any():
+            i, e, x, h = np.unravel_index(np.nanargmax(irr), irr.shape)
+            best = {
+                "irr": float(irr[i, e, x, h]),
+                "moic": float(result["moic"][i, e, x, h]),
+                "leverage": float(leverage[i]),
+                "entry_multiple": float(entry_multiples[e]),
+                "exit_multiple": float(exit_multiples[x]),
+                "holding_period": int(holding_periods[h])
+            }
+        
+        ebitda = np.asarray(projections["ebitda"])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            coverage = ebitda / schedule["interest"]
+        debt_schedules = [
+            {
+                "leverage": float(leverage[i]),
+                "debt": float(result["debt"][i]),
+                "tranches": {
+                    t["name"]: schedule["balances"][i, k].tolist() for k, t in enumerate(tranches)
+                },
+                "cash": schedule["cash"][i].tolist(),
+                "interest": schedule["interest"][i].tolist(),
+                "levered_fcf": schedule["levered_fcf"][i].tolist(),
+                "mandatory_repayment": schedule["mandatory_repayment"][i].tolist(),
+                "sweep_repayment": schedule["sweep_repayment"][i].tolist(),
+                "min_interest_coverage": _masked_matrix(np.min(coverage[i])),
+                "exit_net_leverage": _masked_matrix(
+                    result["net_debt_at_exit"][i] / ebitda[np.asarray(holding_periods) - 1]
+                )
+            }
+            for i in range(len(leverage))
+        ]
+        
+        return {
+            "entry": {
+                "ltm_ebitda": ltm_ebitda,
+                "current_ev_ebitda": current_multiple,
+                "offer_ev_ebitda": offer_multiple,
+                "transaction_fee_percent": transaction_fee_percent,
+                "cash_sweep_percent": cash_sweep_percent
+            },
+            "tranches": tranches,
+            "axes": ["leverage", "entry_multiple", "exit_multiple", "holding_period"],
+            "leverage": [float(v) for v in leverage],
+            "entry_multiples": [float(v) for v in entry_multiples],
+            "exit_multiples": [float(v) for v in exit_multiples],
+            "holding_periods": [int(v) for v in holding_periods],
+            "projections": {
+                "revenue": projections["revenue"],
+                "ebitda": projections["ebitda"],
+                "capex": projections["capex"],
+                "nwc_change": projections["nwc_change"]
+            },
+            "sponsor_equity": _masked_matrix(result["sponsor_equity"]),
+            "irr": _masked_matrix(irr),
+            "moic": _masked_matrix(result["moic"]),
+            "debt_schedules": debt_schedules,
+            "summary": {
+                "cells": int(irr.size),
+                "funded_cells": int(funded.sum()),
+                "target_irr": target_irr,
+                "cells_meeting_target_irr": int((irr[funded] >= target_irr).sum()),
+                "best": best
+            }
+        }
+    
+    def _deal_outcome_inputs(self, financing_rate: Optional[float] = None) -> Dict:
+        """Base-case arguments for FinancialCalculator.calculate_deal_outcomes_batch"""
+        return {
+            "acquirer_net_income": self.acquirer["income_statements"][-1]["net_income"],
+            "target_net_income": self.target["income_statements"][-1]["net_income"],
+            "acquirer_shares": self.acquirer["shares_outstanding"],
+            "acquirer_share_price": self.acquirer["current_share_price"],
+            "target_shares": self.target["shares_outstanding"],
+            "target_share_price": self.target["current_share_price"],
+            "one_time_costs": self.assumptions["one_time_costs"],
+            "tax_rate": self.market["tax_rate"],
+            "financing_rate": self.assumptions["cost_of_debt"] if financing_rate is None else financing_rate,
+            "target_value_per_share": self.calculate_dcf_valuation("target")["valuation"]["value_per_share"]
+        }
+    
+    @cached_analysis
+    def solve_deal_terms(
+        self,
+        output: str = "accretion_dilution_percent",
+        targets: Optional[List[float]] = None,
+        solve_for: str = "premium",
+        premium: Optional[List[float]] = None,
+        stock_percent: Optional[List[float]] = None,
+        synergies: Optional[List[float]] = None,
+        financing_rate: Optional[float] = None,
+        lower: Optional[float] = None,
+        upper: Optional[float] = None
+    ) -> Dict:
+        """Goal seek: the premium, stock share or synergies that make `output` hit each target
+        
+        Every combination of targets and the other two terms is one case, and
+        all cases are solved together. Deals are priced per OFFER_ACCRETION_BASIS.
+        """
+        if output not in GOAL_SEEK_OUTPUTS:
+            raise ValueError(f"Unknown output {output!r}; choose from {list(GOAL_SEEK_OUTPUTS)}")
+        if solve_for not in GOAL_SEEK_VARIABLES:
+            raise ValueError(f"Unknown variable {solve_for!r}; choose from {list(GOAL_SEEK_VARIABLES)}")
+        
+        target_revenue = self.target["income_statements"][-1]["revenue"]
+        acquirer_revenue = self.acquirer["income_statements"][-1]["revenue"]
+        default_bounds = {
+            "premium": (-1.0, 5.0),
+            "stock_percent": (0.0, 1.0),
+            "synergies": (-target_revenue, acquirer_revenue + target_revenue)
+        }
+        lower = default_bounds[solve_for][0] if lower is None else lower
+        upper = default_bounds[solve_for][1] if upper is None else upper
+        if not lower < upper:
+            raise ValueError("lower must be below upper")
+        
+        given = {
+            "premium": premium or [self.assumptions["acquisition_premium"]],
+            "stock_percent": stock_percent or [self.assumptions["stock_consideration_percent"]],
+            "synergies": synergies or [self.calculate_synergies()["total_synergies"]]
+        }
+        fixed = [name for name in GOAL_SEEK_VARIABLES if name != solve_for]
+        axes = {"target": [0.0] if targets is None else targets, **{name: given[name] for name in fixed}}
+        n_cases = int(np.prod([len(values) for values in axes.values()]))
+        if n_cases == 0 or n_cases > MAX_GOAL_SEEK_CASES:
+            raise ValueError(f"Goal seek needs between 1 and {MAX_GOAL_SEEK_CASES} cases, got {n_cases}")
+        
+        # One row per case: the outer product of targets and the fixed terms
+        grids = np.meshgrid(*(np.asarray(v, dtype=float) for v in axes.values()), indexing="ij")
+        cases = {name: grid.ravel() for name, grid in zip(axes, grids)}
+        base = self._deal_outcome_inputs(financing_rate)
+        
+        def outcomes(values: np.ndarray, rows: np.ndarray) -> Dict[str, np.ndarray]:
+            terms = {name: cases[name][rows] for name in fixed}
+            terms[solve_for] = values
+            return self.calc.calculate_deal_outcomes_batch(
+                **base,
+                premium=terms["premium"],
+                stock_percent=terms["stock_percent"],
+                total_synergies=terms["synergies"]
+            )
+        
+        solution = solve_bracketed(
+            lambda values, rows: outcomes(values, rows)[output],
+            cases["target"], lower, upper
+        )
+        at_solution = outcomes(solution["x"], np.arange(n_cases))
+        
+        return {
+            "output": output,
+            "solve_for": solve_for,
+            "bounds": [lower, upper],
+            "financing_rate": base["financing_rate"],
+            # Cases run over these axes in row-major order
+            "axes": {name: [float(v) for v in values] for name, values in axes.items()},
+            "cases": {
+                **{name: cases[name].tolist() for name in axes},
+                solve_for: _masked_matrix(solution["x"]),
+                "converged": solution["converged"].tolist(),
+                "iterations": solution["iterations"].tolist(),
+                f"{output}_at_lower": _masked_matrix(solution["at_lower"]),
+                f"{output}_at_upper": _masked_matrix(solution["at_upper"])
+            },
+            "outcomes": {
+                name: _masked_matrix(np.broadcast_to(values, (n_cases,)))
+                for name, values in at_solution.items()
+            },
+            "failed_cases": solution["failed_rows"].tolist()
+        }
+    
+    @cached_analysis
+    def calculate_tornado(self, bump: float = 0.10, bumps: Optional[Dict[str, float]] = None) -> Dict:
+        """One-at-a-time sensitivity of offer price per share and EPS accretion
+        
+        Each assumption is bumped down and up by its relative bump, all in one
+        batch, with accretion as in solve_deal_terms; rankings are by swing.
+        """
+        bumps = bumps or {}
+        unknown = set(bumps) - set(TORNADO_ASSUMPTIONS)
+        if unknown:
+            raise ValueError(f"Unknown tornado assumptions: {sorted(unknown)}")
+        sizes = {name: bumps.get(name, bump) for name in TORNADO_ASSUMPTIONS}
+        if any(not 0 < size <= 1 for size in sizes.values()):
+            raise ValueError("Bumps must be between 0 and 1")
+        
+        # Row 0 is the base case; rows 2i + 1 and 2i + 2 bump assumption i down and up
+        n_rows = 1 + 2 * len(TORNADO_ASSUMPTIONS)
+        rows = {}
+        for name in TORNADO_ASSUMPTIONS:
+            base_value = np.asarray(self.assumptions[name], dtype=float)
+            rows[name] = np.broadcast_to(base_value, (n_rows,) + base_value.shape).copy()
+        for i, name in enumerate(TORNADO_ASSUMPTIONS):
+            for row, direction in ((2 * i + 1, -1), (2 * i + 2, 1)):
+                rows[name][row] = rows[name][row] * (1 + direction * sizes[name])
+                if name in _VALUATION_WEIGHTS:
+                    base_weight = self.assumptions[name]
+                    rows[name][row] = min(rows[name][row], 1.0)
+                    rest = 1 - base_weight
+                    for other in _VALUATION_WEIGHTS:
+                        if other != name:
+                            rows[other][row] = (
+                                self.assumptions[other] * (1 - rows[name][row]) / rest if rest else 0.0
+                            )
+        
+        inputs = self._dcf_inputs("target")
+        wacc = self.calc.calculate_wacc(
+            risk_free_rate=inputs["risk_free_rate"],
+            beta=inputs["beta"],
+            market_risk_premium=inputs["market_risk_premium"],
+            cost_of_debt=rows["cost_of_debt"],
+            tax_rate=inputs["tax_rate"],
+            debt_to_equity=inputs["debt_to_equity"]
+        )
+        dcf = self.calc.calculate_dcf_valuation_batch(
+            base_revenue=inputs["base_revenue"],
+            growth_rates=rows["growth_rates"],
+            ebitda_margin=rows["ebitda_margin"],
+            tax_rate=inputs["tax_rate"],
+            da_percent_revenue=rows["da_percent"],
+            capex_percent_revenue=rows["capex_percent"],
+            nwc_percent_revenue=rows["nwc_percent"],
+            wacc=wacc,
+            terminal_growth_rate=inputs["terminal_growth"],
+            net_debt=inputs["net_debt"],
+            shares_outstanding=inputs["shares"]
+        )
+        weighted_ev = (
+            dcf["enterprise_value"] * rows["dcf_weight"] +
+            self.get_comparable_companies_analysis()["implied_valuations"]["blended_valuation"] * rows["comps_weight"] +
+            self.get_precedent_transactions_analysis()["implied_valuations"]["blended_valuation"] * rows["precedents_weight"]
+        )
+        price_per_share = (
+            weighted_ev * (1 + rows["acquisition_premium"]) - inputs["net_debt"]
+        ) / inputs["shares"]
+        
+        latest_is = self.target["income_statements"][-1]
+        total_synergies = (
+            latest_is["revenue"] * rows["cross_sell_rate"] +
+            latest_is["operating_expenses"] * rows["cost_synergy_percent"]
+        )
+        outcomes = self.calc.calculate_deal_outcomes_batch(
+            **{**self._deal_outcome_inputs(), "one_time_costs": rows["one_time_costs"],
+               "financing_rate": rows["cost_of_debt"]},
+            premium=rows["acquisition_premium"],
+            stock_percent=self.assumptions["stock_consideration_percent"],
+            total_synergies=total_synergies
+        )
+        accretion = outcomes["accretion_dilution_percent"]
+        
+        def ranked(values: np.ndarray) -> List[Dict]:
+            impacts = []
+            for i, name in enumerate(TORNADO_ASSUMPTIONS):
+                low, high = float(values[2 * i + 1]), float(values[2 * i + 2])
+                impacts.append({
+                    "assumption": name,
+                    "low": low,
+                    "high": high,
+                    "change_low": low - float(values[0]),
+                    "change_high": high - float(values[0]),
+                    "swing": abs(high - low)
+                })
+            return sorted(impacts, key=lambda impact: impact["swing"], reverse=True)
+        
+        def inputs_at(name: str, row: int):
+            value = rows[name][row]
+            return value.tolist() if np.ndim(value) else float(value)
+        
+        return {
+            "bumps": sizes,
+            "assumptions": {
+                name: {
+                    "base": inputs_at(name, 0),
+                    "low": inputs_at(name, 2 * i + 1),
+                    "high": inputs_at(name, 2 * i + 2)
+                }
+                for i, name in enumerate(TORNADO_ASSUMPTIONS)
+            },
+            "base": {
+                "price_per_share": float(price_per_share[0]),
+                "offer_accretion_dilution_percent": float(accretion[0]),
+                "deal_value": float(outcomes["deal_value"][0]),
+                "financing_rate": float(rows["cost_of_debt"][0])
+            },
+            "price_per_share": ranked(price_per_share),
+            "offer_accretion_dilution_percent": ranked(accretion)
+        }
+    
+    def batch_etag(self, sections: List[str], company: str = "target") -> str:
+        """Entity tag of a get_batch call, combining the tags of its sections"""
+        unknown = [name for name in sections if name not in BATCH_SECTIONS]
+        if unknown:
+            raise ValueError(f"Unknown sections: {unknown}")
+        tags = []
+        for name in dict.fromkeys(sections):
+            method, takes_company = BATCH_SECTIONS[name]
+            tags.append([name, self.etag(method, *((company,) if takes_company else ()))])
+        return fingerprint(tags)
+    
+    def get_batch(self, sections: List[str], company: str = "target") -> Dict:
+        """Several sections in one call, computing each shared analysis once"""
+        unknown = [name for name in sections if name not in BATCH_SECTIONS]
+        if unknown:
+            raise ValueError(f"Unknown sections: {unknown}")
+        results = {}
+        with shared_results():
+            for name in dict.fromkeys(sections):
+                method, takes_company = BATCH_SECTIONS[name]
+                args = (company,) if takes_company else ()
+                results[name] = getattr(self, method)(*args)
+        return results
@@ -0,0 +1,166 @@
+"""Per-route request metrics in Prometheus text format"""
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+import time
+
+
+
+# Upper bounds of the latency (seconds) and payload size (bytes) buckets
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+_METHODS = frozenset(("GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"))
+
+
+class Histogram:
+    """Cumulative-bucket histogram; observe() is a bisect and two additions"""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def samples(self) -> Iterable[Tuple[str, float]]:
+        """(le, cumulative count) pairs, ending with +Inf"""
+        total = 0
+        for bound, count in zip(self.bounds, self.counts):
+            total += count
+            yield repr(float(bound)), total
+        yield "+Inf", self.count
+
+
+class _RouteStats:
+    __slots__ = ("errors", "statuses", "latency", "size")
+
+    def __init__(self):
+        self.errors = 0
+        self.statuses: Dict[int, int] = {}
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.size = Histogram(SIZE_BUCKETS)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+class RequestMetrics:
+    """Request counts, errors, latency and payload-size histograms per
+    (method, route template), and in-flight gauges per method
+
+    Everything is updated on the event loop thread, so no locking is needed.
+    """
+
+    def __init__(self):
+        self._routes: Dict[Tuple[str, str], _RouteStats] = {}
+        self.in_flight: Dict[str, int] = {}
+
+    def route(self, method: str, route: str) -> _RouteStats:
+        stats = self._routes.get((method, route))
+        if stats is None:
+            stats = self._routes[(method, route)] = _RouteStats()
+        return stats
+
+    def render(self, extra: Optional[List[str]] = None) -> str:
+        """All metrics in Prometheus text exposition format"""
+        lines = []
+        routes = sorted(self._routes.items())
+
+        lines += ["# HELP http_requests_total Completed HTTP requests.",
+                  "# TYPE http_requests_total counter"]
+        for (method, route), stats in routes:
+            for status, count in sorted(stats.statuses.items()):
+                lines.append(f"http_requests_total{_labels(method=method, route=route, status=status)} {count}")
+
+        lines += ["# HELP http_request_errors_total Requests answered with a 5xx status or an unhandled exception.",
+                  "# TYPE http_request_errors_total counter"]
+        for (method, route), stats in routes:
+            lines.append(f"http_request_errors_total{_labels(method=method, route=route)} {stats.errors}")
+
+        lines += ["# HELP http_requests_in_flight Requests currently being served.",
+                  "# TYPE http_requests_in_flight gauge"]
+        for method, count in sorted(self.in_flight.items()):
+            lines.append(f"http_requests_in_flight{_labels(method=method)} {count}")
+
+        for name, attr, help_text in (
+            ("http_request_duration_seconds", "latency", "Time from request start to the last body byte."),
+            ("http_response_size_bytes", "size", "Response body size.")
+        ):
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+            for (method, route), stats in routes:
+                histogram = getattr(stats, attr)
+                for le, count in histogram.samples():
+                    lines.append(f"{name}_bucket{_labels(method=method, route=route, le=le)} {count}")
+                lines.append(f"{name}_sum{_labels(method=method, route=route)} {histogram.sum}")
+                lines.append(f"{name}_count{_labels(method=method, route=route)} {histogram.count}")
+
+        return "\n".join(lines + (extra or [])) + "\n"
+
+
+def gauge_lines(name: str, help_text: str, samples: Iterable[Tuple[Dict, float]], kind: str = "gauge") -> List[str]:
+    """Exposition lines for a metric from (labels, value) samples"""
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+    lines += [f"{name}{_labels(**labels) if labels else ''} {value}" for labels, value in samples]
+    return lines
+
+
+class MetricsMiddleware:
+    """ASGI middleware feeding RequestMetrics
+
+    Requests are labelled with their route template (e.g.
+    /api/ma/scenarios/{scenario_id}), never the raw path, so label
+    cardinality stays bounded; unknown paths share the "unmatched" label.
+    The template is read from the route the router picked, so it is only
+    known once a request completes: in-flight requests are counted by
+    method alone. Latency runs to the last body chunk, so streamed
+    responses are timed in full.
+    """
+
+    def __init__(self, app: Callable, metrics: RequestMetrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"] if scope["method"] in _METHODS else "OTHER"
+        started = time.perf_counter()
+        status = 500
+        size = 0
+
+        async def send_wrapper(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        in_flight = self.metrics.in_flight
+        in_flight[method] = in_flight.get(method, 0) + 1
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            status = 500
+            raise
+        finally:
+            in_flight[method] -= 1
+            template = getattr(scope.get("route"), "path", None) or "unmatched"
+            stats = self.metrics.route(method, template)
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+            if status >= 500:
+                stats.errors += 1
+            stats.latency.observe(time.perf_counter() - started)
+            stats.size.observe(size)
@@ -0,0 +1,149 @@
+"""Monte Carlo helpers: assumption sampling and streaming distribution stats"""
+from typing import Dict, List, Optional
+import numpy as np
+
+
+DISTRIBUTION_KINDS = ("fixed", "normal", "uniform", "triangular", "lognormal")
+
+# Default uncertainty around the base-case DCF assumptions. growth_shift is a
+# parallel shift applied to every year of the projected growth path.
+DEFAULT_DCF_DISTRIBUTIONS = {
+    "growth_shift": {"kind": "normal", "mean": 0.0, "std": 0.02},
+    "ebitda_margin": {"kind": "normal", "std": 0.015},
+    "beta": {"kind": "normal", "std": 0.15},
+    "market_risk_premium": {"kind": "normal", "std": 0.01},
+    "terminal_growth": {"kind": "triangular", "low": 0.015, "high": 0.035}
+}
+
+
+def sample_distribution(
+    spec: Dict,
+    rng: np.random.Generator,
+    size: int,
+    default_mean: float
+) -> np.ndarray:
+    """Draw `size` values from a spec (kind, mean, std, low, high, mode)
+
+    A missing mean, or triangular mode, falls back to default_mean.
+    """
+    kind = spec.get("kind", "normal")
+    mean = spec.get("mean")
+    mean = default_mean if mean is None else mean
+    std = spec.get("std") or 0.0
+
+    if kind == "fixed" or (kind in ("normal", "lognormal") and std == 0):
+        return np.full(size, mean, dtype=float)
+    if kind == "normal":
+        return rng.normal(mean, std, size)
+    if kind == "lognormal":
+        if mean <= 0:
+            raise ValueError("lognormal distributions require a positive mean")
+        sigma2 = np.log1p((std / mean) ** 2)
+        return rng.lognormal(np.log(mean) - sigma2 / 2, np.sqrt(sigma2), size)
+
+    low, high = spec.get("low"), spec.get("high")
+    if low is None or high is None or low > high:
+        raise ValueError(f"{kind} distributions require low <= high")
+    if kind == "uniform":
+        return rng.uniform(low, high, size)
+    if kind == "triangular":
+        mode = spec.get("mode")
+        mode = mean if mode is None else mode
+        if not low <= mode <= high:
+            raise ValueError("triangular mode must lie within [low, high]")
+        if low == high:
+            return np.full(size, low, dtype=float)
+        return rng.triangular(low, mode, high, size)
+    raise ValueError(f"Unknown distribution kind: {kind}")
+
+
+class StreamingDistribution:
+    """Fixed-memory summary of a stream of values fed in chunks
+
+    The histogram range is set by the first chunk; later outliers count as underflow/overflow.
+    """
+
+    def __init__(self, bins: int = 50, resolution: int = 64):
+        self.bins = bins
+        self.resolution = resolution
+        self.counts = np.zeros(bins * resolution, dtype=np.int64)
+        self.low: Optional[float] = None
+        self.high: Optional[float] = None
+        self.underflow = 0
+        self.overflow = 0
+        self.count = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def _set_range(self, values: np.ndarray) -> None:
+        low, high = np.percentile(values, [0.1, 99.9])
+        pad = (high - low) * 0.25 or max(abs(low) * 0.01, 1.0)
+        self.low, self.high = float(low - pad), float(high + pad)
+
+    def update(self, values: np.ndarray) -> None:
+        values = values[np.isfinite(values)]
+        if values.size == 0:
+            return
+        if self.low is None:
+            self._set_range(values)
+
+        self.count += values.size
+        self.total += float(values.sum())
+        self.total_sq += float(np.square(values).sum())
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+
+        self.underflow += int(np.count_nonzero(values < self.low))
+        self.overflow += int(np.count_nonzero(values > self.high))
+        counts, _ = np.histogram(values, bins=self.counts.size, range=(self.low, self.high))
+        self.counts += counts
+
+    def percentiles(self, qs: List[float]) -> Dict[str, float]:
+        """Approximate percentiles interpolated within histogram bins"""
+        if self.count == 0:
+            return {self._label(q): None for q in qs}
+        edges = np.linspace(self.low, self.high, self.counts.size + 1)
+        cumulative = self.underflow + np.cumsum(self.counts)
+        result = {}
+        for q in qs:
+            rank = q / 100 * self.count
+            if rank <= self.underflow:
+                value = self.min if self.underflow else self.low
+            elif rank > cumulative[-1]:
+                value = self.max
+            else:
+                i = int(np.searchsorted(cumulative, rank))
+                before = cumulative[i - 1] if i > 0 else self.underflow
+                frac = (rank - before) / self.counts[i] if self.counts[i] else 0.0
+                value = edges[i] + frac * (edges[i + 1] - edges[i])
+            result[self._label(q)] = float(min(max(value, self.min), self.max))
+        return result
+
+    def histogram(self) -> Dict:
+        """Histogram over the tracked range at the requested bin count"""
+        coarse = self.counts.reshape(self.bins, self.resolution).sum(axis=1)
+        edges = np.linspace(self.low, self.high, self.bins + 1) if self.low is not None else []
+        return {
+            "bin_edges": [float(e) for e in edges],
+            "counts": [int(c) for c in coarse],
+            "underflow": self.underflow,
+            "overflow": self.overflow
+        }
+
+    def summary(self) -> Dict:
+        if self.count == 0:
+            return {"mean": None, "std": None, "min": None, "max": None}
+        mean = self.total / self.count
+        variance = max(self.total_sq / self.count - mean ** 2, 0.0)
+        return {
+            "mean": mean,
+            "std": float(np.sqrt(variance)),
+            "min": self.min,
+            "max": self.max
+        }
+
+    @staticmethod
+    def _label(q: float) -> str:
+        return f"p{q:g}"
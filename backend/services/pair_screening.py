@@ -0,0 +1,167 @@
+"""Acquirer x target pair screening across a comparable-companies universe"""
+from typing import Dict, Iterator, Optional, Tuple
+import numpy as np
+
+from backend.data.comps_universe import CompsUniverse
+from backend.services.financial_calculator import FinancialCalculator
+
+
+# Metrics pairs can be ranked by
+SCREEN_METRICS = (
+    "accretion_dilution_percent",
+    "combined_net_income",
+    "synergies_after_tax",
+    "implied_offer_value",
+    "target_ownership_percent"
+)
+
+
+def _pair_metrics(
+    universe: CompsUniverse,
+    acquirers: np.ndarray,
+    targets: np.ndarray,
+    premium: float,
+    stock_percent: float,
+    cross_sell_rate: float,
+    cost_synergy_percent: float,
+    one_time_cost_percent: float,
+    tax_rate: float,
+    require_larger_acquirer: bool
+) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+    """Deal metrics for acquirer/target row indexes broadcast against each other
+
+    Pass acquirers[:, None] and targets[None, :] for a pair matrix, or two
+    equal-length vectors for a list of specific pairs.
+    """
+    cols = universe.columns
+    acq_mcap = cols["market_cap"][acquirers]
+    acq_ni = cols["net_income"][acquirers]
+    # Without share counts, value acquirer stock at $1/share: accretion and
+    # ownership are scale-free, only absolute EPS needs real share counts
+    acq_shares = cols["shares_outstanding"][acquirers]
+    has_shares = np.isfinite(acq_shares) & (acq_shares > 0)
+    acq_shares = np.where(has_shares, acq_shares, acq_mcap)
+    acq_price = acq_mcap / acq_shares
+
+    tgt_revenue = cols["revenue"][targets]
+    tgt_ni = cols["net_income"][targets]
+    tgt_opex = np.maximum(tgt_revenue - cols["ebitda"][targets], 0)
+    offer = cols["market_cap"][targets] * (1 + premium)
+
+    synergies = FinancialCalculator.calculate_synergies(
+        acquirer_revenue=cols["revenue"][acquirers],
+        target_revenue=tgt_revenue,
+        cross_sell_rate=cross_sell_rate,
+        cost_synergy_percent=cost_synergy_percent,
+        target_opex=tgt_opex,
+        one_time_costs=tgt_revenue * one_time_cost_percent
+    )
+    synergies_after_tax = synergies["net_synergy_value"] * (1 - tax_rate)
+    new_shares = offer * stock_percent / acq_price
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ad = FinancialCalculator.calculate_accretion_dilution(
+            acquirer_net_income=acq_ni,
+            target_net_income=tgt_ni,
+            acquirer_shares=acq_shares,
+            synergies_after_tax=synergies_after_tax,
+            new_shares_issued=new_shares
+        )
+
+    shape = np.broadcast_shapes(np.shape(acquirers), np.shape(targets))
+    valid = (acq_ni > 0) & (acquirers != targets)
+    if require_larger_acquirer:
+        valid = valid & (acq_mcap > offer)
+
+    metrics = {
+        "accretion_dilution_percent": ad["accretion_dilution_percent"],
+        "combined_net_income": acq_ni + tgt_ni + synergies_after_tax,
+        "synergies_after_tax": synergies_after_tax,
+        "implied_offer_value": offer,
+        "target_ownership_percent": new_shares / (acq_shares + new_shares) * 100,
+        # null for acquirers without a share count
+        "combined_eps": np.where(has_shares, ad["combined_eps_with_synergies"], np.nan)
+    }
+    return {name: np.broadcast_to(v, shape) for name, v in metrics.items()}, np.broadcast_to(valid, shape)
+
+
+def screen_pairs(
+    universe: CompsUniverse,
+    premium: float,
+    stock_percent: float,
+    cross_sell_rate: float,
+    cost_synergy_percent: float,
+    one_time_cost_percent: float,
+    tax_rate: float,
+    metric: str = "accretion_dilution_percent",
+    ascending: bool = False,
+    top_k: int = 100,
+    acquirer_mask: Optional[np.ndarray] = None,
+    target_mask: Optional[np.ndarray] = None,
+    require_larger_acquirer: bool = True,
+    block_rows: int = 256
+) -> Dict:
+    """Top-K acquirer/target pairs by `metric` over the full pair matrix
+
+    The matrix is evaluated in blocks of acquirer rows, keeping only a
+    running top-K, so memory is O(block_rows x targets) for any universe.
+    """
+    if metric not in SCREEN_METRICS:
+        raise ValueError(f"Unknown screening metric: {metric}")
+    all_rows = np.arange(len(universe))
+    acquirers = all_rows if acquirer_mask is None else all_rows[acquirer_mask]
+    targets = all_rows if target_mask is None else all_rows[target_mask]
+
+    sign = 1.0 if ascending else -1.0
+    best_scores = np.empty(0)
+    best_pairs = np.empty((0, 2), dtype=np.intp)
+    evaluated = valid_pairs = 0
+
+    for start in range(0, acquirers.size, block_rows):
+        block = acquirers[start:start + block_rows]
+        metrics, valid = _pair_metrics(
+            universe, block[:, None], targets[None, :], premium, stock_percent, cross_sell_rate,
+            cost_synergy_percent, one_time_cost_percent, tax_rate, require_larger_acquirer
+        )
+        score = np.where(valid & np.isfinite(metrics[metric]), sign * metrics[metric], np.inf)
+        evaluated += score.size
+        valid_pairs += int(np.count_nonzero(np.isfinite(score)))
+
+        flat = score.ravel()
+        k = min(top_k, flat.size)
+        candidates = np.argpartition(flat, k - 1)[:k] if k < flat.size else np.arange(flat.size)
+        candidates = candidates[np.isfinite(flat[candidates])]
+        rows, cols = np.unravel_index(candidates, score.shape)
+
+        best_scores = np.concatenate([best_scores, flat[candidates]])
+        best_pairs = np.concatenate([best_pairs, np.column_stack([block[rows], targets[cols]])])
+        keep = np.argsort(best_scores, kind="stable")[:top_k]
+        best_scores, best_pairs = best_scores[keep], best_pairs[keep]
+
+    return {
+        "metric": metric,
+        "pairs_evaluated": evaluated,
+        "valid_pairs": valid_pairs,
+        "pairs": list(_pair_records(
+            universe, best_pairs, premium, stock_percent, cross_sell_rate,
+            cost_synergy_percent, one_time_cost_percent, tax_rate
+        ))
+    }
+
+
+def _pair_records(universe, pairs, *deal_terms) -> Iterator[Dict]:
+    """Full metric set for the selected pairs, in ranked order"""
+    if len(pairs) == 0:
+        return
+    metrics, _ = _pair_metrics(universe, pairs[:, 0], pairs[:, 1], *deal_terms, False)
+    for rank, (i, j) in enumerate(pairs):
+        row = {name: values[rank] for name, values in metrics.items()}
+        yield {
+            "rank": rank + 1,
+            "acquirer": universe.tickers[i],
+            "acquirer_name": universe.names[i],
+            "target": universe.tickers[j],
+            "target_name": universe.names[j],
+            **{name: float(v) if np.isfinite(v) else None for name, v in row.items()},
+            "is_accretive": bool(row["accretion_dilution_percent"] > 0)
+        }
@@ -0,0 +1,178 @@
+"""Result cache for analysis methods keyed on a hash of their inputs"""
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+import hashlib
+import inspect
+import json
+import sys
+import threading
+import time
+
+
+# Results shared by every analysis call inside one shared_results() block
+_shared_results: ContextVar[Optional[Dict[str, Any]]] = ContextVar("shared_results", default=None)
+
+
+@contextmanager
+def shared_results():
+    """Compute each analysis at most once within the block, cache or not
+
+    Used to serve several sections in one request without recomputing the
+    analyses they have in common. Nested blocks share the outer one.
+    """
+    if _shared_results.get() is not None:
+        yield
+        return
+    token = _shared_results.set({})
+    try:
+        yield
+    finally:
+        _shared_results.reset(token)
+
+
+def _json_default(value: Any) -> Any:
+    # No value can be a NumPy one until something has imported NumPy
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(value, np.ndarray):
+        return value.tolist()
+    if np is not None and isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+def fingerprint(value: Any) -> str:
+    """Stable content hash of a JSON-like structure"""
+    payload = json.dumps(value, sort_keys=True, default=_json_default, separators=(",", ":"))
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+class ResultCache:
+    """Thread-safe LRU cache with TTL expiry and hit/miss counters
+
+    Each entry is tagged with the input sources it was computed from so that
+    invalidate(source) drops only the results that depend on that source.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: Optional[float] = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any, frozenset]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._by_label: Dict[str, Dict[str, int]] = {}
+
+    def _count(self, label: str, outcome: str) -> None:
+        counters = self._by_label.setdefault(label, {"hits": 0, "misses": 0})
+        counters[outcome] += 1
+
+    def get(self, key: Hashable, label: str = "") -> Tuple[bool, Any]:
+        """Return (hit, value) and update the counters"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and time.monotonic() - entry[0] > self.ttl:
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                self._count(label, "misses")
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            self._count(label, "hits")
+            return True, entry[1]
+
+    def set(self, key: Hashable, value: Any, sources: Iterable[str] = ()) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value, frozenset(sources))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, source: Optional[str] = None) -> int:
+        """Drop entries computed from `source` (or everything); returns the count"""
+        with self._lock:
+            if source is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+                return dropped
+            stale = [
+                key for key, (_, _, sources) in self._entries.items()
+                if source in sources or any(s.startswith(source + ".") for s in sources)
+            ]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "by_method": {label: dict(c) for label, c in self._by_label.items()}
+            }
+
+
+def bind_call_args(signature: inspect.Signature, owner: Any, args: Tuple, kwargs: Dict) -> Dict:
+    """Arguments of a method call by name, defaults filled in, without `self`"""
+    bound = signature.bind(owner, *args, **kwargs)
+    bound.apply_defaults()
+    return dict(list(bound.arguments.items())[1:])
+
+
+def analysis_key(owner: Any, name: str, call_args: Dict) -> Tuple[str, list]:
+    """Hash of an analysis call and every input it reads; returns (key, sources)"""
+    sources = owner.analysis_sources(name)
+    key = fingerprint([
+        name,
+        call_args,
+        {source: owner.source_fingerprint(source) for source in sources}
+    ])
+    return key, sources
+
+
+def cached_analysis(method: Callable) -> Callable:
+    """Memoize an analysis method on its arguments and input fingerprints
+
+    The owning object provides `cache` (a ResultCache or None),
+    `analysis_sources(name)` listing every input the method reads, directly
+    or through upstream analyses, and `source_fingerprint(source)`.
+    """
+    signature = inspect.signature(method)
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        cache = getattr(self, "cache", None)
+        shared = _shared_results.get()
+        if cache is None and shared is None:
+            return method(self, *args, **kwargs)
+
+        key, sources = analysis_key(self, name, bind_call_args(signature, self, args, kwargs))
+
+        if shared is not None and key in shared:
+            return shared[key]
+        hit, value = cache.get(key, name) if cache is not None else (False, None)
+        if not hit:
+            value = method(self, *args, **kwargs)
+            if cache is not None:
+                cache.set(key, value, sources)
+        if shared is not None:
+            shared[key] = value
+        return value
+
+    return wrapper
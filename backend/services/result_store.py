@@ -0,0 +1,192 @@
+"""Rendered analysis results persisted in MongoDB across restarts and workers"""
+from datetime import datetime, timezone
+from typing import Callable, Dict, Optional
+import asyncio
+import logging
+import time
+
+
+
+logger = logging.getLogger(__name__)
+
+# Stay clear of MongoDB's 16MB document limit
+MAX_DOCUMENT_BYTES = 15 * 1024 * 1024
+
+
+class AnalysisResultStore:
+    """Write-behind store of serialized results keyed by a hash of their inputs
+
+    Keys already encode the analysis arguments, input fingerprints and code
+    version, so a stored payload never goes stale; a TTL index on created_at
+    evicts old ones. Writes are buffered and flushed with unordered bulk
+    upserts; the buffer holds at most max_pending_bytes, dropping the oldest
+    payloads first (e.g. while the flush task is not running). Reads that fail or take longer than read_timeout suspend the
+    store for retry_after seconds, so an unreachable database only costs
+    the recomputation it was meant to save.
+    """
+
+    def __init__(
+        self,
+        collection,
+        code_version: Callable[[], str],
+        ttl_seconds: int = 7 * 24 * 3600,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        read_timeout: float = 0.25,
+        retry_after: float = 30.0,
+        max_pending_bytes: int = 64 * 1024 * 1024
+    ):
+        self.collection = collection
+        self._code_version = code_version
+        self.ttl_seconds = ttl_seconds
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.read_timeout = read_timeout
+        self.retry_after = retry_after
+        self.max_pending_bytes = max_pending_bytes
+        self._pending: Dict[str, bytes] = {}
+        self._pending_bytes = 0
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._suspended_until = 0.0
+        self.reads = self.hits = self.writes = self.errors = self.skipped = self.dropped = 0
+
+    async def ensure_indexes(self) -> None:
+        from pymongo.errors import PyMongoError  # deferred with the Mongo client, see server.py
+        try:
+            await self.collection.create_index(
+                "created_at", expireAfterSeconds=self.ttl_seconds, name="created_at_ttl"
+            )
+            await self.collection.create_index("code_version", name="code_version")
+        except PyMongoError as e:
+            self._suspend("create indexes", e)
+
+    @property
+    def code_version(self) -> str:
+        """Version tag of the stored results, read from the callable on use"""
+        return self._code_version()
+
+    def _suspend(self, action: str, error: Exception) -> None:
+        self.errors += 1
+        self._suspended_until = time.monotonic() + self.retry_after
+        logger.warning("Analysis result store unavailable (%s): %s", action, error)
+
+    @property
+    def available(self) -> bool:
+        return time.monotonic() >= self._suspended_until
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Stored payload for `key`, or None (also when the store is unavailable)"""
+        pending = self._pending.get(key)
+        if pending is not None:
+            return pending
+        if not self.available:
+            return None
+        from pymongo.errors import PyMongoError
+        self.reads += 1
+        try:
+            doc = await asyncio.wait_for(
+                self.collection.find_one({"_id": key}, {"payload": 1}), self.read_timeout
+            )
+        except (PyMongoError, asyncio.TimeoutError) as e:
+            self._suspend("read", e)
+            return None
+        if doc is None:
+            return None
+        self.hits += 1
+        return bytes(doc["payload"])
+
+    def put(self, key: str, payload: bytes) -> None:
+        """Queue a payload for the next bulk write"""
+        if len(payload) > MAX_DOCUMENT_BYTES:
+            self.skipped += 1
+            return
+        previous = self._pending.pop(key, None)
+        if previous is not None:
+            self._pending_bytes -= len(previous)
+        self._pending[key] = payload
+        self._pending_bytes += len(payload)
+        while self._pending_bytes > self.max_pending_bytes:
+            oldest = next(iter(self._pending))
+            self._pending_bytes -= len(self._pending.pop(oldest))
+            self.dropped += 1
+        if self._wake is not None and len(self._pending) >= self.batch_size:
+            self._wake.set()
+
+    async def flush(self) -> int:
+        """Write every queued payload in one unordered bulk upsert"""
+        if not self._pending:
+            return 0
+        batch, self._pending = self._pending, {}
+        self._pending_bytes = 0
+        if not self.available:
+            return 0
+        from pymongo import UpdateOne
+        from pymongo.errors import PyMongoError
+        now = datetime.now(timezone.utc)
+        operations = [
+            UpdateOne(
+                {"_id": key},
+                {"$set": {
+                    "payload": payload,
+                    "size": len(payload),
+                    "code_version": self.code_version,
+                    "created_at": now
+                }},
+                upsert=True
+            )
+            for key, payload in batch.items()
+        ]
+        try:
+            await self.collection.bulk_write(operations, ordered=False)
+        except PyMongoError as e:
+            self._suspend("write", e)
+            return 0
+        self.writes += len(operations)
+        return len(operations)
+
+    async def _run(self) -> None:
+        await self.ensure_indexes()
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+
+    def start(self) -> None:
+        """Create the indexes and start flushing, in the background"""
+        if self._task is None:
+            self._wake = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            self._task.add_done_callback(self._flusher_done)
+
+    def _flusher_done(self, task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Analysis result store flusher stopped", exc_info=task.exception())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    def stats(self) -> Dict:
+        return {
+            "available": self.available,
+            "code_version": self.code_version,
+            "ttl_seconds": self.ttl_seconds,
+            "reads": self.reads,
+            "hits": self.hits,
+            "writes": self.writes,
+            "pending": len(self._pending),
+            "pending_bytes": self._pending_bytes,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "skipped_oversize": self.skipped
+        }
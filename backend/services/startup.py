@@ -0,0 +1,166 @@
+"""Cold-start instrumentation and lazily built services"""
+from contextlib import contextmanager
+from importlib.abc import MetaPathFinder
+from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar
+import logging
+import sys
+import threading
+import time
+
+
+T = TypeVar("T")
+
+
+class _TimedLoader:
+    """Wraps a module loader to time exec_module, delegating everything else"""
+
+    def __init__(self, loader, report: "StartupReport"):
+        self._loader = loader
+        self._report = report
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        stack = self._report._stack()
+        stack.append(0.0)
+        started = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            elapsed = time.perf_counter() - started
+            nested = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            self._report.imports[module.__name__] = {
+                "inclusive_seconds": elapsed,
+                "self_seconds": elapsed - nested
+            }
+
+
+class _ImportTimer(MetaPathFinder):
+    def __init__(self, report: "StartupReport"):
+        self._report = report
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, self._report)
+                return spec
+        return None
+
+
+class StartupReport:
+    """Per-module import times and named initialization phases
+
+    Imports are timed only inside track_imports(); each module records its
+    inclusive time and its self time (excluding modules it imported).
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.imports: Dict[str, Dict[str, float]] = {}
+        self.phases: Dict[str, float] = {}
+        self._local = threading.local()
+        self._tracking = 0
+        self._lock = threading.Lock()
+        self._finder = _ImportTimer(self)
+
+    def _stack(self) -> List[float]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def track_imports(self):
+        with self._lock:
+            if self._tracking == 0:
+                sys.meta_path.insert(0, self._finder)
+            self._tracking += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._tracking -= 1
+                if self._tracking == 0:
+                    sys.meta_path.remove(self._finder)
+
+    @contextmanager
+    def phase(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - started
+
+    def as_dict(self, top: int = 25) -> Dict:
+        by_self = sorted(self.imports.items(), key=lambda item: item[1]["self_seconds"], reverse=True)
+        # Top-level packages, with the time their first import took in total
+        packages: Dict[str, float] = {}
+        for name, timing in self.imports.items():
+            root = name.split(".")[0]
+            if root == name or name.startswith("backend."):
+                key = name if name.startswith("backend.") else root
+                packages[key] = max(packages.get(key, 0.0), timing["inclusive_seconds"])
+        return {
+            "elapsed_seconds": time.perf_counter() - self.started,
+            "import_seconds": sum(t["self_seconds"] for t in self.imports.values()),
+            "modules_imported": len(self.imports),
+            "packages": dict(sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]),
+            "slowest_modules": [{"module": name, **timing} for name, timing in by_self[:top]],
+            "phases": dict(self.phases)
+        }
+
+    def log(self, logger: logging.Logger, top: int = 10) -> None:
+        report = self.as_dict(top)
+        logger.info("Startup: %.0f ms importing %d modules", report["import_seconds"] * 1000,
+                    report["modules_imported"])
+        for name, seconds in report["packages"].items():
+            logger.info("  import %-40s %8.1f ms", name, seconds * 1000)
+        for name, seconds in report["phases"].items():
+            logger.info("  init   %-40s %8.1f ms", name, seconds * 1000)
+
+
+# Filled in as the server imports and warms up
+startup_report = StartupReport()
+
+
+class Lazy(Generic[T]):
+    """A service built on first use (or ahead of time, by calling get())
+
+    Attribute access is forwarded to the built object, so a Lazy can stand
+    in wherever the object itself is used. The build runs once, under a
+    lock, and its duration is recorded as an initialization phase.
+    """
+
+    def __init__(self, factory: Callable[[], T], name: str, report: Optional[StartupReport] = None):
+        self._factory = factory
+        self._name = name
+        self._report = report or startup_report
+        self._value: Optional[T] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._value is not None
+
+    def get(self) -> T:
+        value = self._value
+        if value is None:
+            with self._lock:
+                if self._value is None:
+                    with self._report.phase(self._name), self._report.track_imports():
+                        self._value = self._factory()
+                value = self._value
+        return value
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.get(), name)
@@ -31,29 +31,19 @@ function App() {
   const loadAllData = async () => {
     try {
       setLoading(true);
-      const [overview, financials, dcf, comps, precedents, synergies, accretion, valuation, executive] = await Promise.all([
-        maApi.getOverview(),
-        maApi.getFinancials(),
-        maApi.getDCF(),
-        maApi.getComparableCompanies(),
-        maApi.getPrecedentTransactions(),
-        maApi.getSynergies(),
-        maApi.getAccretionDilution(),
-        maApi.getValuationSummary(),
-        maApi.getExecutiveSummary(),
+      const { data: sections } = await maApi.getBatch([
+        'overview',
+        'financials',
+        'dcf',
+        'comps',
+        'precedents',
+        'synergies',
+        'accretion',
+        'valuation',
+        'executive',
       ]);
 
-      setData({
-        overview: overview.data,
-        financials: financials.data,
-        dcf: dcf.data,
-        comps: comps.data,
-        precedents: precedents.data,
-        synergies: synergies.data,
-        accretion: accretion.data,
-        valuation: valuation.data,
-        executive: executive.data,
-      });
+      setData(sections);
     } catch (error) {
       console.error('Error loading data:', error);
     } finally {
@@ -20,6 +20,13 @@ export const maApi = {
   getAccretionDilution: () => api.get('/ma/accretion-dilution'),
   getValuationSummary: () => api.get('/ma/valuation-summary'),
   getExecutiveSummary: () => api.get('/ma/executive-summary'),
+  getBatch: (sections, company = 'target') => api.get('/ma/batch', {
+    params: { sections, company },
+    paramsSerializer: { indexes: null },
+  }),
+  createScenario: (assumptions = {}) => api.post('/ma/scenarios', { assumptions }),
+  updateScenario: (id, assumptions) => api.patch(`/ma/scenarios/${id}`, { assumptions }),
+  deleteScenario: (id) => api.delete(`/ma/scenarios/${id}`),
 };
 
 export default api;
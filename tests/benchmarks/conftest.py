@@ -0,0 +1,161 @@
+"""Benchmark harness: timing, JSON baselines and regression checks
+
+Benchmarks only run when BENCHMARK=1:
+
+    BENCHMARK=1 python -m pytest tests/benchmarks -q
+
+Each benchmark's median time is compared with baselines.json (override the
+path with BENCHMARK_BASELINE) and the test fails when it is slower by more
+than BENCHMARK_THRESHOLD (default 0.5, i.e. +50%). Baselines are absolute
+timings, so they are machine specific and not committed: record them on the
+machine that checks them with
+
+    BENCHMARK=1 BENCHMARK_SAVE=1 python -m pytest tests/benchmarks -q
+
+Without a baseline file the benchmarks only time. Every run's timings are
+also written to BENCHMARK_OUTPUT (default results.json next to this file).
+"""
+from pathlib import Path
+from typing import Callable, Dict
+import json
+import os
+import statistics
+import time
+
+import numpy as np
+import pytest
+
+from backend.data.comps_universe import CompsUniverse
+from backend.data.precedent_store import PrecedentStore
+
+
+HERE = Path(__file__).parent
+BASELINE_PATH = Path(os.environ.get("BENCHMARK_BASELINE", HERE / "baselines.json"))
+OUTPUT_PATH = Path(os.environ.get("BENCHMARK_OUTPUT", HERE / "results.json"))
+THRESHOLD = float(os.environ.get("BENCHMARK_THRESHOLD", 0.5))
+SAVE = os.environ.get("BENCHMARK_SAVE") == "1"
+# Differences below this many seconds are timer noise, whatever the ratio
+NOISE_FLOOR = 20e-6
+
+_results: Dict[str, Dict] = {}
+
+
+def pytest_collection_modifyitems(config, items):
+    if os.environ.get("BENCHMARK") == "1":
+        return
+    skip = pytest.mark.skip(reason="benchmarks run with BENCHMARK=1")
+    for item in items:
+        if HERE in Path(str(item.fspath)).parents:
+            item.add_marker(skip)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if not _results:
+        return
+    OUTPUT_PATH.write_text(json.dumps(_results, indent=2, sort_keys=True) + "\n")
+    if SAVE:
+        BASELINE_PATH.write_text(json.dumps(_results, indent=2, sort_keys=True) + "\n")
+
+
+def measure(func: Callable, min_time: float = 0.2, max_time: float = 2.0,
+            min_rounds: int = 5, max_rounds: int = 1000) -> Dict:
+    """Time repeated calls after one warm-up call"""
+    func()
+    times = []
+    started = time.perf_counter()
+    while len(times) < max_rounds:
+        t0 = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - t0)
+        elapsed = time.perf_counter() - started
+        if (elapsed >= min_time and len(times) >= min_rounds) or (elapsed >= max_time and len(times) >= 3):
+            break
+    return {
+        "median": statistics.median(times),
+        "min": min(times),
+        "rounds": len(times)
+    }
+
+
+@pytest.fixture(scope="session")
+def baselines() -> Dict[str, Dict]:
+    if SAVE or not BASELINE_PATH.exists():
+        return {}
+    return json.loads(BASELINE_PATH.read_text())
+
+
+@pytest.fixture
+def benchmark(request, baselines):
+    """Time `func` under this test's name and check it against the baseline"""
+    def run(func: Callable, **options) -> Dict:
+        name = request.node.nodeid.split("::", 1)[1]
+        result = measure(func, **options)
+        _results[name] = result
+        baseline = baselines.get(name)
+        if baseline is not None:
+            limit = baseline["median"] * (1 + THRESHOLD)
+            if result["median"] > limit and result["median"] - baseline["median"] > NOISE_FLOOR:
+                pytest.fail(
+                    f"{name} regressed: median {result['median'] * 1e3:.3f} ms vs baseline "
+                    f"{baseline['median'] * 1e3:.3f} ms (threshold +{THRESHOLD:.0%})"
+                )
+        return result
+
+    return run
+
+
+@pytest.fixture(scope="session")
+def scaled_universe() -> CompsUniverse:
+    """20,000 synthetic listed companies"""
+    rng = np.random.default_rng(0)
+    n = 20000
+    revenue = rng.lognormal(8, 1.2, n)
+    market_cap = revenue * rng.uniform(1, 15, n)
+    ebitda = revenue * rng.uniform(-0.1, 0.45, n)
+    columns = {
+        "market_cap": market_cap,
+        "enterprise_value": market_cap * rng.uniform(0.8, 1.2, n),
+        "revenue": revenue,
+        "ebitda": ebitda,
+        "net_income": ebitda * rng.uniform(0.3, 0.8, n),
+        "revenue_growth": rng.normal(0.12, 0.08, n),
+        "shares_outstanding": market_cap / rng.uniform(10, 500, n)
+    }
+    return CompsUniverse([f"T{i}" for i in range(n)], [f"Company {i}" for i in range(n)], columns)
+
+
+@pytest.fixture(scope="session")
+def screening_universe(scaled_universe) -> CompsUniverse:
+    """First 2,000 companies of the scaled universe: a 4M-pair screen"""
+    rows = slice(0, 2000)
+    return CompsUniverse(
+        scaled_universe.tickers[rows], scaled_universe.names[rows],
+        {field: values[rows] for field, values in scaled_universe.columns.items()}
+    )
+
+
+@pytest.fixture(scope="session")
+def scaled_precedents() -> PrecedentStore:
+    """100,000 synthetic precedent deals over 25 years"""
+    rng = np.random.default_rng(1)
+    n = 100000
+    deal_value = rng.lognormal(7, 1.5, n)
+    revenue = deal_value / rng.uniform(2, 20, n)
+    ebitda = revenue * rng.uniform(0.05, 0.4, n)
+    sectors = np.array(["Enterprise Software", "Fintech", "Healthcare IT", "Semiconductors"], dtype=object)
+    return PrecedentStore(
+        rng.integers(2000 * 12, 2025 * 12, n),
+        {
+            "deal_value": deal_value,
+            "target_revenue": revenue,
+            "target_ebitda": ebitda,
+            "ev_revenue": deal_value / revenue,
+            "ev_ebitda": deal_value / ebitda,
+            "premium": rng.uniform(0.1, 0.6, n)
+        },
+        {
+            "acquirer": np.array([f"Acquirer {i % 500}" for i in range(n)], dtype=object),
+            "target": np.array([f"Target {i}" for i in range(n)], dtype=object),
+            "sector": sectors[rng.integers(0, len(sectors), n)]
+        }
+    )
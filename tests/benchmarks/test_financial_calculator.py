@@ -0,0 +1,84 @@
+"""FinancialCalculator hot paths at realistic and scaled-up sizes"""
+import numpy as np
+import pytest
+
+from backend.services.financial_calculator import FinancialCalculator
+
+
+DCF_ASSUMPTIONS = {
+    "ebitda_margin": 0.215,
+    "tax_rate": 0.20,
+    "da_percent_revenue": 0.04,
+    "capex_percent_revenue": 0.05,
+    "nwc_percent_revenue": 0.02
+}
+VALUATION_ASSUMPTIONS = {
+    "wacc": 0.095,
+    "terminal_growth_rate": 0.03,
+    "net_debt": -5000.0,
+    "shares_outstanding": 206.0
+}
+# Projection horizon in years
+SIZES = {"realistic": 5, "scaled": 50}
+
+
+def _growth_path(years: int) -> list:
+    return list(np.linspace(0.22, 0.04, years))
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_project_financials(benchmark, size):
+    growth = _growth_path(SIZES[size])
+    benchmark(lambda: FinancialCalculator.project_financials(10984.0, growth, **DCF_ASSUMPTIONS))
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_calculate_dcf_valuation(benchmark, size):
+    growth = _growth_path(SIZES[size])
+    benchmark(lambda: FinancialCalculator.calculate_dcf_valuation(
+        10984.0, growth, **DCF_ASSUMPTIONS, **VALUATION_ASSUMPTIONS
+    ))
+
+
+@pytest.mark.parametrize("n_flows", [5, 1000], ids=["realistic", "scaled"])
+def test_calculate_npv(benchmark, n_flows):
+    cash_flows = list(np.linspace(1000.0, 5000.0, n_flows))
+    benchmark(lambda: FinancialCalculator.calculate_npv(cash_flows, 0.095))
+
+
+@pytest.mark.parametrize("scenarios", [1, 100000], ids=["realistic", "scaled"])
+def test_calculate_dcf_valuation_batch(benchmark, scenarios):
+    rng = np.random.default_rng(0)
+    ebitda_margin = rng.normal(0.215, 0.02, scenarios)
+    wacc = rng.uniform(0.08, 0.11, scenarios)
+    assumptions = {**DCF_ASSUMPTIONS, "ebitda_margin": ebitda_margin}
+    valuation = {**VALUATION_ASSUMPTIONS, "wacc": wacc}
+    benchmark(lambda: FinancialCalculator.calculate_dcf_valuation_batch(
+        10984.0, _growth_path(5), **assumptions, **valuation
+    ))
+
+
+@pytest.mark.parametrize("steps", [9, 500], ids=["realistic", "scaled"])
+def test_calculate_dcf_sensitivity_grid(benchmark, steps):
+    fcf = np.array([3000.0, 3600.0, 4200.0, 4800.0, 5400.0])
+    benchmark(lambda: FinancialCalculator.calculate_dcf_sensitivity_grid(
+        fcf, np.linspace(0.07, 0.12, steps), np.linspace(0.01, 0.04, steps), -5000.0, 206.0
+    ))
+
+
+def _investment_streams(streams: int, years: int) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return np.column_stack([-rng.uniform(50, 150, streams), rng.uniform(0, 60, (streams, years))])
+
+
+@pytest.mark.parametrize("streams", [1, 100000], ids=["realistic", "scaled"])
+def test_calculate_irr_batch(benchmark, streams):
+    flows = _investment_streams(streams, 6)
+    benchmark(lambda: FinancialCalculator.calculate_irr_batch(flows))
+
+
+@pytest.mark.parametrize("streams", [1, 100000], ids=["realistic", "scaled"])
+def test_calculate_xirr_batch(benchmark, streams):
+    flows = _investment_streams(streams, 6)
+    dates = np.datetime64("2024-01-15") + np.array([0, 90, 365, 730, 1095, 1460, 1826])
+    benchmark(lambda: FinancialCalculator.calculate_xirr_batch(flows, dates))
@@ -0,0 +1,123 @@
+"""MAAnalyzer methods, uncached, on the bundled data and on scaled-up universes"""
+import numpy as np
+import pytest
+
+from backend.services.ma_analyzer import BATCH_SECTIONS, MAAnalyzer
+from backend.services.result_cache import ResultCache
+
+
+def _uncached(**kwargs) -> MAAnalyzer:
+    # A zero-size cache keeps the key computation but never hits
+    return MAAnalyzer(cache=ResultCache(maxsize=0), **kwargs)
+
+
+@pytest.fixture(scope="module")
+def analyzer() -> MAAnalyzer:
+    return _uncached()
+
+
+@pytest.fixture(scope="module")
+def scaled_analyzer(scaled_universe, scaled_precedents) -> MAAnalyzer:
+    return _uncached(comparables=scaled_universe, precedents=scaled_precedents)
+
+
+@pytest.mark.parametrize("method", [
+    "get_company_overview",
+    "get_financial_statements",
+    "get_historical_metrics",
+    "calculate_dcf_valuation",
+    "get_dcf_sensitivity",
+    "get_comparable_companies_analysis",
+    "get_precedent_transactions_analysis",
+    "calculate_synergies",
+    "calculate_accretion_dilution",
+    "get_valuation_summary",
+    "get_executive_summary",
+    "screen_acquisition_pairs",
+    "calculate_lbo_returns",
+    "solve_deal_terms",
+    "calculate_multi_year_accretion",
+    "optimize_consideration_mix",
+    "calculate_tornado"
+])
+def test_analysis_realistic(benchmark, analyzer, method):
+    benchmark(getattr(analyzer, method))
+
+
+def test_batch_all_sections(benchmark, analyzer):
+    benchmark(lambda: analyzer.get_batch(list(BATCH_SECTIONS)))
+
+
+@pytest.mark.parametrize("n_paths", [10000, 1000000], ids=["realistic", "scaled"])
+def test_simulate_dcf_valuation(benchmark, analyzer, n_paths):
+    benchmark(lambda: analyzer.simulate_dcf_valuation(n_paths=n_paths, seed=0), min_rounds=3)
+
+
+@pytest.mark.parametrize("n_paths", [10000, 1000000], ids=["realistic", "scaled"])
+def test_simulate_exchange_ratio_collar(benchmark, analyzer, n_paths):
+    benchmark(lambda: analyzer.simulate_exchange_ratio_collar(n_paths=n_paths, seed=0), min_rounds=3)
+
+
+def test_dcf_sensitivity_scaled(benchmark, analyzer):
+    wacc = list(np.linspace(0.06, 0.12, 500))
+    growth = list(np.linspace(0.01, 0.04, 500))
+    benchmark(lambda: analyzer.get_dcf_sensitivity(wacc_values=wacc, terminal_growth_values=growth))
+
+
+def test_comparable_companies_scaled(benchmark, scaled_analyzer):
+    benchmark(lambda: scaled_analyzer.get_comparable_companies_analysis(
+        filters={"min_market_cap": 5000, "min_ebitda_margin": 0.1}
+    ))
+
+
+def test_precedent_transactions_scaled(benchmark, scaled_analyzer):
+    benchmark(lambda: scaled_analyzer.get_precedent_transactions_analysis(
+        filters={"start_date": "2015-01", "min_deal_value": 1000, "sector": "software"}
+    ))
+
+
+def test_valuation_summary_scaled(benchmark, scaled_analyzer):
+    benchmark(scaled_analyzer.get_valuation_summary)
+
+
+def test_screen_acquisition_pairs_scaled(benchmark, screening_universe):
+    analyzer = _uncached(comparables=screening_universe)
+    benchmark(lambda: analyzer.screen_acquisition_pairs(top_k=100), min_rounds=3)
+
+
+def test_lbo_returns_scaled(benchmark, analyzer):
+    # 41 x 29 x 29 x 8 = 275,848 returns cells
+    benchmark(lambda: analyzer.calculate_lbo_returns(
+        leverage=list(np.linspace(0, 10, 41)),
+        entry_multiples=list(np.linspace(10, 80, 29)),
+        exit_multiples=list(np.linspace(10, 80, 29)),
+        holding_periods=list(range(3, 11))
+    ), min_rounds=3)
+
+
+def test_solve_deal_terms_scaled(benchmark, analyzer):
+    # 1,000 accretion targets x 100 stock mixes x 10 synergy levels
+    benchmark(lambda: analyzer.solve_deal_terms(
+        targets=list(np.linspace(-10, 5, 1000)),
+        stock_percent=list(np.linspace(0, 1, 100)),
+        synergies=list(np.linspace(0, 10000, 10))
+    ), min_rounds=3)
+
+
+def test_multi_year_accretion_scaled(benchmark, analyzer):
+    # 101 stock mixes x 61 premiums x 13 financing rates, over every projection year
+    benchmark(lambda: analyzer.calculate_multi_year_accretion(
+        stock_percent=list(np.linspace(0, 1, 101)),
+        premium=list(np.linspace(0, 0.6, 61)),
+        financing_rate=list(np.linspace(0.03, 0.09, 13))
+    ), min_rounds=3)
+
+
+def test_consideration_mix_scaled(benchmark, analyzer):
+    # 101 stock mixes x 41 financing rates x 61 premiums
+    benchmark(lambda: analyzer.optimize_consideration_mix(
+        stock_percent=list(np.linspace(0, 1, 101)),
+        financing_rate=list(np.linspace(0.02, 0.1, 41)),
+        premium=list(np.linspace(0, 0.6, 61)),
+        max_leverage=4.0
+    ), min_rounds=3)
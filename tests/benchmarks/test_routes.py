@@ -0,0 +1,182 @@
+"""FastAPI routes end to end, in-process, with MongoDB replaced by an in-memory fake"""
+from datetime import datetime, timedelta, timezone
+import importlib
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.services.ma_analyzer import BATCH_SECTIONS, MAAnalyzer
+from backend.services.result_cache import ResultCache
+
+
+class _FakeCursor:
+    def __init__(self, docs):
+        self._docs = docs
+
+    def sort(self, *args, **kwargs):
+        return self
+
+    def batch_size(self, size):
+        return self
+
+    async def to_list(self, length):
+        return [dict(d) for d in self._docs[:length]]
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for doc in self._docs:
+            yield dict(doc)
+
+
+class _FakeCollection:
+    """Just enough of a Motor collection for the status routes (filters ignored)"""
+
+    def __init__(self):
+        self.docs = []
+
+    async def insert_one(self, doc):
+        self.docs.append(dict(doc))
+
+    def find(self, query=None, projection=None):
+        return _FakeCursor(self.docs)
+
+
+class _FakeDatabase:
+    def __init__(self):
+        self.status_checks = _FakeCollection()
+
+
+@pytest.fixture(scope="module")
+def server():
+    # Measure compute and encoding on every call: no result, rendered or stored caches.
+    # The server reads these at import; they are restored after the module.
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("MA_CACHE_MAXSIZE", "0")
+        mp.setenv("MA_RENDERED_CACHE_MAXSIZE", "0")
+        mp.setenv("MA_RESULT_STORE", "0")
+        module = importlib.import_module("backend.server")
+        mp.setattr(module, "db", _FakeDatabase())
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        module.db.status_checks.docs = [
+            {"id": str(uuid.uuid4()), "client_name": f"client-{i}", "timestamp": start + timedelta(seconds=i)}
+            for i in range(1000)
+        ]
+        yield module
+
+
+@pytest.fixture(scope="module")
+def client(server):
+    return TestClient(server.app)
+
+
+@pytest.fixture
+def scaled_server(server, scaled_universe, scaled_precedents):
+    """Serve from the scaled universes for one test"""
+    analyzer = MAAnalyzer(
+        cache=ResultCache(maxsize=0), comparables=scaled_universe, precedents=scaled_precedents
+    )
+    original = server.ma_analyzer
+    server.ma_analyzer = server.analysis_executor.analyzer = analyzer
+    yield server
+    server.ma_analyzer = server.analysis_executor.analyzer = original
+
+
+def _get(client, path, **params):
+    def call():
+        response = client.get(path, params=params)
+        assert response.status_code == 200, response.text
+    return call
+
+
+def _post(client, path, body):
+    def call():
+        response = client.post(path, json=body)
+        assert response.status_code == 200, response.text
+    return call
+
+
+@pytest.mark.parametrize("path", [
+    "/api/",
+    "/api/ma/overview",
+    "/api/ma/financials",
+    "/api/ma/historical-metrics",
+    "/api/ma/dcf",
+    "/api/ma/dcf/sensitivity",
+    "/api/ma/comparable-companies",
+    "/api/ma/precedent-transactions",
+    "/api/ma/synergies",
+    "/api/ma/accretion-dilution",
+    "/api/ma/valuation-summary",
+    "/api/ma/executive-summary",
+    "/api/status"
+])
+def test_get_route(benchmark, client, path):
+    benchmark(_get(client, path))
+
+
+def test_conditional_get_not_modified(benchmark, client):
+    etag = client.get("/api/ma/executive-summary").headers["etag"]
+
+    def call():
+        response = client.get("/api/ma/executive-summary", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+    benchmark(call)
+
+
+def test_batch_route(benchmark, client):
+    benchmark(_get(client, "/api/ma/batch", sections=list(BATCH_SECTIONS)))
+
+
+def test_status_ndjson_export(benchmark, client):
+    benchmark(_get(client, "/api/status", format="ndjson"))
+
+
+def test_monte_carlo_route(benchmark, client):
+    benchmark(_post(client, "/api/ma/dcf/monte-carlo", {"n_paths": 100000, "seed": 0}), min_rounds=3)
+
+
+def test_collar_simulation_route(benchmark, client):
+    benchmark(_post(client, "/api/ma/exchange-ratio/simulation", {"n_paths": 100000, "seed": 0}), min_rounds=3)
+
+
+def test_dcf_sensitivity_route_scaled(benchmark, client):
+    benchmark(_get(
+        client, "/api/ma/dcf/sensitivity",
+        wacc_min=0.06, wacc_max=0.12, wacc_steps=500,
+        growth_min=0.01, growth_max=0.04, growth_steps=500
+    ), min_rounds=3)
+
+
+def test_comparable_companies_route_scaled(benchmark, client, scaled_server):
+    benchmark(_get(client, "/api/ma/comparable-companies", min_market_cap=5000, limit=20000))
+
+
+def test_precedent_transactions_route_scaled(benchmark, client, scaled_server):
+    benchmark(_get(client, "/api/ma/precedent-transactions", start_date="2015-01", limit=20000))
+
+
+def test_screening_route(benchmark, client):
+    benchmark(_post(client, "/api/ma/screening", {"top_k": 100}))
+
+
+def test_lbo_route(benchmark, client):
+    benchmark(_post(client, "/api/ma/lbo", {}))
+
+
+def test_goal_seek_route(benchmark, client):
+    benchmark(_post(client, "/api/ma/goal-seek", {"solve_for": "synergies", "premium": [0.2, 0.3, 0.4]}))
+
+
+def test_multi_year_accretion_route(benchmark, client):
+    benchmark(_post(client, "/api/ma/accretion-dilution/multi-year", {"stock_percent": [0.1, 0.5, 1.0]}))
+
+
+def test_consideration_mix_route(benchmark, client):
+    benchmark(_post(client, "/api/ma/consideration-mix", {"max_leverage": 4.0}))
+
+
+def test_tornado_route(benchmark, client):
+    benchmark(_post(client, "/api/ma/tornado", {"bumps": {"acquisition_premium": 0.5}}))
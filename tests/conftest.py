@@ -0,0 +1,83 @@
+"""Shared fixtures: the FastAPI app with MongoDB replaced by an in-memory fake"""
+import importlib
+import operator
+
+import pytest
+
+
+_COMPARISONS = {"$gt": operator.gt, "$gte": operator.ge, "$lt": operator.lt, "$lte": operator.le}
+
+
+def _matches(doc, query) -> bool:
+    """Just enough of MongoDB's query language for the status routes"""
+    for field, condition in query.items():
+        if field == "$or":
+            if not any(_matches(doc, clause) for clause in condition):
+                return False
+        elif isinstance(condition, dict):
+            if field not in doc or not all(_COMPARISONS[op](doc[field], v) for op, v in condition.items()):
+                return False
+        elif doc.get(field) != condition:
+            return False
+    return True
+
+
+class FakeCursor:
+    def __init__(self, docs, projection=None):
+        self._docs = docs
+        self._projection = projection or {}
+
+    def sort(self, keys):
+        for field, direction in reversed(keys):
+            self._docs = sorted(self._docs, key=lambda d: d[field], reverse=direction < 0)
+        return self
+
+    def batch_size(self, size):
+        return self
+
+    def _project(self, doc):
+        return {k: v for k, v in doc.items() if self._projection.get(k, 1)}
+
+    async def to_list(self, length):
+        return [self._project(d) for d in self._docs[:length]]
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for doc in self._docs:
+            yield self._project(doc)
+
+
+class FakeCollection:
+    def __init__(self, docs=None):
+        self.docs = list(docs or [])
+
+    async def insert_one(self, doc):
+        self.docs.append(dict(doc))
+
+    def find(self, query=None, projection=None):
+        return FakeCursor([d for d in self.docs if _matches(d, query or {})], projection)
+
+
+class FakeDatabase:
+    def __init__(self):
+        self.status_checks = FakeCollection()
+
+
+@pytest.fixture
+def server(monkeypatch):
+    """backend.server with a fake database and no result store"""
+    monkeypatch.setenv("MONGO_URL", "mongodb://localhost:1")
+    monkeypatch.setenv("DB_NAME", "test")
+    module = importlib.import_module("backend.server")
+    monkeypatch.setattr(module, "db", FakeDatabase())
+    monkeypatch.setattr(module, "result_store", None)
+    module.rendered_responses.invalidate()
+    return module
+
+
+@pytest.fixture
+def client(server):
+    from fastapi.testclient import TestClient
+    return TestClient(server.app)
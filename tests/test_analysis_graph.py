@@ -0,0 +1,79 @@
+"""What-if scenario sessions: assumption validation and all-or-nothing deltas"""
+import pytest
+
+from backend.services.analysis_graph import ScenarioStore
+
+
+@pytest.fixture
+def session():
+    return ScenarioStore().create({"ebitda_margin": 0.25})
+
+
+@pytest.mark.parametrize("delta", [
+    {"growth_rates": [0.1]},
+    {"growth_rates": 0.1},
+    {"ebitda_margin": [0.1]},
+    {"unknown_assumption": 1.0}
+])
+def test_apply_rejects_malformed_deltas(session, delta):
+    before = dict(session.analyzer.assumptions)
+    with pytest.raises(ValueError):
+        session.apply(delta)
+    assert session.analyzer.assumptions == before
+
+
+def test_create_rejects_malformed_assumptions():
+    with pytest.raises(ValueError, match="growth_rates"):
+        ScenarioStore().create({"growth_rates": [0.1, 0.2]})
+
+
+def test_failed_recomputation_keeps_previous_state(session, monkeypatch):
+    before = dict(session.analyzer.assumptions)
+    outputs = dict(session.outputs)
+
+    def broken():
+        raise RuntimeError("synergy model failed")
+
+    monkeypatch.setattr(session.analyzer, "calculate_synergies", broken)
+    with pytest.raises(RuntimeError):
+        session.apply({"cross_sell_rate": 0.3})
+    assert session.analyzer.assumptions == before
+    assert session.outputs == outputs
+
+    monkeypatch.undo()
+    delta = session.apply({"cross_sell_rate": 0.3})
+    assert "synergies" in delta["outputs"]
+    assert session.analyzer.assumptions["cross_sell_rate"] == 0.3
+
+
+@pytest.mark.parametrize("delta", [
+    {"dcf_weight": 2},
+    {"dcf_weight": 0.5},
+    {"acquisition_premium": -0.1},
+    {"cost_of_debt": 0.9},
+    {"cross_sell_rate": 1.5},
+    {"growth_rates": [0.1, 0.1, 0.1, 0.1, 1.2]},
+    {"ebitda_margin": float("nan")}
+])
+def test_apply_rejects_out_of_range_assumptions(session, delta):
+    with pytest.raises(ValueError):
+        session.apply(delta)
+
+
+def test_weights_may_move_together(session):
+    delta = session.apply({"dcf_weight": 0.5, "comps_weight": 0.25})
+    assert "valuation_summary" in delta["outputs"]
+
+
+def test_apply_returns_only_changed_outputs(session):
+    delta = session.apply({"cross_sell_rate": 0.3})
+    assert delta["changed_inputs"] == ["cross_sell_rate"]
+    assert {"synergies", "accretion_dilution"} <= set(delta["outputs"])
+    assert not {"dcf", "comparable_companies", "precedent_transactions"} & set(delta["outputs"])
+    assert session.apply({"cross_sell_rate": 0.3})["outputs"] == {}
+
+
+def test_scenario_route_rejects_impossible_weight(client):
+    response = client.post("/api/ma/scenarios", json={"assumptions": {"dcf_weight": 2}})
+    assert response.status_code == 400
+    assert "dcf_weight" in response.json()["detail"]
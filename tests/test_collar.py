@@ -0,0 +1,46 @@
+"""Exchange ratios at and beyond the collar band edges"""
+import numpy as np
+import pytest
+
+from backend.services.collar import exchange_ratios
+
+
+# $25 of stock per target share at a $50 signing price: 0.5 shares, collared at $45 / $55
+TERMS = {"stock_value": 25.0, "signing_price": 50.0, "collar_lower": 0.9, "collar_upper": 1.1}
+PRICES = np.array([40.0, 45.0, 50.0, 55.0, 60.0])
+
+
+def test_uncollared_structures():
+    ratios = exchange_ratios(PRICES, **TERMS)
+    np.testing.assert_allclose(ratios["fixed_ratio"], 0.5)
+    np.testing.assert_allclose(ratios["floating_ratio"] * PRICES, 25.0)
+
+
+def test_fixed_ratio_collar_fixes_value_outside_the_band():
+    ratios = exchange_ratios(PRICES, **TERMS)["fixed_ratio_collar"]
+    # Inside the band (edges included) the ratio passes through unchanged
+    np.testing.assert_allclose(ratios[1:4], 0.5)
+    # Below the floor the value holds at 0.5 x $45, above the cap at 0.5 x $55
+    np.testing.assert_allclose(ratios[[0, 4]] * PRICES[[0, 4]], [22.5, 27.5])
+
+
+def test_floating_ratio_collar_fixes_the_ratio_outside_the_band():
+    ratios = exchange_ratios(PRICES, **TERMS)["floating_ratio_collar"]
+    # Inside the band (edges included) the value passes through at $25
+    np.testing.assert_allclose(ratios[1:4] * PRICES[1:4], 25.0)
+    # Beyond the edges the ratio stays where the edge left it
+    np.testing.assert_allclose(ratios[[0, 4]], [25 / 45, 25 / 55])
+
+
+def test_collars_are_continuous_at_the_band_edges():
+    edges = np.array([45.0, 55.0])
+    for nudge in (-1e-9, 1e-9):
+        inside, outside = exchange_ratios(edges, **TERMS), exchange_ratios(edges + nudge, **TERMS)
+        for structure in ("fixed_ratio_collar", "floating_ratio_collar"):
+            np.testing.assert_allclose(outside[structure], inside[structure], rtol=1e-9)
+
+
+@pytest.mark.parametrize("lower,upper", [(0.0, 1.1), (1.05, 1.1), (0.9, 0.95)])
+def test_collar_must_bracket_the_signing_price(lower, upper):
+    with pytest.raises(ValueError):
+        exchange_ratios(PRICES, 25.0, 50.0, lower, upper)
@@ -0,0 +1,61 @@
+"""AnalysisExecutor backpressure, and the routes that depend on the executor mode"""
+import asyncio
+import threading
+
+import pytest
+
+from backend.services.executor import AnalysisExecutor, ExecutorBusyError
+
+
+class _Analyzer:
+    def double(self, x):
+        return 2 * x
+
+
+@pytest.fixture
+def executor():
+    executor = AnalysisExecutor(_Analyzer(), max_workers=1, max_queue=0)
+    yield executor
+    executor.shutdown()
+
+
+def test_runs_analyzer_methods_and_callables(executor):
+    async def calls():
+        return await executor.run("double", "double", 4), await executor.run_callable("sum", sum, [1, 2])
+    assert asyncio.run(calls()) == (8, 3)
+    assert executor.stats()["endpoints"]["double"]["calls"] == 1
+
+
+def test_rejects_calls_beyond_its_slots(executor):
+    release = threading.Event()
+
+    async def calls():
+        running = asyncio.ensure_future(executor.run_callable("slow", release.wait))
+        await asyncio.sleep(0.05)
+        with pytest.raises(ExecutorBusyError):
+            await executor.run("double", "double", 1)
+        release.set()
+        await running
+        return await executor.run("double", "double", 1)
+
+    assert asyncio.run(calls()) == 2
+    stats = executor.stats()["endpoints"]
+    assert stats["double"]["rejected"] == 1 and stats["double"]["calls"] == 1
+
+
+def test_full_executor_returns_503(server, client, executor, monkeypatch):
+    monkeypatch.setattr(server, "analysis_executor", executor)
+    executor._slots.acquire()
+    try:
+        response = client.post("/api/ma/scenarios", json={})
+    finally:
+        executor._slots.release()
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+
+
+def test_cache_routes_in_process_mode(server, client, monkeypatch):
+    monkeypatch.setattr(server.analysis_executor, "kind", "process")
+    assert client.post("/api/ma/cache/invalidate").status_code == 409
+    stats = client.get("/api/ma/cache/stats").json()
+    assert stats["analysis"] is None and "worker processes" in stats["detail"]
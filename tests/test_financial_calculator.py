@@ -0,0 +1,152 @@
+"""FinancialCalculator: vectorized paths against scalar references and known values"""
+import numpy as np
+
+from backend.services.financial_calculator import FinancialCalculator
+
+
+BASE = {
+    "base_revenue": 10984.0,
+    "growth_rates": [0.18, 0.16, 0.14, 0.12, 0.10],
+    "ebitda_margin": 0.215,
+    "tax_rate": 0.20,
+    "da_percent_revenue": 0.06,
+    "capex_percent_revenue": 0.045,
+    "nwc_percent_revenue": 0.12,
+    "wacc": 0.095,
+    "terminal_growth_rate": 0.025,
+    "net_debt": -5000.0,
+    "shares_outstanding": 207.0
+}
+PROJECTION_ARGS = (
+    "base_revenue", "growth_rates", "ebitda_margin", "tax_rate",
+    "da_percent_revenue", "capex_percent_revenue", "nwc_percent_revenue"
+)
+VALUATION_FIELDS = ("terminal_value", "pv_terminal_value", "enterprise_value", "equity_value", "value_per_share")
+
+
+def _assumption_sets(n: int) -> dict:
+    """n assumption sets: every input varies per scenario, growth per scenario and year"""
+    rng = np.random.default_rng(7)
+    return {
+        "base_revenue": rng.uniform(5000, 40000, n),
+        "growth_rates": rng.uniform(-0.05, 0.30, (n, 5)),
+        "ebitda_margin": rng.uniform(0.10, 0.35, n),
+        "tax_rate": rng.uniform(0.15, 0.30, n),
+        "da_percent_revenue": rng.uniform(0.02, 0.08, n),
+        "capex_percent_revenue": rng.uniform(0.02, 0.08, n),
+        "nwc_percent_revenue": rng.uniform(0.0, 0.15, n),
+        "wacc": rng.uniform(0.07, 0.13, n),
+        "terminal_growth_rate": rng.uniform(0.0, 0.04, n),
+        "net_debt": rng.uniform(-8000, 8000, n),
+        "shares_outstanding": rng.uniform(100, 1000, n)
+    }
+
+
+def _row(sets: dict, i: int) -> dict:
+    return {name: (list(values[i]) if np.ndim(values) == 2 else float(values[i])) for name, values in sets.items()}
+
+
+def test_project_financials_batch_matches_scalar():
+    sets = _assumption_sets(25)
+    batch = FinancialCalculator.project_financials_batch(*(sets[name] for name in PROJECTION_ARGS))
+    for i in range(25):
+        row = _row(sets, i)
+        scalar = FinancialCalculator.project_financials(*(row[name] for name in PROJECTION_ARGS))
+        for item, values in scalar.items():
+            np.testing.assert_allclose(batch[item][i], values, rtol=1e-12, err_msg=item)
+
+
+def test_dcf_valuation_batch_matches_scalar():
+    sets = _assumption_sets(25)
+    batch = FinancialCalculator.calculate_dcf_valuation_batch(**sets)
+    for i in range(25):
+        scalar = FinancialCalculator.calculate_dcf_valuation(**_row(sets, i))
+        np.testing.assert_allclose(batch["pv_fcf"][i], scalar["pv_fcf"], rtol=1e-12)
+        for field in VALUATION_FIELDS:
+            np.testing.assert_allclose(batch[field][i], scalar[field], rtol=1e-12, err_msg=field)
+
+
+def test_dcf_valuation_batch_broadcasts_scalars_and_shared_growth():
+    wacc = np.array([0.08, 0.095, 0.11])
+    batch = FinancialCalculator.calculate_dcf_valuation_batch(**{**BASE, "wacc": wacc})
+    assert batch["value_per_share"].shape == (3,)
+    assert batch["projections"]["fcf"].shape == (3, 5)
+    for i, rate in enumerate(wacc):
+        scalar = FinancialCalculator.calculate_dcf_valuation(**{**BASE, "wacc": float(rate)})
+        np.testing.assert_allclose(batch["value_per_share"][i], scalar["value_per_share"], rtol=1e-12)
+
+
+def test_dcf_valuation_batch_wacc_below_growth_matches_scalar():
+    # The batch path does not mask WACC <= g: it follows the scalar formula
+    batch = FinancialCalculator.calculate_dcf_valuation_batch(
+        **{**BASE, "wacc": np.array([0.02]), "terminal_growth_rate": np.array([0.03])}
+    )
+    scalar = FinancialCalculator.calculate_dcf_valuation(**{**BASE, "wacc": 0.02, "terminal_growth_rate": 0.03})
+    assert scalar["terminal_value"] < 0
+    np.testing.assert_allclose(batch["enterprise_value"][0], scalar["enterprise_value"], rtol=1e-12)
+
+
+def test_dcf_sensitivity_grid_matches_scalar_and_masks_wacc_at_or_below_growth():
+    fcf = FinancialCalculator.project_financials(*(BASE[name] for name in PROJECTION_ARGS))["fcf"]
+    waccs = [0.02, 0.03, 0.08, 0.095, 0.12]
+    growths = [0.01, 0.025, 0.03, 0.04]
+    grid = FinancialCalculator.calculate_dcf_sensitivity_grid(
+        fcf, waccs, growths, BASE["net_debt"], BASE["shares_outstanding"]
+    )
+    for i, wacc in enumerate(waccs):
+        for j, growth in enumerate(growths):
+            if wacc <= growth:
+                assert not grid["valid"][i, j]
+                assert np.isnan(grid["value_per_share"][i, j])
+                continue
+            scalar = FinancialCalculator.calculate_dcf_valuation(
+                **{**BASE, "wacc": wacc, "terminal_growth_rate": growth}
+            )
+            assert grid["valid"][i, j]
+            np.testing.assert_allclose(grid["value_per_share"][i, j], scalar["value_per_share"], rtol=1e-12)
+
+
+def _investment_streams(n: int, years: int = 6) -> np.ndarray:
+    """n streams: an outlay at time 0, then uneven inflows"""
+    rng = np.random.default_rng(11)
+    return np.column_stack([-rng.uniform(50, 150, n), rng.uniform(0, 60, (n, years))])
+
+
+def test_calculate_npv_matches_loop():
+    rng = np.random.default_rng(3)
+    for rate in (-0.5, 0.0, 0.08, 0.35):
+        flows = list(rng.uniform(-100, 100, 8))
+        loop = sum(cf / (1 + rate) ** i for i, cf in enumerate(flows, 1))
+        assert np.isclose(FinancialCalculator.calculate_npv(flows, rate), loop, rtol=1e-12)
+
+
+def test_irr_batch_zeroes_npv():
+    flows = _investment_streams(200)
+    result = FinancialCalculator.calculate_irr_batch(flows)
+    assert result["converged"].all() and result["failed_rows"].size == 0
+    npv = FinancialCalculator.calculate_npv_batch(flows, result["irr"], first_period=0)
+    np.testing.assert_allclose(npv, 0, atol=1e-8 * np.abs(flows).sum(axis=1).max())
+
+
+def test_irr_batch_known_values():
+    result = FinancialCalculator.calculate_irr_batch([[-100, 110, 0], [-100, 0, 121], [-100, 50, 50]])
+    np.testing.assert_allclose(result["irr"], [0.10, 0.10, 0.0], atol=1e-12)
+
+
+def test_irr_batch_reports_streams_without_a_sign_change():
+    result = FinancialCalculator.calculate_irr_batch([[-100, 60, 60], [100, 10, 10], [-100, -10, 0]])
+    assert result["converged"].tolist() == [True, False, False]
+    assert np.isnan(result["irr"][1:]).all()
+    assert result["failed_rows"].tolist() == [1, 2]
+
+
+def test_xirr_batch_matches_hand_computed_rates():
+    # 730 days apart across a leap year: exactly two Actual/365 years
+    two_years = FinancialCalculator.calculate_xirr_batch([-1000, 1210], ["2024-01-01", "2025-12-31"])
+    assert np.isclose(two_years["irr"][0], 0.10, atol=1e-12)
+
+    flows = [-10000, 2750, 4250, 3250, 2750]
+    dates = ["2008-01-01", "2008-03-01", "2008-10-30", "2009-02-15", "2009-04-01"]
+    result = FinancialCalculator.calculate_xirr_batch(flows, dates)
+    assert np.isclose(result["irr"][0], 0.373362535, atol=1e-9)
+    assert np.isclose(FinancialCalculator.calculate_xnpv_batch(flows, dates, result["irr"])[0], 0, atol=1e-6)
@@ -0,0 +1,46 @@
+"""Vectorized goal seek on functions with known roots"""
+import numpy as np
+
+from backend.services.goal_seek import solve_bracketed
+
+
+def _cube(x, rows):
+    return x ** 3
+
+
+def test_finds_the_root_of_every_row():
+    targets = np.array([8.0, 27.0, -1.0, 0.5])
+    result = solve_bracketed(_cube, targets, lower=-10.0, upper=10.0)
+    assert result["converged"].all()
+    assert result["failed_rows"].size == 0
+    np.testing.assert_allclose(result["x"], np.cbrt(targets), rtol=1e-8)
+    np.testing.assert_allclose(result["value"], targets, rtol=1e-8)
+
+
+def test_rows_only_evaluate_their_own_points():
+    slopes = np.array([1.0, 2.0, 4.0])
+
+    def line(x, rows):
+        assert x.shape == rows.shape
+        return slopes[rows] * x
+
+    result = solve_bracketed(line, np.full(3, 8.0), lower=np.zeros(3), upper=np.full(3, 10.0))
+    np.testing.assert_allclose(result["x"], [8.0, 4.0, 2.0])
+
+
+def test_root_at_a_bracket_end_needs_no_iterations():
+    result = solve_bracketed(_cube, np.array([8.0]), lower=2.0, upper=5.0)
+    assert result["converged"][0] and result["x"][0] == 2.0
+    assert result["iterations"][0] == 0
+
+
+def test_rows_without_a_sign_change_come_back_unsolved():
+    targets = np.array([8.0, 2000.0, np.nan])
+    result = solve_bracketed(_cube, targets, lower=-10.0, upper=10.0)
+    np.testing.assert_allclose(result["x"][0], 2.0)
+    assert np.isnan(result["x"][1:]).all() and np.isnan(result["value"][1:]).all()
+    assert result["converged"].tolist() == [True, False, False]
+    assert result["failed_rows"].tolist() == [1, 2]
+    # The bracket ends show how far short the unsolvable row falls
+    np.testing.assert_allclose([result["at_lower"][1], result["at_upper"][1]], [-1000.0, 1000.0])
+    assert result["iterations"][1] == 0
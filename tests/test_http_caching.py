@@ -0,0 +1,23 @@
+"""ETag revalidation of analysis routes"""
+
+
+def test_etag_revalidation(server, client, monkeypatch):
+    first = client.get("/api/ma/synergies")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"].startswith("public")
+
+    revalidated = client.get("/api/ma/synergies", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == etag
+    assert revalidated.content == b""
+    assert client.get("/api/ma/synergies", headers={"If-None-Match": f'W/{etag}, "other"'}).status_code == 304
+
+    analyzer = server.ma_analyzer.get()
+    target = analyzer.target
+    latest = {**target["income_statements"][-1], "revenue": target["income_statements"][-1]["revenue"] * 1.1}
+    monkeypatch.setattr(analyzer, "target", {**target, "income_statements": target["income_statements"][:-1] + [latest]})
+    changed = client.get("/api/ma/synergies", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()["revenue_synergies"] != first.json()["revenue_synergies"]
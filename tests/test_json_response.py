@@ -0,0 +1,38 @@
+"""JSON rendering: the stdlib fallback gives the same body as orjson"""
+import json
+
+import numpy as np
+import pytest
+
+from backend.services import json_response
+
+
+PAYLOAD = {
+    "value": 1.5,
+    "missing": float("nan"),
+    "scalar": np.float64(np.inf),
+    "grid": np.array([[1.0, np.nan], [-np.inf, 2.0]]),
+    "rows": [{"irr": np.float32(0.25), "npv": -np.inf}, (np.int64(3), None)],
+    "flag": np.bool_(True)
+}
+EXPECTED = {
+    "value": 1.5,
+    "missing": None,
+    "scalar": None,
+    "grid": [[1.0, None], [None, 2.0]],
+    "rows": [{"irr": 0.25, "npv": None}, [3, None]],
+    "flag": True
+}
+
+
+def test_stdlib_fallback_nulls_non_finite_floats(monkeypatch):
+    monkeypatch.setattr(json_response, "orjson", None)
+    assert json.loads(json_response.dumps(PAYLOAD)) == EXPECTED
+
+
+def test_fallback_matches_orjson(monkeypatch):
+    if json_response.orjson is None:
+        pytest.skip("orjson is not installed")
+    body = json_response.dumps(PAYLOAD)
+    monkeypatch.setattr(json_response, "orjson", None)
+    assert json_response.dumps(PAYLOAD) == body
@@ -0,0 +1,67 @@
+"""LBO debt schedules against hand-computed paydowns"""
+import numpy as np
+import pytest
+
+from backend.services.lbo import debt_schedules
+
+
+TRANCHES = [
+    {"name": "term_loan", "share": 0.5, "rate": 0.10, "amortization": 0.10, "sweep": True},
+    {"name": "notes", "share": 0.5, "rate": 0.08, "amortization": 0.0, "sweep": False}
+]
+OPERATIONS = {
+    "ebitda": np.array([300.0, 300.0]),
+    "ebit": np.array([250.0, 250.0]),
+    "capex": np.array([50.0, 50.0]),
+    "nwc_change": np.zeros(2),
+    "tax_rate": 0.25
+}
+
+
+def test_full_sweep_repays_the_term_loan():
+    # Year 1: interest 50 + 40, taxes (250 - 90) * 25% = 40, FCF 300 - 40 - 50 - 90 = 120;
+    # 50 mandatory, the other 70 swept. Year 2: interest 38 + 40, taxes 43, FCF 129; 50 + 79.
+    schedule = debt_schedules(**OPERATIONS, debt=np.array([1000.0]), tranches=TRANCHES)
+    np.testing.assert_allclose(schedule["balances"][0], [[500, 380, 251], [500, 500, 500]])
+    np.testing.assert_allclose(schedule["interest"][0], [90, 78])
+    np.testing.assert_allclose(schedule["taxes"][0], [40, 43])
+    np.testing.assert_allclose(schedule["levered_fcf"][0], [120, 129])
+    np.testing.assert_allclose(schedule["mandatory_repayment"][0], [50, 50])
+    np.testing.assert_allclose(schedule["sweep_repayment"][0], [70, 79])
+    np.testing.assert_allclose(schedule["cash"][0], [0, 0, 0], atol=1e-12)
+
+
+def test_partial_sweep_leaves_cash_on_the_balance_sheet():
+    # Year 1 sweeps half of 70; year 2: interest 41.5 + 40, taxes 42.125,
+    # FCF 126.375, sweep (126.375 - 50) / 2 = 38.1875
+    schedule = debt_schedules(**OPERATIONS, debt=np.array([1000.0]), tranches=TRANCHES, cash_sweep_percent=0.5)
+    np.testing.assert_allclose(schedule["balances"][0, 0], [500, 415, 326.8125])
+    np.testing.assert_allclose(schedule["sweep_repayment"][0], [35, 38.1875])
+    np.testing.assert_allclose(schedule["cash"][0], [0, 35, 73.1875])
+
+
+def test_sweep_waterfall_repays_tranches_in_order():
+    tranches = [
+        {"name": "first", "share": 0.2, "rate": 0.0, "amortization": 0.0, "sweep": True},
+        {"name": "second", "share": 0.8, "rate": 0.0, "amortization": 0.0, "sweep": True}
+    ]
+    flat = {"ebitda": np.full(3, 500.0), "ebit": np.full(3, 500.0), "capex": np.zeros(3),
+            "nwc_change": np.zeros(3), "tax_rate": 0.0}
+    schedule = debt_schedules(**flat, debt=np.array([1000.0, 0.0]), tranches=tranches)
+    np.testing.assert_allclose(schedule["balances"][0], [[200, 0, 0, 0], [800, 500, 0, 0]])
+    # Once the debt is gone (or there was none) the cash flow accumulates
+    np.testing.assert_allclose(schedule["cash"], [[0, 0, 0, 500], [0, 500, 1000, 1500]])
+
+
+def test_mandatory_amortization_stops_at_the_balance():
+    tranches = [{"name": "loan", "share": 1.0, "rate": 0.0, "amortization": 0.6, "sweep": False}]
+    flat = {"ebitda": np.full(2, 1000.0), "ebit": np.full(2, 1000.0), "capex": np.zeros(2),
+            "nwc_change": np.zeros(2), "tax_rate": 0.0}
+    schedule = debt_schedules(**flat, debt=np.array([100.0]), tranches=tranches)
+    np.testing.assert_allclose(schedule["mandatory_repayment"][0], [60, 40])
+    np.testing.assert_allclose(schedule["balances"][0, 0], [100, 40, 0])
+
+
+def test_tranche_shares_must_sum_to_one():
+    with pytest.raises(ValueError):
+        debt_schedules(**OPERATIONS, debt=np.array([1000.0]), tranches=TRANCHES[:1])
@@ -0,0 +1,136 @@
+"""MAAnalyzer deal-structuring analyses against their scalar definitions"""
+import numpy as np
+import pytest
+
+from backend.services.ma_analyzer import SYNERGY_PHASE_IN, MAAnalyzer
+from backend.services.result_cache import ResultCache
+
+
+@pytest.fixture(scope="module")
+def analyzer():
+    return MAAnalyzer(cache=ResultCache(maxsize=0))
+
+
+def test_multi_year_accretion_phases_synergies_in(analyzer):
+    result = analyzer.calculate_multi_year_accretion(stock_percent=[0.0, 0.5, 1.0], financing_rate=[0.04, 0.06])
+    n_years = len(result["years"])
+    phase_in = list(SYNERGY_PHASE_IN) + [SYNERGY_PHASE_IN[-1]] * (n_years - len(SYNERGY_PHASE_IN))
+    assert result["synergy_phase_in"] == phase_in
+
+    run_rate = analyzer.calculate_synergies()["total_synergies"]
+    tax = analyzer.market["tax_rate"]
+    one_time = [analyzer.assumptions["one_time_costs"]] + [0.0] * (n_years - 1)
+    for row, after_tax in zip(result["synergies"], result["synergies_after_tax"]):
+        np.testing.assert_allclose(row, np.multiply(run_rate, phase_in))
+        # One-time costs land in the first year only
+        np.testing.assert_allclose(after_tax, (np.multiply(run_rate, phase_in) - one_time) * (1 - tax))
+
+
+def test_multi_year_accretion_matches_the_single_deal_arithmetic(analyzer):
+    result = analyzer.calculate_multi_year_accretion(
+        stock_percent=[0.2, 0.8], premium=[0.3], financing_rate=[0.05], synergy_phase_in=[0.5]
+    )
+    # A single phase-in share holds for every year
+    assert set(result["synergy_phase_in"]) == {0.5}
+    paths = analyzer._pro_forma_paths([0.5])
+    run_rate = analyzer.calculate_synergies()["total_synergies"]
+    tax = analyzer.market["tax_rate"]
+    shares, price = analyzer.acquirer["shares_outstanding"], analyzer.acquirer["current_share_price"]
+    for s, (stock, deal, rate) in enumerate(zip(*result["scenarios"].values())):
+        for t in range(len(result["years"])):
+            earnings = (
+                paths["acquirer_net_income"][t] + paths["target_net_income"][t] +
+                (run_rate * 0.5 - paths["one_time_costs"][t]) * (1 - tax) -
+                deal * (1 - stock) * rate * (1 - tax)
+            )
+            eps = earnings / (shares + deal * stock / price)
+            standalone = paths["acquirer_net_income"][t] / shares
+            assert result["pro_forma_eps"][s][t] == pytest.approx(eps)
+            assert result["accretion_dilution_percent"][s][t] == pytest.approx((eps / standalone - 1) * 100)
+        accretive = [year for year, a in zip(result["years"], result["accretion_dilution_percent"][s]) if a > 0]
+        assert result["first_accretive_year"][s] == (accretive[0] if accretive else None)
+
+
+@pytest.fixture(scope="module")
+def mix(analyzer):
+    return analyzer.optimize_consideration_mix(
+        stock_percent=np.linspace(0, 1, 11).tolist(), financing_rate=[0.0, 0.01, 0.08],
+        premium=[0.2, 0.4], max_leverage=4.0
+    )
+
+
+def test_mix_frontier_points_are_not_dominated(mix):
+    leverage = np.array(mix["pro_forma_net_leverage"])
+    accretion = np.array(mix["accretion_dilution_percent"])
+    for p in range(len(mix["premium"])):
+        for r in range(len(mix["financing_rate"])):
+            for k, on_frontier in enumerate(mix["on_frontier"][p][r]):
+                dominated = any(
+                    leverage[p, m] < leverage[p, k] and accretion[p, r, m] >= accretion[p, r, k]
+                    for m in range(len(mix["stock_percent"]))
+                )
+                assert on_frontier == (not dominated)
+
+
+def test_mix_cash_and_stock_shares_fund_the_whole_deal(mix):
+    leverage = np.array(mix["pro_forma_net_leverage"])
+    stock = np.array(mix["stock_percent"])
+    all_cash, all_stock = leverage[:, [0]], leverage[:, [-1]]
+    # Leverage rises with the borrowed (cash) share, from all-stock to all-cash
+    cash = (leverage - all_stock) / (all_cash - all_stock)
+    np.testing.assert_allclose(cash + stock, 1.0)
+
+
+def test_mix_optimum_is_the_most_accretive_mix_within_the_leverage_cap(mix):
+    leverage = np.array(mix["pro_forma_net_leverage"])
+    accretion = np.array(mix["accretion_dilution_percent"])
+    for p in range(len(mix["premium"])):
+        allowed = leverage[p] <= mix["max_leverage"]
+        for r in range(len(mix["financing_rate"])):
+            best = np.flatnonzero(allowed)[accretion[p, r, allowed].argmax()]
+            assert mix["optimal"]["stock_percent"][p][r] == mix["stock_percent"][best]
+            assert 0 <= mix["optimal"]["stock_percent"][p][r] <= 1
+            assert mix["optimal"]["pro_forma_net_leverage"][p][r] <= mix["max_leverage"]
+
+
+@pytest.fixture(scope="module")
+def tornado(analyzer):
+    return analyzer.calculate_tornado(bump=0.2, bumps={"dcf_weight": 0.5})
+
+
+@pytest.mark.parametrize("weight", ["dcf_weight", "comps_weight", "precedents_weight"])
+@pytest.mark.parametrize("side", ["low", "high"])
+def test_tornado_renormalizes_the_other_weights(analyzer, tornado, weight, side):
+    bumped = tornado["assumptions"][weight][side]
+    others = [name for name in ("dcf_weight", "comps_weight", "precedents_weight") if name != weight]
+    rest = sum(analyzer.assumptions[name] for name in others)
+    # The other two weights share what is left in their base-case proportion
+    weights = {weight: bumped, **{name: analyzer.assumptions[name] * (1 - bumped) / rest for name in others}}
+    assert sum(weights.values()) == pytest.approx(1.0)
+
+    # The bumped case is the base case of an analyzer at those weights
+    reweighted = MAAnalyzer(assumptions=weights, cache=ResultCache(maxsize=0)).calculate_tornado()["base"]
+    impact = next(i for i in tornado["price_per_share"] if i["assumption"] == weight)
+    assert impact[side] == pytest.approx(reweighted["price_per_share"])
+
+
+def test_tornado_bumps_each_assumption_down_then_up(analyzer, tornado):
+    assert tornado["bumps"]["dcf_weight"] == 0.5 and tornado["bumps"]["ebitda_margin"] == 0.2
+    for name, values in tornado["assumptions"].items():
+        size = tornado["bumps"][name]
+        base = np.asarray(values["base"])
+        np.testing.assert_allclose(base, analyzer.assumptions[name])
+        np.testing.assert_allclose(values["low"], base * (1 - size))
+        np.testing.assert_allclose(values["high"], base * (1 + size))
+        assert np.all(np.asarray(values["low"]) < base) and np.all(base < np.asarray(values["high"]))
+
+
+@pytest.mark.parametrize("output", ["price_per_share", "offer_accretion_dilution_percent"])
+def test_tornado_ranks_by_swing(tornado, output):
+    base = tornado["base"][output]
+    impacts = tornado[output]
+    assert [i["swing"] for i in impacts] == sorted((i["swing"] for i in impacts), reverse=True)
+    for impact in impacts:
+        assert impact["swing"] == pytest.approx(abs(impact["high"] - impact["low"]))
+        assert impact["change_low"] == pytest.approx(impact["low"] - base)
+        assert impact["change_high"] == pytest.approx(impact["high"] - base)
@@ -0,0 +1,29 @@
+"""Request metrics: route-template labels and the Prometheus scrape"""
+import re
+
+
+def test_routes_are_labelled_by_template(client):
+    client.get("/api/ma/scenarios/missing")
+    client.delete("/api/ma/scenarios/missing")
+    client.put("/api/ma/scenarios/missing")
+    client.get("/api/no-such-route")
+    scrape = client.get("/api/metrics").text
+
+    # In-flight requests are counted per method: the scrape itself is one
+    in_flight = dict(re.findall(r'^http_requests_in_flight{method="(\w+)"} (\S+)$', scrape, re.M))
+    assert in_flight.pop("GET") == "1"
+    assert {"DELETE", "PUT"} <= set(in_flight) and set(in_flight.values()) == {"0"}
+
+    requests = re.findall(r'^http_requests_total{method="(\w+)",route="([^"]+)",status="(\d+)"}', scrape, re.M)
+    assert ("GET", "/api/ma/scenarios/{scenario_id}", "404") in requests
+    assert ("DELETE", "/api/ma/scenarios/{scenario_id}", "404") in requests
+    assert ("PUT", "/api/ma/scenarios/{scenario_id}", "405") in requests
+    assert ("GET", "unmatched", "404") in requests
+
+
+def test_scrape_does_not_build_the_analyzer(server, client, monkeypatch):
+    monkeypatch.setattr(server.ma_analyzer, "_value", None)
+    scrape = client.get("/api/metrics").text
+    assert not server.ma_analyzer.loaded
+    assert "ma_result_cache_hits_total" not in scrape
+    assert "ma_executor_in_flight" in scrape
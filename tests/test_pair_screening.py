@@ -0,0 +1,102 @@
+"""Pair screening: blocked top-K against a brute-force pass over every pair"""
+import numpy as np
+import pytest
+
+from backend.data.comps_universe import CompsUniverse
+from backend.services.pair_screening import screen_pairs
+
+
+TERMS = {
+    "premium": 0.3,
+    "stock_percent": 0.4,
+    "cross_sell_rate": 0.1,
+    "cost_synergy_percent": 0.15,
+    "one_time_cost_percent": 0.05,
+    "tax_rate": 0.21
+}
+
+
+@pytest.fixture(scope="module")
+def universe() -> CompsUniverse:
+    rng = np.random.default_rng(2)
+    n = 40
+    revenue = rng.lognormal(8, 1, n)
+    market_cap = revenue * rng.uniform(1, 10, n)
+    ebitda = revenue * rng.uniform(0.05, 0.4, n)
+    # Every other company reports a share count
+    shares = np.where(np.arange(n) % 2 == 0, market_cap / rng.uniform(20, 300, n), np.nan)
+    return CompsUniverse(
+        [f"T{i}" for i in range(n)], [f"Company {i}" for i in range(n)],
+        {
+            "market_cap": market_cap,
+            "enterprise_value": market_cap,
+            "revenue": revenue,
+            "ebitda": ebitda,
+            "net_income": ebitda * rng.uniform(-0.2, 0.7, n),
+            "revenue_growth": np.zeros(n),
+            "shares_outstanding": shares
+        }
+    )
+
+
+def _brute_force(universe: CompsUniverse, require_larger_acquirer: bool = True):
+    """Every valid pair's metrics, one pair at a time with plain floats"""
+    cols = {name: values.tolist() for name, values in universe.columns.items()}
+    pairs = {}
+    for i in range(len(universe)):
+        for j in range(len(universe)):
+            offer = cols["market_cap"][j] * (1 + TERMS["premium"])
+            if i == j or cols["net_income"][i] <= 0:
+                continue
+            if require_larger_acquirer and cols["market_cap"][i] <= offer:
+                continue
+            has_shares = not np.isnan(cols["shares_outstanding"][i])
+            shares = cols["shares_outstanding"][i] if has_shares else cols["market_cap"][i]
+            new_shares = offer * TERMS["stock_percent"] / (cols["market_cap"][i] / shares)
+            synergies = (
+                cols["revenue"][j] * TERMS["cross_sell_rate"] +
+                max(cols["revenue"][j] - cols["ebitda"][j], 0) * TERMS["cost_synergy_percent"] -
+                cols["revenue"][j] * TERMS["one_time_cost_percent"]
+            ) * (1 - TERMS["tax_rate"])
+            combined = cols["net_income"][i] + cols["net_income"][j] + synergies
+            eps = combined / (shares + new_shares)
+            pairs[(f"T{i}", f"T{j}")] = {
+                "accretion_dilution_percent": (eps / (cols["net_income"][i] / shares) - 1) * 100,
+                "combined_net_income": combined,
+                "implied_offer_value": offer,
+                "target_ownership_percent": new_shares / (shares + new_shares) * 100,
+                "combined_eps": eps if has_shares else None
+            }
+    return pairs
+
+
+@pytest.mark.parametrize("metric,ascending", [
+    ("accretion_dilution_percent", False),
+    ("accretion_dilution_percent", True),
+    ("combined_net_income", False),
+    ("target_ownership_percent", True)
+])
+def test_top_k_matches_brute_force(universe, metric, ascending):
+    expected = _brute_force(universe)
+    ranked = sorted(expected, key=lambda pair: expected[pair][metric], reverse=not ascending)[:15]
+    screen = screen_pairs(universe, **TERMS, metric=metric, ascending=ascending, top_k=15, block_rows=7)
+
+    assert screen["pairs_evaluated"] == len(universe) ** 2
+    assert screen["valid_pairs"] == len(expected)
+    assert [(p["acquirer"], p["target"]) for p in screen["pairs"]] == ranked
+    for record in screen["pairs"]:
+        want = expected[(record["acquirer"], record["target"])]
+        for field in ("accretion_dilution_percent", "combined_net_income", "implied_offer_value",
+                      "target_ownership_percent"):
+            assert record[field] == pytest.approx(want[field], rel=1e-10)
+        if want["combined_eps"] is None:
+            assert record["combined_eps"] is None
+        else:
+            assert record["combined_eps"] == pytest.approx(want["combined_eps"], rel=1e-10)
+
+
+def test_top_k_beyond_valid_pairs_returns_every_valid_pair(universe):
+    expected = _brute_force(universe, require_larger_acquirer=False)
+    screen = screen_pairs(universe, **TERMS, top_k=10000, require_larger_acquirer=False, block_rows=9)
+    assert len(screen["pairs"]) == len(expected)
+    assert [p["rank"] for p in screen["pairs"]] == list(range(1, len(expected) + 1))
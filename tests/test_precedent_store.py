@@ -0,0 +1,63 @@
+"""PrecedentStore.query against a plain filter over the same records"""
+import numpy as np
+import pytest
+
+from backend.data.precedent_store import PrecedentStore, month_ordinal
+
+
+SECTORS = ("Enterprise Software", "Fintech", "Healthcare IT", "Semiconductors")
+
+
+@pytest.fixture(scope="module")
+def records():
+    rng = np.random.default_rng(5)
+    return [
+        {
+            "date": f"{rng.integers(2000, 2025)}-{rng.integers(1, 13):02d}",
+            "acquirer": f"Acquirer {i % 40}",
+            "target": f"Target {i}",
+            "deal_value": float(np.round(rng.lognormal(7, 1.5), 1)),
+            "target_revenue": 100.0,
+            "target_ebitda": 20.0,
+            "ev_revenue": 5.0,
+            "ev_ebitda": 25.0,
+            "premium": 0.3,
+            "sector": SECTORS[rng.integers(0, len(SECTORS))]
+        }
+        for i in range(800)
+    ]
+
+
+def _brute_force(records, start_date=None, end_date=None, min_deal_value=None, max_deal_value=None,
+                 sector=None):
+    def keep(r):
+        month = month_ordinal(r["date"])
+        return (
+            (start_date is None or month >= month_ordinal(start_date)) and
+            (end_date is None or month <= month_ordinal(end_date, end=True)) and
+            (min_deal_value is None or r["deal_value"] >= min_deal_value) and
+            (max_deal_value is None or r["deal_value"] <= max_deal_value) and
+            (sector is None or sector.lower() in r["sector"].lower())
+        )
+    return {r["target"] for r in records if keep(r)}
+
+
+@pytest.mark.parametrize("filters", [
+    {},
+    {"start_date": "2010", "end_date": "2012-06"},
+    # A narrow value band walks the deal-value index, a wide one the date range
+    {"min_deal_value": 1000, "max_deal_value": 1100},
+    {"start_date": "2020-03", "min_deal_value": 10},
+    {"end_date": "2005", "max_deal_value": 500},
+    {"start_date": "2001", "end_date": "2023", "min_deal_value": 2000, "max_deal_value": 2500, "sector": "tech"},
+    {"sector": "SOFTWARE"},
+    {"start_date": "2030"}
+])
+def test_query_matches_brute_force(records, filters):
+    store = PrecedentStore.from_records(records)
+    rows = store.query(**filters)
+    found = store.records(rows)
+    assert {r["target"] for r in found} == _brute_force(records, **filters)
+    assert len(found) == len(rows)
+    months = [month_ordinal(r["date"]) for r in found]
+    assert months == sorted(months, reverse=True)
@@ -0,0 +1,60 @@
+"""ResultCache eviction, expiry and invalidation; input fingerprints"""
+import copy
+
+import numpy as np
+
+from backend.services import result_cache
+from backend.services.ma_analyzer import MAAnalyzer
+from backend.services.result_cache import ResultCache, fingerprint
+
+
+def test_lru_evicts_least_recently_used():
+    cache = ResultCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == (True, 1)
+    cache.set("c", 3)
+    assert cache.get("b") == (False, None)
+    assert cache.get("a") == (True, 1)
+    assert cache.get("c") == (True, 3)
+    assert cache.stats()["evictions"] == 1
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(result_cache.time, "monotonic", lambda: now[0])
+    cache = ResultCache(ttl=10.0)
+    cache.set("a", 1)
+    now[0] += 10.0
+    assert cache.get("a") == (True, 1)
+    now[0] += 0.5
+    assert cache.get("a") == (False, None)
+    assert cache.stats()["expirations"] == 1
+    assert cache.stats()["size"] == 0
+
+
+def test_invalidate_drops_only_dependent_entries():
+    cache = ResultCache()
+    cache.set("dcf", 1, ["target", "assumptions.growth_rates"])
+    cache.set("synergies", 2, ["acquirer", "assumptions.cross_sell_rate"])
+    cache.set("comps", 3, ["comparable_companies"])
+    assert cache.invalidate("target") == 1
+    assert cache.invalidate("assumptions") == 1
+    assert cache.get("comps") == (True, 3)
+    assert cache.get("dcf")[0] is False and cache.get("synergies")[0] is False
+    assert cache.invalidate() == 1
+
+
+def test_fingerprint_is_stable_across_key_order_and_numpy_types():
+    assert fingerprint({"a": 1, "b": [1.5, 2.0]}) == fingerprint({"b": [1.5, 2.0], "a": 1})
+    assert fingerprint({"b": np.array([1.5, 2.0]), "a": np.int64(1)}) == fingerprint({"a": 1, "b": [1.5, 2.0]})
+    assert fingerprint({"a": 1}) != fingerprint({"a": 2})
+
+
+def test_source_fingerprint_follows_content_not_identity():
+    analyzer = MAAnalyzer(cache=ResultCache())
+    before = analyzer.source_fingerprint("target")
+    analyzer.target = copy.deepcopy(analyzer.target)
+    assert analyzer.source_fingerprint("target") == before
+    analyzer.target = {**analyzer.target, "shares_outstanding": analyzer.target["shares_outstanding"] + 1}
+    assert analyzer.source_fingerprint("target") != before
@@ -0,0 +1,23 @@
+"""Analysis result store: the write-behind buffer stays bounded"""
+from backend.services.result_store import AnalysisResultStore
+
+
+def test_pending_buffer_drops_oldest_payloads_past_the_cap():
+    store = AnalysisResultStore(collection=None, code_version=lambda: "test", max_pending_bytes=10)
+    for key in "abcd":
+        store.put(key, b"xxxx")
+    assert list(store._pending) == ["c", "d"]
+    assert store.stats()["pending_bytes"] == 8
+    assert store.stats()["dropped"] == 2
+
+
+def test_requeued_key_counts_once_and_moves_to_the_back():
+    store = AnalysisResultStore(collection=None, code_version=lambda: "test", max_pending_bytes=10)
+    store.put("a", b"xxxx")
+    store.put("b", b"xxxx")
+    store.put("a", b"yyyy")
+    store.put("c", b"zz")
+    assert list(store._pending) == ["b", "a", "c"]
+    store.put("d", b"x")
+    assert list(store._pending) == ["a", "c", "d"]
+    assert store._pending["a"] == b"yyyy"
@@ -0,0 +1,28 @@
+"""Server import cost: the NumPy-backed analysis stack loads on first use"""
+from pathlib import Path
+import os
+import subprocess
+import sys
+
+
+def test_importing_the_server_does_not_import_numpy():
+    # A fresh interpreter: this one has long since imported NumPy
+    code = "import sys, backend.server; assert 'numpy' not in sys.modules, 'numpy imported'"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parent.parent,
+        env={**os.environ, "MONGO_URL": "mongodb://localhost:27017", "DB_NAME": "test"},
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_scenario_routes_before_the_store_is_built(server, client, monkeypatch):
+    monkeypatch.setattr(server.scenario_store, "_value", None)
+    assert client.get("/api/ma/scenarios/missing").status_code == 404
+    assert client.delete("/api/ma/scenarios/missing").status_code == 404
+    assert not server.scenario_store.loaded
+
+    created = client.post("/api/ma/scenarios", json={}).json()
+    assert client.get(f"/api/ma/scenarios/{created['scenario_id']}").status_code == 200
@@ -0,0 +1,36 @@
+"""StatementStore ratios and the analyzer's shared statement store"""
+import copy
+
+import numpy as np
+
+from backend.data.statement_store import StatementStore
+from backend.services.ma_analyzer import MAAnalyzer
+from backend.services.result_cache import ResultCache
+
+
+def _company(ticker, equity):
+    return {
+        "ticker": ticker,
+        "balance_sheets": [
+            {"year": 2023, "long_term_debt": 10.0, "short_term_debt": 2.0, "shareholders_equity": equity[0]},
+            {"year": 2024, "long_term_debt": 12.0, "short_term_debt": 3.0, "shareholders_equity": equity[1]}
+        ]
+    }
+
+
+def test_ratio_sums_numerator_items_and_masks_zero_denominators():
+    store = StatementStore.from_companies([_company("A", [24.0, 0.0]), _company("B", [0.0, 30.0])])
+    leverage = store.ratio(("long_term_debt", "short_term_debt"), "shareholders_equity")
+    np.testing.assert_array_equal(leverage, [[0.5, np.nan], [np.nan, 0.5]])
+
+
+def test_analyzer_builds_statements_once_per_company_data():
+    analyzer = MAAnalyzer(cache=ResultCache(maxsize=0))
+    store = analyzer.statements
+    assert analyzer.statements is store
+
+    target = copy.deepcopy(analyzer.target)
+    target["balance_sheets"][-1]["shareholders_equity"] = 0
+    analyzer.target = target
+    assert analyzer.statements is not store
+    assert analyzer.get_historical_metrics()["companies"]["target"]["debt_to_equity"][-1] is None
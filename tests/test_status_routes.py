@@ -0,0 +1,61 @@
+"""Status checks: keyset pagination by (timestamp, id) and the NDJSON export"""
+from datetime import datetime, timedelta, timezone
+import json
+
+import pytest
+
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def checks(server):
+    # Pairs of checks share a timestamp, so pages must break ties on id
+    docs = [
+        {"id": f"check-{i:02d}", "client_name": f"client-{i}", "timestamp": START + timedelta(seconds=i // 2)}
+        for i in range(25)
+    ]
+    server.db.status_checks.docs = list(reversed(docs))
+    return docs
+
+
+def test_pages_follow_the_cursor_to_the_last_page(client, checks):
+    pages, cursor = [], None
+    while True:
+        params = {"limit": 10, **({"cursor": cursor} if cursor else {})}
+        response = client.get("/api/status", params=params)
+        assert response.status_code == 200
+        pages.append([check["id"] for check in response.json()])
+        cursor = response.headers.get("x-next-cursor")
+        if cursor is None:
+            break
+    assert [len(page) for page in pages] == [10, 10, 5]
+    assert sum(pages, []) == [check["id"] for check in checks]
+
+
+def test_exact_page_boundary_has_no_dangling_cursor(client, checks):
+    first = client.get("/api/status", params={"limit": 20})
+    last = client.get("/api/status", params={"limit": 5, "cursor": first.headers["x-next-cursor"]})
+    assert [check["id"] for check in last.json()] == [check["id"] for check in checks[20:]]
+    assert "x-next-cursor" not in last.headers
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "bm90IGpzb24=", "WyJub3QgYSBkYXRlIiwgIngiXQ==", "WzFd"])
+def test_malformed_cursor_is_rejected(client, checks, cursor):
+    response = client.get("/api/status", params={"cursor": cursor})
+    assert response.status_code == 400
+
+
+def test_legacy_string_timestamp_encodes_the_same_cursor(server):
+    check = {"id": "check-01", "timestamp": START}
+    legacy = {"id": "check-01", "timestamp": START.isoformat()}
+    assert server._encode_status_cursor(legacy) == server._encode_status_cursor(check)
+    assert server._status_filter(server._encode_status_cursor(legacy))["$or"][0]["timestamp"]["$gt"] == START
+
+
+def test_ndjson_export_streams_every_check_after_the_cursor(client, checks):
+    cursor = client.get("/api/status", params={"limit": 10}).headers["x-next-cursor"]
+    response = client.get("/api/status", params={"format": "ndjson", "cursor": cursor})
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["id"] for line in lines] == [check["id"] for check in checks[10:]]